@@ -0,0 +1,126 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Measures per-event overhead of OpenLineageClient.emit, with a transport that discards events, for a client
+adding environment variables and user tags facets. Compares facets prepared once when the client is created
+against the previous implementation, which collected environment variables, logged missing ones, and rebuilt
+tag facets for every event.
+
+Usage: python benchmarks/emit.py [number of iterations]
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import time
+from typing import Any, get_args
+
+from openlineage.client import OpenLineageClient, event_v2
+from openlineage.client.client import Event
+from openlineage.client.generated.environment_variables_run import (
+    EnvironmentVariable,
+    EnvironmentVariablesRunFacet,
+)
+from openlineage.client.generated.tags_job import TagsJobFacet
+from openlineage.client.generated.tags_run import TagsRunFacet
+from openlineage.client.transport.transport import Config, Transport
+from openlineage.client.uuid import generate_new_uuid
+
+CONFIG = {
+    "facets": {"environment_variables": ["BENCHMARK_ENV_1", "BENCHMARK_ENV_2", "BENCHMARK_MISSING"]},
+    "tags": {"job": {"team": "lineage", "tier": "1"}, "run": {"environment": "production"}},
+}
+
+
+class DiscardingTransport(Transport):
+    kind = "discarding"
+    config_class = Config
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+    def emit(self, event: Any) -> None:
+        pass
+
+
+class PreviousClient(OpenLineageClient):
+    """Enrichment of events as implemented before facets were prepared once."""
+
+    def _validate_event(self, event: Event) -> None:
+        if type(event) not in get_args(Event):
+            msg = "`emit` only accepts RunEvent, DatasetEvent, JobEvent classes"
+            raise ValueError(msg)
+
+    def add_environment_facets(self, event: Event) -> Event:
+        env_vars = {k: v for k, v in os.environ.items() if k in self.config.facets.environment_variables}
+        missing_vars = set(self.config.facets.environment_variables) - set(env_vars)
+        if missing_vars:
+            logging.getLogger("openlineage.client.client").warning(
+                "The following environment variables are missing: %s when adding to OpenLineage event",
+                missing_vars,
+            )
+        if isinstance(event, event_v2.RunEvent) and env_vars:
+            event.run.facets = event.run.facets or {}
+            event.run.facets["environmentVariables"] = EnvironmentVariablesRunFacet(
+                environmentVariables=[
+                    EnvironmentVariable(name=name, value=value) for name, value in env_vars.items()
+                ]
+            )
+        return event
+
+    def update_event_tags_facets(self, event: Event) -> Event:
+        run_event_types = (event_v2.RunEvent,)
+        run_and_job_event_types = (event_v2.RunEvent, event_v2.JobEvent)
+        tags_job = self.config.tags.job
+        if isinstance(event, run_and_job_event_types) and tags_job:
+            event.job.facets = {} if not event.job.facets else event.job.facets
+            tags_facet = event.job.facets.get("tags", TagsJobFacet())
+            event.job.facets["tags"] = self._update_tag_facet(tags_facet, tags_job)  # type: ignore[arg-type]
+        tags_run = self.config.tags.run
+        if isinstance(event, run_event_types) and tags_run:
+            event.run.facets = {} if not event.run.facets else event.run.facets
+            tags_facet = event.run.facets.get("tags", TagsRunFacet())
+            event.run.facets["tags"] = self._update_tag_facet(tags_facet, tags_run)  # type: ignore[arg-type]
+        return event
+
+
+def make_event() -> event_v2.RunEvent:
+    return event_v2.RunEvent(
+        eventType=event_v2.RunState.RUNNING,
+        eventTime="2024-01-01T00:00:00Z",
+        run=event_v2.Run(runId=str(generate_new_uuid())),
+        job=event_v2.Job(namespace="benchmark", name="job"),
+    )
+
+
+def measure(name: str, client: OpenLineageClient, count: int) -> float:
+    events = [make_event() for _ in range(count)]
+    start = time.perf_counter()
+    for event in events:
+        client.emit(event)
+    per_call = (time.perf_counter() - start) / count
+    print(f"{name:<36} {per_call * 1e6:10.1f} us/event")
+    return per_call
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    os.environ.update({"BENCHMARK_ENV_1": "value1", "BENCHMARK_ENV_2": "value2"})
+    # missing variable warnings are logged for every event by the previous implementation
+    logging.disable(logging.WARNING)
+
+    before = measure(
+        "emit (previous)", PreviousClient(transport=DiscardingTransport(Config()), config=CONFIG), count
+    )
+    after = measure(
+        "emit (prepared facets)",
+        OpenLineageClient(transport=DiscardingTransport(Config()), config=CONFIG),
+        count,
+    )
+    print(f"{'speedup':<36} {before / after:10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Compares per-event latency of HttpTransport using its pooled session against
+creating a new session for every event, using a local stub HTTP server.
+
+Usage: python benchmarks/http_session.py [number of events]
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin
+
+from openlineage.client.event_v2 import Job, Run, RunEvent, RunState
+from openlineage.client.serde import Serde
+from openlineage.client.transport.http import HttpConfig, HttpTransport
+from openlineage.client.uuid import generate_new_uuid
+from requests import Session
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def per_event_session_emit(transport: HttpTransport, event: RunEvent) -> None:
+    """What HttpTransport did before it owned a session: new session, adapter and connection per event."""
+    body, headers = transport._prepare_request(Serde.to_json(event))  # noqa: SLF001
+    with Session() as session:
+        transport._prepare_session(session)  # noqa: SLF001
+        response = session.post(urljoin(transport.url, transport.endpoint), data=body, headers=headers)
+        response.raise_for_status()
+
+
+def measure(name: str, emit: object, event: RunEvent, count: int) -> None:
+    start = time.perf_counter()
+    for _ in range(count):
+        emit(event)  # type: ignore[operator]
+    elapsed = time.perf_counter() - start
+    print(f"{name:<20} {elapsed / count * 1e6:10.1f} us/event")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    transport = HttpTransport(HttpConfig(url=f"http://127.0.0.1:{server.server_address[1]}"))
+    event = RunEvent(
+        eventType=RunState.START,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId=str(generate_new_uuid())),
+        job=Job(namespace="benchmark", name="job"),
+    )
+
+    measure("session per event", lambda e: per_event_session_emit(transport, e), event, count)
+    measure("pooled session", transport.emit, event, count)
+
+    transport.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
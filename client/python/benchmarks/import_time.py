@@ -0,0 +1,62 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Measures import time of openlineage.client modules with `python -X importtime`, each time in a fresh
+interpreter, and prints median cumulative import time together with the slowest modules imported by it.
+The budgets enforced by tests/test_import_time.py are deliberately much higher than these numbers.
+
+Usage: python benchmarks/import_time.py [number of runs] [number of slowest modules shown]
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+MODULES = (
+    "openlineage.client",
+    "openlineage.client.event_v2",
+    "openlineage.client.client",
+    "openlineage.client.transport.http",
+    "openlineage.client.async_client",
+)
+
+
+def import_times(statement: str) -> dict[str, int]:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    slowest = int(sys.argv[2]) if len(sys.argv) > 2 else 5  # noqa: PLR2004
+
+    # modules imported at interpreter startup, e.g. by site
+    startup = set(import_times("pass"))
+    for module in MODULES:
+        samples = [import_times(f"import {module}") for _ in range(runs)]
+        total = statistics.median(times[module] for times in samples)
+        print(f"{module:<40} {total / 1000:10.1f} ms")
+        medians = {
+            name: statistics.median(times.get(name, 0) for times in samples)
+            for name in samples[0]
+            if name != module and name not in startup
+        }
+        for name, value in sorted(medians.items(), key=lambda item: -item[1])[:slowest]:
+            print(f"    {name:<36} {value / 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
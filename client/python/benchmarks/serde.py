@@ -0,0 +1,113 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Compares Serde.to_dict and Serde.to_json using compiled per-class serializers against
+the previous attr.asdict + remove_nulls_and_enums path, on an event with large schema
+and column lineage facets. Also checks that both paths produce identical JSON, and
+measures Serde.to_json_bytes with each installed JSON backend.
+
+Usage: python benchmarks/serde.py [number of columns] [number of iterations]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from typing import Any, Callable
+
+import attr
+from openlineage.client.event_v2 import InputDataset, Job, OutputDataset, Run, RunEvent, RunState
+from openlineage.client.facet_v2 import column_lineage_dataset, schema_dataset
+from openlineage.client.serde import JsonBackend, Serde
+from openlineage.client.uuid import generate_new_uuid
+
+
+def asdict_to_dict(obj: Any) -> dict[Any, Any]:
+    return Serde.remove_nulls_and_enums(attr.asdict(obj))  # type: ignore[no-any-return]
+
+
+def asdict_to_json(obj: Any) -> str:
+    return json.dumps(
+        asdict_to_dict(obj),
+        sort_keys=True,
+        default=lambda o: f"<<non-serializable: {type(o).__qualname__}>>",
+    )
+
+
+def make_event(columns: int) -> RunEvent:
+    schema = schema_dataset.SchemaDatasetFacet(
+        fields=[
+            schema_dataset.SchemaDatasetFacetFields(name=f"col_{i}", type="varchar", description="column")
+            for i in range(columns)
+        ]
+    )
+    column_lineage = column_lineage_dataset.ColumnLineageDatasetFacet(
+        fields={
+            f"col_{i}": column_lineage_dataset.Fields(
+                inputFields=[
+                    column_lineage_dataset.InputField(
+                        namespace="benchmark",
+                        name="input",
+                        field=f"col_{i}",
+                        transformations=[
+                            column_lineage_dataset.Transformation(type="DIRECT", subtype="IDENTITY")
+                        ],
+                    )
+                ]
+            )
+            for i in range(columns)
+        }
+    )
+    return RunEvent(
+        eventType=RunState.COMPLETE,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId=str(generate_new_uuid())),
+        job=Job(namespace="benchmark", name="job"),
+        inputs=[InputDataset(namespace="benchmark", name="input", facets={"schema": schema})],
+        outputs=[
+            OutputDataset(
+                namespace="benchmark",
+                name="output",
+                facets={"schema": schema, "columnLineage": column_lineage},
+            )
+        ],
+    )
+
+
+def measure(name: str, fn: Callable[[Any], Any], event: RunEvent, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn(event)
+    per_call = (time.perf_counter() - start) / count
+    print(f"{name:<36} {per_call * 1e6:10.1f} us/event")
+    return per_call
+
+
+def main() -> None:
+    columns = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 200  # noqa: PLR2004
+    event = make_event(columns)
+
+    if Serde.to_json(event) != asdict_to_json(event):
+        msg = "compiled serializers produce different output"
+        raise AssertionError(msg)
+
+    print(f"event with {columns} columns, {len(Serde.to_json(event))} bytes of JSON")
+    before = measure("to_dict (asdict)", asdict_to_dict, event, count)
+    after = measure("to_dict (compiled)", Serde.to_dict, event, count)
+    print(f"{'speedup':<36} {before / after:10.1f} x")
+    before = measure("to_json (asdict)", asdict_to_json, event, count)
+    after = measure("to_json (compiled)", Serde.to_json, event, count)
+    print(f"{'speedup':<36} {before / after:10.1f} x")
+
+    for backend in JsonBackend:
+        try:
+            Serde.set_json_backend(backend, sort_keys=False)
+        except ModuleNotFoundError:
+            continue
+        measure(f"to_json_bytes ({backend}, unsorted)", Serde.to_json_bytes, event, count)
+
+
+if __name__ == "__main__":
+    main()
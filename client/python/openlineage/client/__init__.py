@@ -2,19 +2,41 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import importlib
 import warnings
+from typing import TYPE_CHECKING, Any
 
-from openlineage.client.client import OpenLineageClient, OpenLineageClientOptions
+if TYPE_CHECKING:
+    from openlineage.client.async_client import AsyncOpenLineageClient
+    from openlineage.client.client import OpenLineageClient, OpenLineageClientOptions
 
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore", DeprecationWarning)
-from openlineage.client.facet import set_producer as set_producer_v1
-from openlineage.client.facet_v2 import set_producer as set_producer_v2
+# Importing any openlineage.client submodule runs this file first, so clients, and transports they
+# depend on, are imported only when accessed.
+_LAZY_ATTRIBUTES = {
+    "AsyncOpenLineageClient": "openlineage.client.async_client",
+    "OpenLineageClient": "openlineage.client.client",
+    "OpenLineageClientOptions": "openlineage.client.client",
+}
 
 
 def set_producer(producer: str) -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        from openlineage.client.facet import set_producer as set_producer_v1
+    from openlineage.client.facet_v2 import set_producer as set_producer_v2
+
     set_producer_v1(producer)
     set_producer_v2(producer)
 
 
-__all__ = ["OpenLineageClient", "OpenLineageClientOptions", "set_producer"]
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = ["AsyncOpenLineageClient", "OpenLineageClient", "OpenLineageClientOptions", "set_producer"]
@@ -0,0 +1,116 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Any
+
+from openlineage.client.client import _BaseOpenLineageClient
+from openlineage.client.tracing import span
+from openlineage.client.transport.aio import (
+    AsyncNoopTransport,
+    AsyncTransport,
+    AsyncTransportFactory,
+    get_default_async_factory,
+)
+from openlineage.client.transport.noop import NoopConfig
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from openlineage.client.client import Event
+
+log = logging.getLogger(__name__)
+
+
+class AsyncOpenLineageClient(_BaseOpenLineageClient):
+    """
+    Asyncio counterpart of OpenLineageClient.
+
+    Configuration is resolved, and events are filtered and enriched, exactly like in OpenLineageClient.
+    Transports are created by the async transport factory; transport types without async counterpart
+    run in a worker thread.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport | None = None,
+        factory: AsyncTransportFactory | None = None,
+        *,
+        config: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(config=config)
+        self.transport = self._resolve_transport(transport=transport, factory=factory)
+        log.info("AsyncOpenLineageClient will use `%s` transport", self.transport.kind)
+        self._init_filters()
+        self._init_metrics(str(self.transport.kind))
+        self._init_tracing()
+        self.refresh_configured_facets()
+
+    async def emit(self, event: Event) -> None:
+        self._validate_event(event)
+
+        if self.transport.kind == AsyncNoopTransport.kind:
+            log.debug("OpenLineage is disabled. No events will be emitted.")
+            return
+
+        with span("openlineage.emit"):
+            prepared = self._filter_and_enrich(event)
+            if prepared is None:
+                return
+
+            with span("transport.emit", transport=self.transport.kind):
+                start = time.perf_counter()
+                try:
+                    await self.transport.emit(prepared)
+                except Exception:
+                    self._metrics.increment("emit.failed", tags=self._metric_tags)
+                    raise
+                self._metrics.observe("emit.duration", time.perf_counter() - start, self._metric_tags)
+        log.debug("OpenLineage event successfully emitted.")
+
+    async def flush(self, timeout: float | None = None) -> bool:
+        """Waits until transport delivers buffered events. Returns False if timeout expired first."""
+        return await self.transport.wait_for_completion(timeout)
+
+    async def close(self, timeout: float | None = None) -> bool:
+        """Flushes pending events and releases resources held by transport."""
+        return await self.transport.close(timeout)
+
+    async def __aenter__(self) -> AsyncOpenLineageClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def _resolve_transport(
+        self, transport: AsyncTransport | None, factory: AsyncTransportFactory | None
+    ) -> AsyncTransport:
+        """Resolves transport following the same order as OpenLineageClient._resolve_transport."""
+        if os.getenv("OPENLINEAGE_DISABLED", "").lower().strip() == "true":
+            log.info("OpenLineage is disabled. No events will be emitted.")
+            return AsyncNoopTransport(NoopConfig())
+
+        if transport:
+            return transport
+
+        if self.config.transport and self.config.transport.get("type"):
+            return (factory or get_default_async_factory()).create(self.config.transport)
+
+        if os.environ.get("OPENLINEAGE_URL"):
+            from openlineage.client.transport.aio.http import AsyncHttpTransport
+
+            return AsyncHttpTransport(self._http_config_from_env_variables())
+
+        from openlineage.client.transport.aio.console import AsyncConsoleTransport
+        from openlineage.client.transport.console import ConsoleConfig
+
+        log.warning("Couldn't find any OpenLineage transport configuration; will print events to console.")
+        return AsyncConsoleTransport(ConsoleConfig())
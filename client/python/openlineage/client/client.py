@@ -2,27 +2,35 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import os
+import threading
+import time
 import warnings
-from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, Union, cast, get_args
 
 import attr
-import yaml
-from openlineage.client.filter import Filter, FilterConfig, create_filter
+from openlineage.client.emitter import AsyncEmitter, EmitterConfig
+from openlineage.client.filter import FilterConfig, FilterEngine
+from openlineage.client.metrics import MetricsConfig, counter, get_metrics_registry
+from openlineage.client.sampling import SamplingConfig, SamplingPolicy
 from openlineage.client.serde import Serde
 from openlineage.client.tags import TagsConfig
+from openlineage.client.tracing import TracingConfig, get_tracer, span
 from openlineage.client.utils import deep_merge_dicts
 
 if TYPE_CHECKING:
+    from openlineage.client.metrics import Metric
+    from openlineage.client.transport.http import HttpConfig, HttpTransport
     from requests import Session
     from requests.adapters import HTTPAdapter
 
 import contextlib
 
 from openlineage.client import event_v2
-from openlineage.client.facets import FacetsConfig
+from openlineage.client.facets import FacetsConfig, resolve_lazy_facets
 from openlineage.client.generated.environment_variables_run import (
     EnvironmentVariable,
     EnvironmentVariablesRunFacet,
@@ -35,13 +43,16 @@ from openlineage.client.transport import (
     TransportFactory,
     get_default_factory,
 )
-from openlineage.client.transport.http import HttpConfig, HttpTransport, create_token_provider
 from openlineage.client.transport.noop import NoopConfig, NoopTransport
 
 Event_v1 = Union[RunEvent, DatasetEvent, JobEvent]
 Event_v2 = Union[event_v2.RunEvent, event_v2.DatasetEvent, event_v2.JobEvent]
 Event = Union[Event_v1, Event_v2]
 
+_EVENT_TYPES = frozenset(get_args(Event))
+_RUN_EVENT_TYPES = (RunEvent, event_v2.RunEvent)
+_RUN_AND_JOB_EVENT_TYPES = (RunEvent, event_v2.RunEvent, JobEvent, event_v2.JobEvent)
+
 
 @attr.s
 class OpenLineageClientOptions:
@@ -57,6 +68,10 @@ class OpenLineageConfig:
     facets: FacetsConfig = attr.ib(factory=FacetsConfig)
     filters: list[FilterConfig] = attr.ib(factory=list)
     tags: TagsConfig = attr.ib(factory=TagsConfig)
+    emitter: EmitterConfig = attr.ib(factory=EmitterConfig)
+    sampling: SamplingConfig = attr.ib(factory=SamplingConfig)
+    metrics: MetricsConfig = attr.ib(factory=MetricsConfig)
+    tracing: TracingConfig = attr.ib(factory=TracingConfig)
 
     @classmethod
     def from_dict(cls, params: dict[str, Any]) -> OpenLineageConfig:
@@ -74,6 +89,14 @@ class OpenLineageConfig:
                 job=[TagsJobFacetFields(key, value, "USER") for (key, value) in job_tags.items()],
                 run=[TagsRunFacetFields(key, value, "USER") for (key, value) in run_tags.items()],
             )
+        if "emitter" in params:
+            config.emitter = EmitterConfig.from_dict(params["emitter"])
+        if "sampling" in params:
+            config.sampling = SamplingConfig.from_dict(params["sampling"])
+        if "metrics" in params:
+            config.metrics = MetricsConfig.from_dict(params["metrics"])
+        if "tracing" in params:
+            config.tracing = TracingConfig.from_dict(params["tracing"])
         return config
 
 
@@ -81,108 +104,159 @@ log = logging.getLogger(__name__)
 _T = TypeVar("_T", bound="OpenLineageClient")
 
 
-class OpenLineageClient:
+class _ConfigCache:
+    """
+    Process-wide cache of configuration read from the YAML config file and `OPENLINEAGE__` environment
+    variables, so that creating many clients in one process parses them once. Entries are keyed by config
+    file path, its modification time and size, and a snapshot of `OPENLINEAGE` environment variables, so
+    changing either of them is picked up without explicit invalidation. Callers get deep copies of cached
+    configuration.
+    """
+
+    MAX_ENTRIES = 16
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[Any, ...], tuple[dict[str, Any], dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+        get_metrics_registry().register(self)
+
+    def get(
+        self,
+        key: tuple[Any, ...] | None,
+        load: Callable[[], tuple[dict[str, Any], dict[str, Any]]],
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Returns (file config, environment variables config) for the key, calling `load` on cache miss."""
+        if key is None:
+            return load()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+        if entry is None:
+            entry = load()
+            with self._lock:
+                self.misses += 1
+                if len(self._entries) >= self.MAX_ENTRIES:
+                    # evict the oldest entry
+                    del self._entries[next(iter(self._entries))]
+                self._entries[key] = entry
+        return copy.deepcopy(entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def collect_metrics(self) -> list[Metric]:
+        return [counter("config_cache.hits", self.hits), counter("config_cache.misses", self.misses)]
+
+
+_config_cache = _ConfigCache()
+
+
+def invalidate_config_cache() -> None:
+    """
+    Makes clients created afterwards read config file and environment variables again. Needed only when
+    config file is modified without changing its modification time or size.
+    """
+    _config_cache.clear()
+
+
+class _BaseOpenLineageClient:
+    """Configuration resolution, filtering and enrichment of events shared by sync and async clients."""
+
     DYNAMIC_ENV_VARS_PREFIX = "OPENLINEAGE__"
     DEFAULT_URL_TRANSPORT_NAME = "default_http"
 
-    def __init__(  # noqa: PLR0913
-        self,
-        url: str | None = None,
-        options: OpenLineageClientOptions | None = None,
-        session: Session | None = None,
-        transport: Transport | None = None,
-        factory: TransportFactory | None = None,
-        *,
-        config: dict[str, Any] | None = None,
-    ) -> None:
+    def __init__(self, config: dict[str, Any] | None = None) -> None:
         # Set parent's logging level if environment variable is present
         custom_logging_level = os.getenv("OPENLINEAGE_CLIENT_LOGGING", None)
         if custom_logging_level:
             logging.getLogger(__name__.rpartition(".")[0]).setLevel(custom_logging_level)
 
-        if url:
-            warnings.warn(
-                message="Initializing OpenLineageClient with url, options and session is deprecated.",
-                category=DeprecationWarning,
-                stacklevel=2,
-            )
-
         # Make config ellipsis - as a guard value to not try to
         # reload yaml each time config is referred to.
         self._config: OpenLineageConfig | None = None
 
-        self.user_defined_config: dict[str, str] | None = config
+        self.user_defined_config: dict[str, Any] | None = config
+
+        # config for which facets added to events were prepared
+        self._configured_facets_for: OpenLineageConfig | None = None
 
         self._alias_env_vars()
 
-        self.transport = self._resolve_transport(
-            url=url, options=options, session=session, transport=transport, factory=factory
-        )
-        log.info("OpenLineageClient will use `%s` transport", self.transport.kind)
+    def _init_filters(self) -> None:
+        self._filters = FilterEngine(self.config.filters)
+        self.sampling = SamplingPolicy(self.config.sampling)
 
-        self._filters: list[Filter] = []
-        for conf in self.config.filters:
-            _filter = create_filter(conf)
-            if _filter:
-                self._filters.append(_filter)
+    def _init_metrics(self, transport_kind: str) -> None:
+        self._metrics = get_metrics_registry()
+        self._metric_tags = (("transport", transport_kind),)
+        if self.config.metrics.exporters:
+            self._metrics.configure(self.config.metrics)
 
-    @classmethod
-    def from_environment(cls: type[_T]) -> _T:
-        warnings.warn(
-            message="`OpenLineageClient.from_environment()` is deprecated. Use `OpenLineageClient()`.",
-            category=DeprecationWarning,
-            stacklevel=2,
-        )
-        return cls()
+    def _init_tracing(self) -> None:
+        if self.config.tracing.exporters:
+            get_tracer().configure(self.config.tracing)
 
-    @classmethod
-    def from_dict(cls: type[_T], config: dict[str, str]) -> _T:
-        warnings.warn(
-            message=(
-                "Using `from_dict` to set transport is deprecated. "
-                "Use `config` parameter to fully configure OpenLineageClient."
-            ),
-            category=DeprecationWarning,
-            stacklevel=2,
+    def refresh_configured_facets(self) -> None:
+        """
+        Prepares environment variables and tags facets added to emitted events. Called when the client is
+        created and when its config is replaced; call it after changing the environment variables listed
+        in `facets.environment_variables` to include their new values.
+        Prepared facets are shared by emitted events, so they should not be modified.
+        """
+        config = self.config
+        env_vars = self._collect_environment_variables()
+        self._environment_facet = (
+            EnvironmentVariablesRunFacet(
+                environmentVariables=[
+                    EnvironmentVariable(name=name, value=value) for name, value in env_vars.items()
+                ]
+            )
+            if env_vars
+            else None
         )
-        return cls(transport=get_default_factory().create(config=config), config={"transport": config})
-
-    def filter_event(
-        self,
-        event: Event,
-    ) -> Event | None:
-        """Filters jobs according to config-defined events"""
-        for _filter in self._filters:
-            if isinstance(event, (RunEvent, event_v2.RunEvent)) and _filter.filter_event(event) is None:
-                return None
-        return event
-
-    def emit(self, event: Event) -> None:
-        from typing import get_args
-
-        if type(event) not in get_args(Event):
+        self._job_tags: list[TagsJobFacetFields] = list(config.tags.job)
+        self._job_tags_facet = TagsJobFacet(tags=self._job_tags) if self._job_tags else None
+        self._run_tags: list[TagsRunFacetFields] = list(config.tags.run)
+        self._run_tags_facet = TagsRunFacet(tags=self._run_tags) if self._run_tags else None
+        self._configured_facets_for = config
+
+    def _validate_event(self, event: Event) -> None:
+        if type(event) not in _EVENT_TYPES:
             msg = "`emit` only accepts RunEvent, DatasetEvent, JobEvent classes"
             raise ValueError(msg)
 
-        if log.isEnabledFor(logging.DEBUG):
-            val = Serde.to_json(event).encode("utf-8")
-            log.debug("OpenLineageClient will *try* to emit event %s", val)
-
-        if not self.transport:
-            log.error("Tried to emit OpenLineage event, but transport is not configured.")
-            return
-        if self.transport.kind == NoopTransport.kind:
-            log.debug("OpenLineage is disabled. No events will be emitted.")
-            return
-        if self._filters and self.filter_event(event) is None:
-            log.debug("OpenLineage event has been filtered out and will not be emitted.")
-            return
+    def _filter_and_enrich(self, event: Event) -> Event | None:
+        """
+        Returns event with lazy facets resolved and configured facets added,
+        or None if the event was filtered out.
+        """
+        with span("openlineage.prepare_event"):
+            if self._filters and self.filter_event(event) is None:
+                log.debug("OpenLineage event has been filtered out and will not be emitted.")
+                self._metrics.increment("events.filtered")
+                return None
+            if self.sampling and not self.sampling.keep(event):
+                log.debug("OpenLineage event has been sampled out and will not be emitted.")
+                return None
 
-        event = self.add_environment_facets(event)
-        event = self.update_event_tags_facets(event)
+            event = resolve_lazy_facets(event)
+            event = self.add_environment_facets(event)
+            event = self.update_event_tags_facets(event)
+            if log.isEnabledFor(logging.DEBUG):
+                val = Serde.to_json_bytes(event)
+                log.debug("OpenLineageClient will *try* to emit event %s", val)
+            return event
 
-        self.transport.emit(event)
-        log.debug("OpenLineage event successfully emitted.")
+    def filter_event(
+        self,
+        event: Event,
+    ) -> Event | None:
+        """Filters events according to config-defined filters"""
+        return self._filters.filter_event(event)
 
     @property
     def config(self) -> OpenLineageConfig:
@@ -205,9 +279,17 @@ class OpenLineageClient:
             config_dict: dict[str, Any] = {}
             if self.user_defined_config:
                 config_dict = self.user_defined_config
-            if config_path := self._find_yaml_config_path():
-                config_dict = deep_merge_dicts(self._get_config_file_content(config_path), config_dict)
-            if config_from_env_vars := self._load_config_from_env_variables():
+            config_path = self._find_yaml_config_path()
+            config_from_file, config_from_env_vars = _config_cache.get(
+                self._config_cache_key(config_path),
+                lambda: (
+                    self._get_config_file_content(config_path) if config_path else {},
+                    self._load_config_from_env_variables() or {},
+                ),
+            )
+            if config_from_file:
+                config_dict = deep_merge_dicts(config_from_file, config_dict)
+            if config_from_env_vars:
                 config_dict = deep_merge_dicts(config_from_env_vars, config_dict)
             try:
                 self._config = OpenLineageConfig.from_dict(config_dict)
@@ -217,53 +299,22 @@ class OpenLineageClient:
                 raise ValueError(msg) from e
         return self._config
 
-    def _resolve_transport(self, **kwargs: Any) -> Transport:
-        """
-        Resolves the transport mechanism based on the provided arguments or environment settings.
-
-        This method determines the appropriate transport by executing a sequence of checks:
-        1. Verifies if OpenLineage is disabled through environment variable.
-        2. Looks for a transport object provided in the arguments.
-        3. Attempts to configure the transport from a YAML config file.
-        4. Tries to initialize HTTP transport with an url argument (deprecated).
-        5. Tries to set up HTTP transport using environment variables.
-        6. If no configuration is found, defaults to a console transport and logs a warning message.
-
-        Returns:
-            The transport object that will be used to send lineage events.
-        """
-        # 1. Check if OpenLineage is disabled
-        if os.getenv("OPENLINEAGE_DISABLED", "").lower().strip() == "true":
-            log.info("OpenLineage is disabled. No events will be emitted.")
-            return NoopTransport(NoopConfig())
-
-        # 2. Check if transport is provided explicitly
-        if kwargs.get("transport"):
-            return cast(Transport, kwargs["transport"])
-
-        # 3. Check if transport configuration is provided in YAML config file
-        if self.config.transport and self.config.transport.get("type"):
-            factory = kwargs.get("factory") or get_default_factory()
-            return factory.create(self.config.transport)
-
-        # 4. Check legacy HTTP transport initialization with url and options
-        if kwargs.get("url"):
-            return self._http_transport_from_url(
-                url=kwargs["url"], options=kwargs.get("options"), session=kwargs.get("session")
-            )
-
-        # 5. Check HTTP transport initialization with env variables
-        if os.environ.get("OPENLINEAGE_URL"):
-            return self._http_transport_from_env_variables()
-
-        # 6. If all else fails, print events to console
-        from openlineage.client.transport.console import ConsoleConfig, ConsoleTransport
-
-        log.warning("Couldn't find any OpenLineage transport configuration; will print events to console.")
-        return ConsoleTransport(ConsoleConfig())
+    @staticmethod
+    def _config_cache_key(config_path: str | None) -> tuple[Any, ...] | None:
+        env_vars = tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith("OPENLINEAGE")))
+        if not config_path:
+            return None, env_vars
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            # not cached, reading the file will log the error
+            return None
+        return config_path, stat.st_mtime_ns, stat.st_size, env_vars
 
     @staticmethod
     def _get_config_file_content(config_path: str) -> dict[str, Any]:
+        import yaml
+
         try:
             with open(config_path) as f:
                 config: dict[str, Any] | None = yaml.safe_load(f)
@@ -293,14 +344,16 @@ class OpenLineageClient:
                     return path
                 if path and verbose:
                     log.debug("OpenLineage config file is missing or not readable: `%s`.", path)
-            except Exception:  # noqa: BLE001
+            except Exception:
                 # We can get different errors depending on system
                 if verbose:
                     log.exception("Couldn't check if OpenLineage config file is readable: `%s`", path)
         return None
 
     @staticmethod
-    def _http_transport_from_env_variables() -> HttpTransport:
+    def _http_config_from_env_variables() -> HttpConfig:
+        from openlineage.client.transport.http import HttpConfig, create_token_provider
+
         config = HttpConfig(
             url=os.environ["OPENLINEAGE_URL"],
             auth=create_token_provider(
@@ -313,24 +366,7 @@ class OpenLineageClient:
         endpoint = os.environ.get("OPENLINEAGE_ENDPOINT", None)
         if endpoint is not None:
             config.endpoint = endpoint
-
-        return HttpTransport(config)
-
-    @staticmethod
-    def _http_transport_from_url(
-        url: str,
-        options: OpenLineageClientOptions | None,
-        session: Session | None,
-    ) -> HttpTransport:
-        if not options:
-            options = OpenLineageClientOptions()
-        return HttpTransport(
-            HttpConfig.from_options(
-                url=url,
-                options=options,
-                session=session,
-            ),
-        )
+        return config
 
     def _alias_env_vars(self) -> None:
         default_transport_name = self.DEFAULT_URL_TRANSPORT_NAME.upper()
@@ -347,18 +383,18 @@ class OpenLineageClient:
             os.environ[f"OPENLINEAGE__TRANSPORT__TRANSPORTS__{default_transport_name}__TYPE"] = "http"
             os.environ[f"OPENLINEAGE__TRANSPORT__TRANSPORTS__{default_transport_name}__URL"] = url
             if api_key := os.environ.get("OPENLINEAGE_API_KEY"):
-                os.environ[
-                    f"OPENLINEAGE__TRANSPORT__TRANSPORTS__{default_transport_name}__AUTH"
-                ] = json.dumps(
-                    {
-                        "type": "api_key",
-                        "apiKey": api_key,
-                    }
+                os.environ[f"OPENLINEAGE__TRANSPORT__TRANSPORTS__{default_transport_name}__AUTH"] = (
+                    json.dumps(
+                        {
+                            "type": "api_key",
+                            "apiKey": api_key,
+                        }
+                    )
                 )
             if endpoint := os.environ.get("OPENLINEAGE_ENDPOINT"):
-                os.environ[
-                    f"OPENLINEAGE__TRANSPORT__TRANSPORTS__{default_transport_name}__ENDPOINT"
-                ] = endpoint
+                os.environ[f"OPENLINEAGE__TRANSPORT__TRANSPORTS__{default_transport_name}__ENDPOINT"] = (
+                    endpoint
+                )
 
     @classmethod
     def _load_config_from_env_variables(cls) -> dict[str, Any] | None:
@@ -397,15 +433,13 @@ class OpenLineageClient:
         """
         Adds environment variables as facets to the event object.
         """
-        if isinstance(event, (RunEvent, event_v2.RunEvent)) and (
-            env_vars := self._collect_environment_variables()
-        ):
-            event.run.facets = event.run.facets or {}
-            event.run.facets["environmentVariables"] = EnvironmentVariablesRunFacet(
-                environmentVariables=[
-                    EnvironmentVariable(name=name, value=value) for name, value in env_vars.items()
-                ]
-            )
+        if self._configured_facets_for is not self.config:
+            self.refresh_configured_facets()
+        if self._environment_facet is not None and isinstance(event, _RUN_EVENT_TYPES):
+            if event.run.facets:
+                event.run.facets["environmentVariables"] = self._environment_facet
+            else:
+                event.run.facets = {"environmentVariables": self._environment_facet}
         return event
 
     def _collect_environment_variables(self) -> dict[str, str]:
@@ -425,21 +459,24 @@ class OpenLineageClient:
         """
         Creates or updates job and run tag facets based on user-supplied environment variables
         """
-        run_event_types = (RunEvent, event_v2.RunEvent)
-        run_and_job_event_types = (RunEvent, event_v2.RunEvent, JobEvent, event_v2.JobEvent)
-        tags_job = self.config.tags.job
-        if isinstance(event, run_and_job_event_types) and tags_job:
-            # Ensure facets exists
-            event.job.facets = {} if not event.job.facets else event.job.facets
-            tags_facet = event.job.facets.get("tags", TagsJobFacet())
-            event.job.facets["tags"] = self._update_tag_facet(tags_facet, tags_job)  # type: ignore [arg-type, assignment]
-
-        tags_run = self.config.tags.run
-        if isinstance(event, run_event_types) and tags_run:
-            # Ensure facets exists
-            event.run.facets = {} if not event.run.facets else event.run.facets
-            tags_facet = event.run.facets.get("tags", TagsRunFacet())
-            event.run.facets["tags"] = self._update_tag_facet(tags_facet, tags_run)  # type: ignore [arg-type, assignment]
+        if self._configured_facets_for is not self.config:
+            self.refresh_configured_facets()
+
+        if self._job_tags_facet is not None and isinstance(event, _RUN_AND_JOB_EVENT_TYPES):
+            if not event.job.facets:
+                event.job.facets = {"tags": self._job_tags_facet}
+            elif (tags_facet := event.job.facets.get("tags")) is None or tags_facet is self._job_tags_facet:
+                event.job.facets["tags"] = self._job_tags_facet
+            else:
+                event.job.facets["tags"] = self._update_tag_facet(tags_facet, self._job_tags)  # type: ignore [arg-type, assignment]
+
+        if self._run_tags_facet is not None and isinstance(event, _RUN_EVENT_TYPES):
+            if not event.run.facets:
+                event.run.facets = {"tags": self._run_tags_facet}
+            elif (tags_facet := event.run.facets.get("tags")) is None or tags_facet is self._run_tags_facet:
+                event.run.facets["tags"] = self._run_tags_facet
+            else:
+                event.run.facets["tags"] = self._update_tag_facet(tags_facet, self._run_tags)  # type: ignore [arg-type, assignment]
 
         return event
 
@@ -464,12 +501,197 @@ class OpenLineageClient:
         if tags_facet.tags is not None:
             facet_tag_keys = {tag.key.lower(): tag.key for tag in tags_facet.tags}
 
+        # User tags are copied, not modified, as they are shared by all events.
+        override_tags = []
         for user_tag in user_tags:
             if user_tag.key in facet_tag_keys:
                 facet_tag_key = facet_tag_keys[user_tag.key]
                 log.info("Overriding integration-supplied tag `%s` with user-supplied tag", facet_tag_key)
-                user_tag.key = facet_tag_key
+                user_tag = attr.evolve(user_tag, key=facet_tag_key)  # noqa: PLW2901
+            override_tags.append(user_tag)
 
-        all_tags = keep_tags + user_tags
+        all_tags = keep_tags + override_tags
         tags_facet.tags = all_tags  # type: ignore [assignment]
         return tags_facet
+
+
+class OpenLineageClient(_BaseOpenLineageClient):
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str | None = None,
+        options: OpenLineageClientOptions | None = None,
+        session: Session | None = None,
+        transport: Transport | None = None,
+        factory: TransportFactory | None = None,
+        *,
+        config: dict[str, Any] | None = None,
+    ) -> None:
+        if url:
+            warnings.warn(
+                message="Initializing OpenLineageClient with url, options and session is deprecated.",
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
+
+        super().__init__(config=config)
+
+        self.transport = self._resolve_transport(
+            url=url, options=options, session=session, transport=transport, factory=factory
+        )
+        log.info("OpenLineageClient will use `%s` transport", self.transport.kind)
+
+        self._init_filters()
+        self._init_metrics(str(self.transport.kind))
+        self._init_tracing()
+        self.refresh_configured_facets()
+
+        self._emitter: AsyncEmitter | None = None
+        if self.config.emitter.is_async and self.transport.kind != NoopTransport.kind:
+            from openlineage.client.transport.kafka import get_message_key
+
+            self._emitter = AsyncEmitter(self._emit_to_transport, self.config.emitter, key_fn=get_message_key)
+
+    @classmethod
+    def from_environment(cls: type[_T]) -> _T:
+        warnings.warn(
+            message="`OpenLineageClient.from_environment()` is deprecated. Use `OpenLineageClient()`.",
+            category=DeprecationWarning,
+            stacklevel=2,
+        )
+        return cls()
+
+    @classmethod
+    def from_dict(cls: type[_T], config: dict[str, str]) -> _T:
+        warnings.warn(
+            message=(
+                "Using `from_dict` to set transport is deprecated. "
+                "Use `config` parameter to fully configure OpenLineageClient."
+            ),
+            category=DeprecationWarning,
+            stacklevel=2,
+        )
+        return cls(transport=get_default_factory().create(config=config), config={"transport": config})
+
+    def emit(self, event: Event) -> None:
+        self._validate_event(event)
+
+        if not self.transport:
+            log.error("Tried to emit OpenLineage event, but transport is not configured.")
+            return
+        if self.transport.kind == NoopTransport.kind:
+            log.debug("OpenLineage is disabled. No events will be emitted.")
+            return
+
+        with span("openlineage.emit"):
+            prepared = self._filter_and_enrich(event)
+            if prepared is None:
+                return
+
+            if self._emitter:
+                if self._emitter.submit(prepared):
+                    log.debug("OpenLineage event queued for emission.")
+                return
+
+            self._emit_to_transport(prepared)
+        log.debug("OpenLineage event successfully emitted.")
+
+    def _emit_to_transport(self, event: Event) -> None:
+        with span("transport.emit", transport=self.transport.kind):
+            start = time.perf_counter()
+            try:
+                self.transport.emit(event)
+            except Exception:
+                self._metrics.increment("emit.failed", tags=self._metric_tags)
+                raise
+            self._metrics.observe("emit.duration", time.perf_counter() - start, self._metric_tags)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Waits until all events emitted so far are handed over by the transport.
+
+        Returns False if timeout (in seconds) expired before that happened.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flushed = self._emitter.flush(timeout) if self._emitter else True
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return self.transport.wait_for_completion(remaining) and flushed
+
+    def close(self, timeout: float | None = None) -> bool:
+        """
+        Flushes pending events and releases resources held by the client and its transport.
+
+        Returns False if timeout (in seconds) expired before all events were handed over.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flushed = self._emitter.close(timeout) if self._emitter else True
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return self.transport.close(remaining) and flushed
+
+    def _resolve_transport(self, **kwargs: Any) -> Transport:
+        """
+        Resolves the transport mechanism based on the provided arguments or environment settings.
+
+        This method determines the appropriate transport by executing a sequence of checks:
+        1. Verifies if OpenLineage is disabled through environment variable.
+        2. Looks for a transport object provided in the arguments.
+        3. Attempts to configure the transport from a YAML config file.
+        4. Tries to initialize HTTP transport with an url argument (deprecated).
+        5. Tries to set up HTTP transport using environment variables.
+        6. If no configuration is found, defaults to a console transport and logs a warning message.
+
+        Returns:
+            The transport object that will be used to send lineage events.
+        """
+        # 1. Check if OpenLineage is disabled
+        if os.getenv("OPENLINEAGE_DISABLED", "").lower().strip() == "true":
+            log.info("OpenLineage is disabled. No events will be emitted.")
+            return NoopTransport(NoopConfig())
+
+        # 2. Check if transport is provided explicitly
+        if kwargs.get("transport"):
+            return cast(Transport, kwargs["transport"])
+
+        # 3. Check if transport configuration is provided in YAML config file
+        if self.config.transport and self.config.transport.get("type"):
+            factory = kwargs.get("factory") or get_default_factory()
+            return factory.create(self.config.transport)
+
+        # 4. Check legacy HTTP transport initialization with url and options
+        if kwargs.get("url"):
+            return self._http_transport_from_url(
+                url=kwargs["url"], options=kwargs.get("options"), session=kwargs.get("session")
+            )
+
+        # 5. Check HTTP transport initialization with env variables
+        if os.environ.get("OPENLINEAGE_URL"):
+            return self._http_transport_from_env_variables()
+
+        # 6. If all else fails, print events to console
+        from openlineage.client.transport.console import ConsoleConfig, ConsoleTransport
+
+        log.warning("Couldn't find any OpenLineage transport configuration; will print events to console.")
+        return ConsoleTransport(ConsoleConfig())
+
+    @classmethod
+    def _http_transport_from_env_variables(cls) -> HttpTransport:
+        from openlineage.client.transport.http import HttpTransport
+
+        return HttpTransport(cls._http_config_from_env_variables())
+
+    @staticmethod
+    def _http_transport_from_url(
+        url: str,
+        options: OpenLineageClientOptions | None,
+        session: Session | None,
+    ) -> HttpTransport:
+        from openlineage.client.transport.http import HttpConfig, HttpTransport
+
+        if not options:
+            options = OpenLineageClientOptions()
+        return HttpTransport(
+            HttpConfig.from_options(
+                url=url,
+                options=options,
+                session=session,
+            ),
+        )
@@ -0,0 +1,255 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Emitters decide on which thread events are handed over to the transport.
+
+By default, `OpenLineageClient` emits synchronously - the caller waits until transport returns.
+With `emitter.type` set to `async`, events are put to a bounded in-memory queue and a background
+worker thread passes them to the transport, so transport latency (HTTP retries, Kafka flushes)
+does not add to the caller's wall-clock time.
+
+With `emitter.workers` above 1, events are sharded by a key among that many queues, each drained
+by its own worker. Related events - the client uses the same key as Kafka transport, so a run and
+its parent chain - stay on one shard and are emitted in order, while unrelated ones run concurrently.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable
+
+import attr
+from openlineage.client.metrics import counter, gauge, get_metrics_registry
+from openlineage.client.tracing import current_span, span
+from openlineage.client.utils import ExitStage, get_only_specified_fields, register_exit_hook
+
+if TYPE_CHECKING:
+    from openlineage.client.client import Event
+    from openlineage.client.metrics import Metric
+    from openlineage.client.tracing import Span
+
+log = logging.getLogger(__name__)
+
+
+class OverflowPolicy(Enum):
+    # wait until there is space in the queue
+    BLOCK = "block"
+    # drop the oldest queued event to make space for the new one
+    DROP_OLDEST = "drop_oldest"
+    # drop the event that is being emitted
+    DROP_NEWEST = "drop_newest"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@attr.s
+class EmitterConfig:
+    # `sync` emits on the caller thread, `async` uses background worker
+    type: str = attr.ib(default="sync")
+    # maximum number of events waiting in the queue
+    queue_size: int = attr.ib(default=10000)
+    overflow_policy: OverflowPolicy = attr.ib(default=OverflowPolicy.BLOCK, converter=OverflowPolicy)
+    # max seconds to wait for space in the queue with `block` policy, None waits indefinitely
+    block_timeout: float | None = attr.ib(default=None)
+    # max seconds to wait for queued events to be emitted on interpreter exit
+    close_timeout: float = attr.ib(default=5.0)
+    # number of worker threads, events with the same key are emitted by the same one
+    workers: int = attr.ib(default=1)
+
+    @classmethod
+    def from_dict(cls, params: dict[str, Any]) -> EmitterConfig:
+        return cls(**get_only_specified_fields(cls, params))
+
+    @property
+    def is_async(self) -> bool:
+        return self.type.lower() == "async"
+
+
+class AsyncEmitter:
+    """
+    Bounded queue drained by daemon worker threads, one per shard.
+
+    Events are assigned to a shard by `key_fn`, and passed to `emit_fn` on the shard's worker thread
+    in the order they were submitted. Exceptions raised by `emit_fn` are logged and do not stop the worker.
+    `queue_size` limits events queued in all shards together.
+    """
+
+    def __init__(
+        self,
+        emit_fn: Callable[[Event], Any],
+        config: EmitterConfig,
+        key_fn: Callable[[Event], str | None] | None = None,
+    ) -> None:
+        if config.queue_size <= 0:
+            msg = "`queue_size` of async emitter has to be positive"
+            raise ValueError(msg)
+        if config.workers <= 0:
+            msg = "`workers` of async emitter has to be positive"
+            raise ValueError(msg)
+        self.emit_fn = emit_fn
+        self.key_fn = key_fn
+        self.config = config
+        self.emitted = 0
+        self.failed = 0
+        self.dropped = 0
+        self._closed = False
+        self._init_state()
+        _live_emitters.add(self)
+        get_metrics_registry().register(self)
+
+    def _init_state(self) -> None:
+        self._pid = os.getpid()
+        # events with their submission sequence number, so the oldest one in all shards can be found,
+        # and span of the submitting thread, so emission on the worker thread continues its trace
+        self._queues: list[deque[tuple[int, Event, Span | None]]] = [
+            deque() for _ in range(self.config.workers)
+        ]
+        self._sequence = 0
+        # number of events in all queues
+        self._queued = 0
+        # number of submitted events not yet processed by workers, including the in-flight ones
+        self._unfinished = 0
+        self._lock = threading.Lock()
+        self._not_empty = [threading.Condition(self._lock) for _ in self._queues]
+        self._not_full = threading.Condition(self._lock)
+        self._all_done = threading.Condition(self._lock)
+        self._workers: list[threading.Thread | None] = [None] * len(self._queues)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queued
+
+    def collect_metrics(self) -> list[Metric]:
+        return [
+            gauge("emitter.queue_depth", self._queued),
+            counter("emitter.emitted", self.emitted),
+            counter("emitter.failed", self.failed),
+            counter("emitter.dropped", self.dropped),
+        ]
+
+    def _shard(self, event: Event) -> int:
+        if len(self._queues) == 1 or self.key_fn is None:
+            return 0
+        try:
+            key = self.key_fn(event)
+        except Exception:
+            log.warning("Failed to get ordering key of OpenLineage event.", exc_info=True)
+            key = None
+        return hash(key) % len(self._queues)
+
+    def submit(self, event: Event) -> bool:
+        """Puts event in the queue. Returns False if the event was dropped."""
+        if self._pid != os.getpid():
+            # Worker threads do not survive fork. Events queued in the parent are the parent's job.
+            self._init_state()
+        shard = self._shard(event)
+        with self._lock:
+            if self._closed:
+                log.warning("OpenLineage async emitter is closed, dropping event.")
+                self.dropped += 1
+                return False
+            if not self._wait_for_space():
+                return False
+            self._queues[shard].append((self._sequence, event, current_span()))
+            self._sequence += 1
+            self._queued += 1
+            self._unfinished += 1
+            self._ensure_worker(shard)
+            self._not_empty[shard].notify()
+        return True
+
+    def _wait_for_space(self) -> bool:
+        # has to be called with lock held
+        if self._queued < self.config.queue_size:
+            return True
+        policy = self.config.overflow_policy
+        if policy == OverflowPolicy.DROP_NEWEST:
+            log.warning("OpenLineage event queue is full, dropping event.")
+            self.dropped += 1
+            return False
+        if policy == OverflowPolicy.DROP_OLDEST:
+            log.warning("OpenLineage event queue is full, dropping oldest queued event.")
+            min((queue for queue in self._queues if queue), key=lambda queue: queue[0][0]).popleft()
+            self._queued -= 1
+            self._unfinished -= 1
+            self.dropped += 1
+            return True
+        if not self._not_full.wait_for(
+            lambda: self._queued < self.config.queue_size, timeout=self.config.block_timeout
+        ):
+            log.warning("Timed out waiting for space in OpenLineage event queue, dropping event.")
+            self.dropped += 1
+            return False
+        return True
+
+    def _ensure_worker(self, shard: int) -> None:
+        # has to be called with lock held
+        worker = self._workers[shard]
+        if worker is None or not worker.is_alive():
+            name = "openlineage-emitter" if len(self._workers) == 1 else f"openlineage-emitter-{shard}"
+            worker = threading.Thread(target=self._run, args=(shard,), name=name, daemon=True)
+            self._workers[shard] = worker
+            worker.start()
+
+    def _run(self, shard: int) -> None:
+        queue = self._queues[shard]
+        while True:
+            with self._lock:
+                self._not_empty[shard].wait_for(lambda: queue or self._closed)
+                if not queue:
+                    return
+                _, event, parent = queue.popleft()
+                self._queued -= 1
+                self._not_full.notify()
+            try:
+                with span("emitter.emit", parent=parent):
+                    self.emit_fn(event)
+                self.emitted += 1
+            except Exception as e:  # noqa: BLE001
+                self.failed += 1
+                log.warning("Failed to emit OpenLineage event asynchronously: %s", e)
+            with self._lock:
+                self._unfinished -= 1
+                if self._unfinished <= 0:
+                    self._all_done.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits until all queued events are emitted. Returns False if timeout expired first."""
+        with self._lock:
+            return self._all_done.wait_for(lambda: self._unfinished <= 0, timeout=timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Stops accepting events and waits for queued ones to be emitted."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flushed = self.flush(timeout)
+        with self._lock:
+            self._closed = True
+            for not_empty in self._not_empty:
+                not_empty.notify_all()
+            workers = [worker for worker in self._workers if worker is not None]
+        for worker in workers:
+            if worker is not threading.current_thread():
+                worker.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        if not flushed:
+            log.warning("OpenLineage async emitter closed with %d events not emitted.", self._unfinished)
+        return flushed
+
+
+_live_emitters: weakref.WeakSet[AsyncEmitter] = weakref.WeakSet()
+
+
+def _close_live_emitters() -> None:
+    for emitter in list(_live_emitters):
+        if not emitter._closed and emitter._pid == os.getpid():  # noqa: SLF001
+            emitter.close(emitter.config.close_timeout)
+
+
+# queued events are handed over to transports before they are closed
+register_exit_hook(_close_live_emitters, ExitStage.EMITTERS)
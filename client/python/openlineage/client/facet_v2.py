@@ -1,38 +1,9 @@
 # Copyright 2018-2025 contributors to the OpenLineage project
 # SPDX-License-Identifier: Apache-2.0
 
-from openlineage.client.generated import (
-    column_lineage_dataset,
-    data_quality_assertions_dataset,
-    data_quality_metrics_input_dataset,
-    dataset_type_dataset,
-    dataset_version_dataset,
-    datasource_dataset,
-    documentation_dataset,
-    documentation_job,
-    environment_variables_run,
-    error_message_run,
-    external_query_run,
-    extraction_error_run,
-    input_statistics_input_dataset,
-    job_type_job,
-    lifecycle_state_change_dataset,
-    nominal_time_run,
-    output_statistics_output_dataset,
-    ownership_dataset,
-    ownership_job,
-    parent_run,
-    processing_engine_run,
-    schema_dataset,
-    source_code_job,
-    source_code_location_job,
-    sql_job,
-    storage_dataset,
-    symlinks_dataset,
-    tags_dataset,
-    tags_job,
-    tags_run,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from openlineage.client.generated.base import (
     PRODUCER,
     BaseFacet,
@@ -44,6 +15,86 @@ from openlineage.client.generated.base import (
     set_producer,
 )
 
+if TYPE_CHECKING:
+    from openlineage.client.generated import (
+        column_lineage_dataset,
+        data_quality_assertions_dataset,
+        data_quality_metrics_input_dataset,
+        dataset_type_dataset,
+        dataset_version_dataset,
+        datasource_dataset,
+        documentation_dataset,
+        documentation_job,
+        environment_variables_run,
+        error_message_run,
+        external_query_run,
+        extraction_error_run,
+        input_statistics_input_dataset,
+        job_type_job,
+        lifecycle_state_change_dataset,
+        nominal_time_run,
+        output_statistics_output_dataset,
+        ownership_dataset,
+        ownership_job,
+        parent_run,
+        processing_engine_run,
+        schema_dataset,
+        source_code_job,
+        source_code_location_job,
+        sql_job,
+        storage_dataset,
+        symlinks_dataset,
+        tags_dataset,
+        tags_job,
+        tags_run,
+    )
+
+# generated facet modules are imported on first access, so that importing facet_v2 stays cheap
+_FACET_MODULES = frozenset(
+    {
+        "column_lineage_dataset",
+        "data_quality_assertions_dataset",
+        "data_quality_metrics_input_dataset",
+        "dataset_type_dataset",
+        "dataset_version_dataset",
+        "datasource_dataset",
+        "documentation_dataset",
+        "documentation_job",
+        "environment_variables_run",
+        "error_message_run",
+        "external_query_run",
+        "extraction_error_run",
+        "input_statistics_input_dataset",
+        "job_type_job",
+        "lifecycle_state_change_dataset",
+        "nominal_time_run",
+        "output_statistics_output_dataset",
+        "ownership_dataset",
+        "ownership_job",
+        "parent_run",
+        "processing_engine_run",
+        "schema_dataset",
+        "source_code_job",
+        "source_code_location_job",
+        "sql_job",
+        "storage_dataset",
+        "symlinks_dataset",
+        "tags_dataset",
+        "tags_job",
+        "tags_run",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _FACET_MODULES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    module = importlib.import_module(f"openlineage.client.generated.{name}")
+    globals()[name] = module
+    return module
+
+
 __all__ = [
     "PRODUCER",
     "BaseFacet",
@@ -52,7 +103,6 @@ __all__ = [
     "JobFacet",
     "OutputDatasetFacet",
     "RunFacet",
-    "set_producer",
     "column_lineage_dataset",
     "data_quality_assertions_dataset",
     "data_quality_metrics_input_dataset",
@@ -75,6 +125,7 @@ __all__ = [
     "parent_run",
     "processing_engine_run",
     "schema_dataset",
+    "set_producer",
     "source_code_job",
     "source_code_location_job",
     "sql_job",
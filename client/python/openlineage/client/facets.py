@@ -2,9 +2,101 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import logging
+from typing import TYPE_CHECKING, Any, Callable
+
 import attr
 
+if TYPE_CHECKING:
+    from openlineage.client.client import Event
+
+log = logging.getLogger(__name__)
+
+# Facet passed as a zero-argument callable, resolved only if the event is going to be emitted.
+# Returning None leaves the facet out.
+LazyFacet = Callable[[], Any]
+
+# fields of run, job and datasets holding facets, the only places lazy facets are resolved
+FACET_FIELDS = ("facets", "inputFacets", "outputFacets")
+
 
 @attr.s
 class FacetsConfig:
     environment_variables: list[str] = attr.ib(factory=list)
+
+
+def is_lazy_facet(value: Any) -> bool:
+    return callable(value) and not isinstance(value, type) and not attr.has(type(value))
+
+
+def resolve_lazy_facets(event: Event) -> Event:
+    """
+    Replaces lazy facets of the event, its run, job and datasets with facets they return, in place.
+    Lazy facets returning None or raising an exception are removed.
+    """
+    for facets in _facet_dicts(event):
+        for name, value in list(facets.items()):
+            if not is_lazy_facet(value):
+                continue
+            facet = resolve_lazy_facet(name, value)
+            if facet is None:
+                del facets[name]
+            else:
+                facets[name] = facet
+    return event
+
+
+def resolve_lazy_facet(name: str, lazy_facet: LazyFacet) -> Any:
+    try:
+        return lazy_facet()
+    except Exception:
+        log.warning("Failed to compute lazy OpenLineage facet `%s`, leaving it out.", name, exc_info=True)
+        return None
+
+
+def resolve_lazy_facets_in_dict(event: dict[str, Any]) -> dict[str, Any]:
+    """
+    Same as `resolve_lazy_facets` for event passed as dict, but returns a copy sharing unchanged values
+    with the input instead of modifying it. Lazy facets returning None are set to None.
+    """
+    result = dict(event)
+    for key in ("run", "job", "dataset"):
+        if key in result:
+            result[key] = _with_resolved_facets(result[key])
+    for key in ("inputs", "outputs"):
+        if isinstance(result.get(key), list):
+            result[key] = [_with_resolved_facets(dataset) for dataset in result[key]]
+    return result
+
+
+def _with_resolved_facets(holder: Any) -> Any:
+    if not isinstance(holder, dict):
+        return holder
+    result = holder
+    for attribute in FACET_FIELDS:
+        facets = holder.get(attribute)
+        if isinstance(facets, dict) and any(is_lazy_facet(value) for value in facets.values()):
+            if result is holder:
+                result = dict(holder)
+            result[attribute] = {
+                name: resolve_lazy_facet(name, value) if is_lazy_facet(value) else value
+                for name, value in facets.items()
+            }
+    return result
+
+
+def _facet_dicts(event: Event) -> list[dict[str, Any]]:
+    holders: list[Any] = [
+        getattr(event, "run", None),
+        getattr(event, "job", None),
+        getattr(event, "dataset", None),
+    ]
+    holders.extend(getattr(event, "inputs", None) or [])
+    holders.extend(getattr(event, "outputs", None) or [])
+    result = []
+    for holder in holders:
+        for attribute in FACET_FIELDS:
+            facets = getattr(holder, attribute, None)
+            if isinstance(facets, dict) and facets:
+                result.append(facets)
+    return result
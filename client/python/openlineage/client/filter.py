@@ -5,25 +5,47 @@ from __future__ import annotations
 import logging
 import re
 import typing
+from enum import Enum
+from typing import TYPE_CHECKING
 
 import attr
 from openlineage.client.event_v2 import RunEvent as RunEvent_v2
+from openlineage.client.facets import _facet_dicts
 from openlineage.client.run import RunEvent
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from openlineage.client.client import Event
+
 log = logging.getLogger(__name__)
 RunEventType = typing.Union[RunEvent, RunEvent_v2]
 
 
+class FilterTarget(Enum):
+    JOB_NAME = "job_name"
+    JOB_NAMESPACE = "job_namespace"
+    DATASET_NAME = "dataset_name"
+    DATASET_NAMESPACE = "dataset_namespace"
+    EVENT_TYPE = "event_type"
+    # names of run, job and dataset facets present in the event
+    FACET = "facet"
+
+    def __str__(self) -> str:
+        return self.value
+
+
 @attr.s
 class FilterConfig:
     type: str | None = attr.ib(default=None)
     match: str | None = attr.ib(default=None)
     regex: str | None = attr.ib(default=None)
+    # part of the event the filter is matched against, see FilterTarget
+    target: str = attr.ib(default=FilterTarget.JOB_NAME.value)
 
 
 class Filter:
-    def filter_event(self, event: RunEventType) -> RunEventType | None:
-        ...
+    def filter_event(self, event: RunEventType) -> RunEventType | None: ...
 
 
 class ExactMatchFilter(Filter):
@@ -60,3 +82,108 @@ def create_filter(conf: FilterConfig) -> Filter | None:
         return RegexFilter(regex=conf.regex)
     log.warning("Unsupported OpenLineage filter type: `%s`", conf.type)
     return None
+
+
+class FilterEngine:
+    """
+    Matches events against all configured filters at once.
+
+    Exact matches of each target are compiled into a set and regexes of each target into a single
+    alternation, so the cost of matching an event doesn't grow with the number of rules.
+    An event is filtered out if any value of any target matches. Dataset targets match inputs and outputs
+    of run and job events, and the dataset of dataset events; job targets don't apply to dataset events.
+    """
+
+    def __init__(self, configs: Iterable[FilterConfig] = ()) -> None:
+        exact: dict[FilterTarget, set[str]] = {}
+        regexes: dict[FilterTarget, list[str]] = {}
+        for conf in configs:
+            try:
+                target = FilterTarget(conf.target)
+            except ValueError:
+                log.warning("Unsupported OpenLineage filter target: `%s`", conf.target)
+                continue
+            if not conf.type:
+                log.warning("OpenLineage filter config must have a `type`.")
+            elif conf.type == "exact" and conf.match:
+                exact.setdefault(target, set()).add(conf.match)
+            elif conf.type == "regex" and conf.regex:
+                # compile separately to fail on invalid regex the same way as RegexFilter
+                re.compile(conf.regex)
+                regexes.setdefault(target, []).append(conf.regex)
+            else:
+                log.warning("Unsupported OpenLineage filter type: `%s`", conf.type)
+
+        self._exact = {target: frozenset(matches) for target, matches in exact.items()}
+        self._patterns = {target: _combine(patterns) for target, patterns in regexes.items()}
+        self._targets = tuple(dict.fromkeys([*self._exact, *self._patterns]))
+        log.debug(
+            "Compiled %s exact and %s regex OpenLineage filters",
+            sum(len(matches) for matches in exact.values()),
+            sum(len(patterns) for patterns in regexes.values()),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self._targets)
+
+    def matches(self, event: Event) -> bool:
+        for target in self._targets:
+            exact = self._exact.get(target, frozenset())
+            patterns = self._patterns.get(target, ())
+            for value in _target_values(event, target):
+                if value in exact:
+                    log.debug("OpenLineage event %s `%s` matches exact filter.", target, value)
+                    return True
+                for pattern in patterns:
+                    if pattern.match(value):
+                        log.debug("OpenLineage event %s `%s` matches regex filter.", target, value)
+                        return True
+        return False
+
+    def filter_event(self, event: Event) -> Event | None:
+        return None if self.matches(event) else event
+
+
+# numbered backreferences and group conditionals refer to other groups once patterns are joined
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?\(")
+
+
+def _combine(patterns: list[str]) -> tuple[re.Pattern[str], ...]:
+    if len(patterns) == 1:
+        return (re.compile(patterns[0]),)
+    # patterns with named groups or group references are matched on their own
+    standalone = [
+        pattern for pattern in patterns if re.compile(pattern).groupindex or _GROUP_REFERENCE.search(pattern)
+    ]
+    combinable = [pattern for pattern in patterns if pattern not in standalone]
+    if len(combinable) <= 1:
+        return tuple(re.compile(pattern) for pattern in patterns)
+    try:
+        combined = re.compile("|".join(f"(?:{pattern})" for pattern in combinable))
+    except re.error:
+        # e.g. inline global flags can't be combined
+        log.debug("OpenLineage regex filters can't be combined, matching them one by one.")
+        return tuple(re.compile(pattern) for pattern in patterns)
+    return (combined, *(re.compile(pattern) for pattern in standalone))
+
+
+def _target_values(event: Event, target: FilterTarget) -> Iterable[str]:
+    if target == FilterTarget.FACET:
+        return [name for facets in _facet_dicts(event) for name in facets]
+    if target == FilterTarget.EVENT_TYPE:
+        event_type = getattr(event, "eventType", None)
+        return [] if event_type is None else [event_type.value]
+    if target in (FilterTarget.JOB_NAME, FilterTarget.JOB_NAMESPACE):
+        job = getattr(event, "job", None)
+        if job is None:
+            return []
+        return [job.name if target == FilterTarget.JOB_NAME else job.namespace]
+    dataset = getattr(event, "dataset", None)
+    datasets = (
+        [dataset]
+        if dataset is not None
+        else [*(getattr(event, "inputs", None) or []), *(getattr(event, "outputs", None) or [])]
+    )
+    if target == FilterTarget.DATASET_NAME:
+        return [dataset.name for dataset in datasets]
+    return [dataset.namespace for dataset in datasets]
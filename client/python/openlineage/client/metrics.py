@@ -0,0 +1,420 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Metrics of event emission, exported periodically to configured exporters.
+
+Metrics are recorded in two ways. Values changing on every event, like emit latency, are recorded
+in `MetricsRegistry` as counters, gauges and histograms. Counters already kept by client components,
+like dropped events of the async emitter or retries of HTTP transport, are read from them only when
+metrics are exported: components implementing `collect_metrics` are registered as metric sources.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+import socket
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Protocol
+
+import attr
+from openlineage.client.utils import (
+    ExitStage,
+    get_only_specified_fields,
+    import_from_string,
+    register_exit_hook,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+log = logging.getLogger(__name__)
+
+# upper bounds of histogram buckets, in seconds for durations
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Tags = tuple[tuple[str, str], ...]
+
+
+class MetricType(Enum):
+    COUNTER = "counter"
+    GAUGE = "gauge"
+    HISTOGRAM = "histogram"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@attr.s(frozen=True)
+class Metric:
+    name: str = attr.ib()
+    type: MetricType = attr.ib()
+    # total of counter, current value of gauge, sum of histogram observations
+    value: float = attr.ib()
+    tags: Tags = attr.ib(default=())
+    # number of histogram observations
+    count: int = attr.ib(default=0)
+    # cumulative number of histogram observations per bucket upper bound
+    buckets: tuple[tuple[float, int], ...] = attr.ib(default=())
+
+
+def counter(name: str, value: float, tags: Tags = ()) -> Metric:
+    return Metric(name, MetricType.COUNTER, value, tags)
+
+
+def gauge(name: str, value: float, tags: Tags = ()) -> Metric:
+    return Metric(name, MetricType.GAUGE, value, tags)
+
+
+class MetricsSource(Protocol):
+    def collect_metrics(self) -> Iterable[Metric]: ...
+
+
+class _Histogram:
+    __slots__ = ("bounds", "count", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_metric(self, name: str, tags: Tags) -> Metric:
+        cumulative, total = [], 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            cumulative.append((bound, total))
+        cumulative.append((float("inf"), self.count))
+        return Metric(name, MetricType.HISTOGRAM, self.sum, tags, self.count, tuple(cumulative))
+
+
+class MetricsExporter:
+    def export(self, metrics: list[Metric]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+@attr.s
+class MetricsConfig:
+    # exporter configs, each with `type`: logging, statsd, prometheus or callback
+    exporters: list[dict[str, Any]] = attr.ib(factory=list)
+    # seconds between exports
+    interval: float = attr.ib(default=60.0)
+
+    @classmethod
+    def from_dict(cls, params: dict[str, Any]) -> MetricsConfig:
+        return cls(**get_only_specified_fields(cls, params))
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store of metrics recorded by the client.
+
+    Recording a value takes a dict lookup under an uncontended lock, so metrics can stay enabled
+    in production. Exporters are called every `interval` seconds by a daemon thread, and once more
+    when the interpreter exits.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.interval = 60.0
+        self._counters: dict[tuple[str, Tags], float] = {}
+        self._gauges: dict[tuple[str, Tags], float] = {}
+        self._histograms: dict[tuple[str, Tags], _Histogram] = {}
+        self._sources: weakref.WeakSet[MetricsSource] = weakref.WeakSet()
+        self._exporters: list[MetricsExporter] = []
+        self._init_state()
+        _live_registries.add(self)
+
+    def _init_state(self) -> None:
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._reporter: threading.Thread | None = None
+
+    def increment(self, name: str, value: float = 1, tags: Tags = ()) -> None:
+        key = (name, tags)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, tags: Tags = ()) -> None:
+        with self._lock:
+            self._gauges[(name, tags)] = value
+
+    def observe(self, name: str, value: float, tags: Tags = ()) -> None:
+        key = (name, tags)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, tags: Tags = ()) -> Iterator[None]:
+        """Observes seconds spent in the block, also when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, tags)
+
+    def register(self, source: MetricsSource) -> None:
+        """Registers object whose `collect_metrics` is called on export, for as long as it exists."""
+        with self._lock:
+            self._sources.add(source)
+
+    def collect(self) -> list[Metric]:
+        with self._lock:
+            metrics = [counter(name, value, tags) for (name, tags), value in self._counters.items()]
+            metrics.extend(gauge(name, value, tags) for (name, tags), value in self._gauges.items())
+            metrics.extend(h.to_metric(name, tags) for (name, tags), h in self._histograms.items())
+            sources = list(self._sources)
+
+        # values of sources of the same kind, like two HTTP transports, are summed
+        collected: dict[tuple[str, Tags], Metric] = {}
+        for source in sources:
+            try:
+                for metric in source.collect_metrics():
+                    key = (metric.name, metric.tags)
+                    previous = collected.get(key)
+                    if previous is not None:
+                        metric = attr.evolve(metric, value=previous.value + metric.value)  # noqa: PLW2901
+                    collected[key] = metric
+            except Exception:
+                log.exception("Failed to collect OpenLineage metrics of %s", source)
+        metrics.extend(collected.values())
+        return metrics
+
+    def configure(self, config: MetricsConfig) -> None:
+        """Replaces exporters with ones created from config, and starts exporting."""
+        exporters = [create_exporter(exporter_config) for exporter_config in config.exporters]
+        with self._export_lock:
+            previous, self._exporters = self._exporters, exporters
+            self.interval = config.interval
+        for exporter in previous:
+            exporter.close()
+        if exporters:
+            self._ensure_reporter()
+
+    def add_exporter(self, exporter: MetricsExporter) -> None:
+        with self._export_lock:
+            self._exporters.append(exporter)
+        self._ensure_reporter()
+
+    def export(self) -> None:
+        """Passes current metrics to all exporters."""
+        with self._export_lock:
+            exporters = list(self._exporters)
+            if not exporters:
+                return
+            metrics = self.collect()
+            for exporter in exporters:
+                try:
+                    exporter.export(metrics)
+                except Exception:
+                    log.exception("Failed to export OpenLineage metrics with %s", exporter)
+
+    def close(self) -> None:
+        self._stop.set()
+        self.export()
+        with self._export_lock:
+            for exporter in self._exporters:
+                exporter.close()
+
+    def _after_fork(self) -> None:
+        # locks could have been held by other threads, and reporter thread doesn't exist in the child process
+        self._init_state()
+        if self._exporters:
+            self._ensure_reporter()
+
+    def _ensure_reporter(self) -> None:
+        with self._lock:
+            if self._reporter is None or not self._reporter.is_alive():
+                self._reporter = threading.Thread(
+                    target=self._report, name="openlineage-metrics", daemon=True
+                )
+                self._reporter.start()
+
+    def _report(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.export()
+
+
+class LoggingExporter(MetricsExporter):
+    """Logs all metrics, one per line."""
+
+    def __init__(self, level: str | int = logging.INFO) -> None:
+        self.level = logging.getLevelName(level.upper()) if isinstance(level, str) else level
+
+    def export(self, metrics: list[Metric]) -> None:
+        for metric in sorted(metrics, key=lambda m: (m.name, m.tags)):
+            tags = ",".join(f"{key}={value}" for key, value in metric.tags)
+            if metric.type == MetricType.HISTOGRAM:
+                log.log(self.level, "%s{%s} count=%s sum=%s", metric.name, tags, metric.count, metric.value)
+            else:
+                log.log(self.level, "%s{%s} %s", metric.name, tags, metric.value)
+
+
+class StatsdExporter(MetricsExporter):
+    """
+    Sends metrics to StatsD over UDP.
+
+    Counters are sent as increments since the previous export, histograms as `.count` and `.sum` increments.
+    Tags are appended to the metric name, or sent in DogStatsD format with `dogstatsd` set.
+    """
+
+    # fits into the MTU of common networks
+    MAX_DATAGRAM_BYTES = 1432
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 8125, prefix: str = "openlineage", dogstatsd: bool = False
+    ) -> None:
+        self.address = (host, port)
+        self.prefix = prefix
+        self.dogstatsd = dogstatsd
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._previous: dict[tuple[str, Tags], float] = {}
+
+    def export(self, metrics: list[Metric]) -> None:
+        lines = []
+        for metric in metrics:
+            if metric.type == MetricType.HISTOGRAM:
+                lines.append(self._delta_line(f"{metric.name}.count", metric.count, metric.tags))
+                lines.append(self._delta_line(f"{metric.name}.sum", metric.value, metric.tags))
+            elif metric.type == MetricType.COUNTER:
+                lines.append(self._delta_line(metric.name, metric.value, metric.tags))
+            else:
+                lines.append(self._line(metric.name, metric.value, "g", metric.tags))
+        self._send([line for line in lines if line])
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def _delta_line(self, name: str, value: float, tags: Tags) -> str | None:
+        key = (name, tags)
+        delta = value - self._previous.get(key, 0)
+        self._previous[key] = value
+        # counters of a component that was garbage collected can decrease
+        return self._line(name, delta, "c", tags) if delta > 0 else None
+
+    def _line(self, name: str, value: float, metric_type: str, tags: Tags) -> str:
+        value_str = f"{value:g}" if isinstance(value, float) else str(value)
+        if self.dogstatsd:
+            tags_str = f"|#{','.join(f'{k}:{v}' for k, v in tags)}" if tags else ""
+            return f"{self.prefix}.{name}:{value_str}|{metric_type}{tags_str}"
+        tags_str = "".join(f".{v}" for _, v in tags)
+        return f"{self.prefix}.{name}{tags_str}:{value_str}|{metric_type}"
+
+    def _send(self, lines: list[str]) -> None:
+        datagram = b""
+        for line in lines:
+            encoded = line.encode("utf-8")
+            if datagram and len(datagram) + 1 + len(encoded) > self.MAX_DATAGRAM_BYTES:
+                self._socket.sendto(datagram, self.address)
+                datagram = b""
+            datagram = datagram + b"\n" + encoded if datagram else encoded
+        if datagram:
+            self._socket.sendto(datagram, self.address)
+
+
+class PrometheusFileExporter(MetricsExporter):
+    """Writes metrics in Prometheus text format to a file, e.g. for node exporter's textfile collector."""
+
+    def __init__(self, path: str, prefix: str = "openlineage") -> None:
+        self.path = path
+        self.prefix = prefix
+
+    def export(self, metrics: list[Metric]) -> None:
+        lines = []
+        for metric in sorted(metrics, key=lambda m: (m.name, m.tags)):
+            name = f"{self.prefix}_{metric.name}".replace(".", "_").replace("-", "_")
+            if metric.type == MetricType.COUNTER:
+                lines.append(f"{name}_total{_labels(metric.tags)} {metric.value}")
+            elif metric.type == MetricType.GAUGE:
+                lines.append(f"{name}{_labels(metric.tags)} {metric.value}")
+            else:
+                for bound, count in metric.buckets:
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{name}_bucket{_labels((*metric.tags, ('le', le)))} {count}")
+                lines.append(f"{name}_sum{_labels(metric.tags)} {metric.value}")
+                lines.append(f"{name}_count{_labels(metric.tags)} {metric.count}")
+
+        # textfile collector could read partially written file
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, self.path)
+
+
+def _labels(tags: Tags) -> str:
+    if not tags:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in tags) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    # backslash first, so backslashes added by other escapes aren't escaped again
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class CallbackExporter(MetricsExporter):
+    """Passes metrics to an in-process callback."""
+
+    def __init__(self, callback: Callable[[list[Metric]], Any]) -> None:
+        self.callback = callback
+
+    def export(self, metrics: list[Metric]) -> None:
+        self.callback(metrics)
+
+
+def create_exporter(config: dict[str, Any]) -> MetricsExporter:
+    params = {key: value for key, value in config.items() if key != "type"}
+    exporter_type = config.get("type")
+    if exporter_type == "logging":
+        return LoggingExporter(**params)
+    if exporter_type == "statsd":
+        return StatsdExporter(**params)
+    if exporter_type == "prometheus":
+        return PrometheusFileExporter(**params)
+    if exporter_type == "callback":
+        callback = params["callback"]
+        return CallbackExporter(import_from_string(callback) if isinstance(callback, str) else callback)
+    msg = f"Unsupported OpenLineage metrics exporter type: `{exporter_type}`"
+    raise ValueError(msg)
+
+
+_live_registries: weakref.WeakSet[MetricsRegistry] = weakref.WeakSet()
+_default_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return _default_registry
+
+
+def _close_live_registries() -> None:
+    for registry in list(_live_registries):
+        registry.close()
+
+
+register_exit_hook(_close_live_registries, ExitStage.METRICS)
+
+
+def _reset_live_registries() -> None:
+    for registry in list(_live_registries):
+        registry._after_fork()  # noqa: SLF001
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_live_registries)
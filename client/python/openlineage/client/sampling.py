@@ -0,0 +1,124 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Sampling and rate limiting of RUNNING events of high-frequency jobs.
+
+RUNNING events are kept with probability `running_sample_rate`, and then limited to `rate_limit`
+events per second per job by a token bucket holding up to `burst` tokens. Other events, like START,
+COMPLETE, FAIL or ABORT, as well as job and dataset events, are always kept. Rules can be overridden
+for specific jobs in `jobs`, keyed by job name.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import attr
+from openlineage.client.metrics import counter, get_metrics_registry
+from openlineage.client.utils import get_only_specified_fields
+
+if TYPE_CHECKING:
+    from openlineage.client.client import Event
+    from openlineage.client.metrics import Metric
+
+log = logging.getLogger(__name__)
+
+
+@attr.s
+class SamplingRule:
+    # probability of keeping a RUNNING event
+    running_sample_rate: float = attr.ib(default=1.0)
+    # RUNNING events per second per job, None doesn't limit them
+    rate_limit: float | None = attr.ib(default=None)
+    # RUNNING events per job emitted at once before `rate_limit` applies
+    burst: int = attr.ib(default=1)
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.running_sample_rate < 1 or self.rate_limit is not None
+
+
+@attr.s
+class SamplingConfig(SamplingRule):
+    # rules of specific jobs by job name, unspecified fields are taken from the rule above
+    jobs: dict[str, SamplingRule] = attr.ib(factory=dict)
+
+    @classmethod
+    def from_dict(cls, params: dict[str, Any]) -> SamplingConfig:
+        defaults = get_only_specified_fields(SamplingRule, params)
+        jobs = {
+            name: SamplingRule(**{**defaults, **get_only_specified_fields(SamplingRule, job_params)})
+            for name, job_params in params.get("jobs", {}).items()
+        }
+        return cls(jobs=jobs, **defaults)
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class SamplingPolicy:
+    """Decides whether an event is kept according to SamplingConfig, counting dropped events."""
+
+    def __init__(self, config: SamplingConfig | None = None) -> None:
+        self.config = config or SamplingConfig()
+        # RUNNING events dropped by `running_sample_rate`
+        self.sampled_out = 0
+        # RUNNING events dropped by `rate_limit`
+        self.rate_limited = 0
+        self._enabled = self.config.is_enabled or any(rule.is_enabled for rule in self.config.jobs.values())
+        self._buckets: dict[tuple[str, str], _TokenBucket] = {}
+        self._lock = threading.Lock()
+        get_metrics_registry().register(self)
+
+    def __bool__(self) -> bool:
+        return self._enabled
+
+    @property
+    def dropped(self) -> int:
+        return self.sampled_out + self.rate_limited
+
+    def collect_metrics(self) -> list[Metric]:
+        return [
+            counter("events.sampled_out", self.sampled_out),
+            counter("events.rate_limited", self.rate_limited),
+        ]
+
+    def keep(self, event: Event) -> bool:
+        event_type = getattr(event, "eventType", None)
+        if event_type is None or event_type.value != "RUNNING":
+            return True
+        job = event.job  # type: ignore[union-attr]
+        rule = self.config.jobs.get(job.name, self.config)
+
+        if rule.running_sample_rate < 1 and random.random() >= rule.running_sample_rate:  # noqa: S311
+            self.sampled_out += 1
+            return False
+        if rule.rate_limit is None:
+            return True
+        with self._lock:
+            key = (job.namespace, job.name)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _TokenBucket(rule.rate_limit, rule.burst)
+            if bucket.take():
+                return True
+            self.rate_limited += 1
+        return False
@@ -4,21 +4,286 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import sys
+import weakref
 from enum import Enum
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 import attr
+from openlineage.client.facets import (
+    FACET_FIELDS,
+    is_lazy_facet,
+    resolve_lazy_facet,
+    resolve_lazy_facets_in_dict,
+)
+from openlineage.client.tracing import span
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 log = logging.getLogger(__name__)
 
-try:
-    import numpy
-except ImportError:
-    log.warning("ImportError occurred when trying to import numpy module.")
+JSON_BACKEND_ENV_VAR = "OPENLINEAGE_JSON_BACKEND"
+JSON_SORT_KEYS_ENV_VAR = "OPENLINEAGE_JSON_SORT_KEYS"
+
+
+class JsonBackend(Enum):
+    # standard library `json` module
+    JSON = "json"
+    ORJSON = "orjson"
+    MSGSPEC = "msgspec"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+# values of these exact types are emitted as they are
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+
+
+def _from_numpy_int64(obj: Any) -> Any:
+    # Pandas can use numpy.int64 object. Objects of numpy types exist only when numpy is already imported,
+    # so it's looked up in sys.modules instead of importing it.
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(obj, numpy.int64):
+        return int(obj)
+    return obj
+
+
+def _non_serializable(obj: Any) -> str:
+    return f"<<non-serializable: {type(obj).__qualname__}>>"
+
+
+def _to_json_leaf(obj: Any) -> Any:
+    """Replaces value `json` module can't serialize with the same placeholder it produces."""
+    obj = _from_numpy_int64(obj)
+    if obj.__class__ in _SCALAR_TYPES:
+        return obj
+    # subclasses, like str or int enums, are serialized by `json` as their base type
+    for base in (str, int, float):
+        if isinstance(obj, base):
+            return base(obj)
+    return _non_serializable(obj)
+
+
+class _Converter:
+    """
+    Converts values of attrs fields the way `attr.asdict` followed by `remove_nulls_and_enums` would,
+    passing values other than attrs objects, enums and collections to `convert_leaf`.
+    """
+
+    def __init__(self, convert_leaf: Callable[[Any], Any]) -> None:
+        self.convert_leaf = convert_leaf
+        # id of attrs class -> compiled function producing the same dict as
+        # Serde.remove_nulls_and_enums(attr.asdict(obj)). Entries are removed when the class is garbage
+        # collected, as `with_additional_properties` creates a new class on each call.
+        self.serializers: dict[int, Callable[[Any], dict[str, Any]]] = {}
+
+    def convert(self, obj: Any) -> Any:
+        obj_type = obj.__class__
+        if obj_type in _SCALAR_TYPES:
+            return obj
+        # plain lists and dicts are the most common non-scalar values, skip checks that can't match them
+        if obj_type is not list and obj_type is not dict:
+            serializer = self.serializers.get(id(obj_type))
+            if serializer is None and attr.has(obj_type):
+                serializer = self.compile_serializer(obj_type)
+            if serializer is not None:
+                return serializer(obj)
+            if isinstance(obj, Enum):
+                return obj.value
+        if isinstance(obj, dict):
+            return self.convert_dict(obj)
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            return self.convert_list(obj)
+        return self.convert_leaf(obj)
+
+    def convert_dict(self, obj: dict[Any, Any]) -> dict[Any, Any]:
+        result = {}
+        for key, value in obj.items():
+            if value is not None:
+                converted = self.convert(value)
+                if converted is not None:
+                    result[key] = converted
+        return result
+
+    def convert_facets(self, obj: Any) -> Any:
+        """
+        Same as `convert` for value of facets field, resolving lazy facets of event emitted without
+        OpenLineageClient, which resolves them before. Callables anywhere else are leaves.
+        """
+        if not isinstance(obj, dict):
+            return self.convert(obj)
+        result = {}
+        for name, value in obj.items():
+            if is_lazy_facet(value):
+                value = resolve_lazy_facet(name, value)  # noqa: PLW2901
+            if value is not None:
+                converted = self.convert(value)
+                if converted is not None:
+                    result[name] = converted
+        return result
+
+    def convert_list(self, obj: Iterable[Any]) -> list[Any]:
+        result = []
+        for item in obj:
+            if item is not None:
+                converted = self.convert(item)
+                # objects with all fields empty are dropped from lists
+                if converted is not None and not (isinstance(converted, dict) and not converted):
+                    result.append(converted)
+        return result
+
+    def compile_serializer(self, cls: type) -> Callable[[Any], dict[str, Any]]:
+        """
+        Generates function serializing instances of attrs class `cls` in a single pass: each field is read
+        directly, None values are skipped and only non-scalar values go through the generic `convert`.
+        """
+        lines = ["def serialize(obj):", "    result = {}"]
+        for field in attr.fields(cls):
+            convert = "convert_facets" if field.name in FACET_FIELDS else "convert"
+            lines += [
+                f"    value = obj.{field.name}",
+                "    if value is not None:",
+                "        if value.__class__ in scalar_types:",
+                f"            result[{field.name!r}] = value",
+                "        else:",
+                f"            value = {convert}(value)",
+                "            if value is not None:",
+                f"                result[{field.name!r}] = value",
+            ]
+        lines.append("    return result")
+
+        namespace: dict[str, Any] = {
+            "scalar_types": _SCALAR_TYPES,
+            "convert": self.convert,
+            "convert_facets": self.convert_facets,
+        }
+        code = compile("\n".join(lines), f"<openlineage serializer {cls.__qualname__}>", "exec")
+        exec(code, namespace)  # noqa: S102
+        serializer = cast(Callable[[Any], dict[str, Any]], namespace["serialize"])
+        self.serializers[id(cls)] = serializer
+        weakref.finalize(cls, self.serializers.pop, id(cls), None)
+        return serializer
+
+    def to_dict(self, obj: Any) -> dict[Any, Any]:
+        serializer = self.serializers.get(id(obj.__class__))
+        if serializer is None:
+            if not attr.has(obj.__class__):
+                # raises the same error as before
+                attr.asdict(obj)
+            serializer = self.compile_serializer(obj.__class__)
+        return serializer(obj)
+
+
+_converter = _Converter(_from_numpy_int64)
+_serializers = _converter.serializers
+# for backends serializing types like datetime or UUID natively, without option to pass all of them
+# to the `default` hook, values `json` module can't serialize are replaced while converting objects
+_json_converter = _Converter(_to_json_leaf)
+
+
+def _to_json_types(obj: Any) -> Any:
+    """Replaces values `json` module can't serialize in output of `remove_nulls_and_enums`."""
+    if isinstance(obj, dict):
+        return {key: _to_json_types(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_json_types(item) for item in obj]
+    return obj if obj is None else _to_json_leaf(obj)
+
+
+def _json_encoder() -> Callable[[Any, bool], bytes]:
+    def encode(obj: Any, sort_keys: bool) -> bytes:
+        return json.dumps(obj, sort_keys=sort_keys, default=_non_serializable).encode("utf-8")
+
+    return encode
+
+
+def _orjson_encoder() -> Callable[[Any, bool], bytes]:
+    import orjson
+
+    # values orjson would serialize natively, but json module does not, are replaced before encoding
+    options = orjson.OPT_NON_STR_KEYS
+
+    def encode(obj: Any, sort_keys: bool) -> bytes:
+        return orjson.dumps(
+            obj,
+            default=_non_serializable,
+            option=options | orjson.OPT_SORT_KEYS if sort_keys else options,
+        )
+
+    return encode
+
+
+def _msgspec_encoder() -> Callable[[Any, bool], bytes]:
+    import msgspec
+
+    def encode(obj: Any, sort_keys: bool) -> bytes:
+        return msgspec.json.encode(obj, enc_hook=_non_serializable, order="sorted" if sort_keys else None)
+
+    return encode
+
+
+_json_encoders: dict[JsonBackend, Callable[[], Callable[[Any, bool], bytes]]] = {
+    JsonBackend.JSON: _json_encoder,
+    JsonBackend.ORJSON: _orjson_encoder,
+    JsonBackend.MSGSPEC: _msgspec_encoder,
+}
 
 
 class Serde:
+    # encoder used by `to_json_bytes`, resolved on first use
+    _json_backend: JsonBackend | None = None
+    _encode: Callable[[Any, bool], bytes] | None = None
+    # whether values `json` module can't serialize are replaced before encoding
+    _replace_non_json = False
+    _sort_keys = True
+
+    @classmethod
+    def set_json_backend(cls, backend: JsonBackend | str | None, sort_keys: bool | None = None) -> None:
+        """
+        Selects JSON library used by `to_json_bytes` and whether it sorts keys by default.
+        With None, values are read from OPENLINEAGE_JSON_BACKEND and OPENLINEAGE_JSON_SORT_KEYS
+        environment variables, defaulting to the standard library with sorted keys. If the package of
+        backend selected by environment variable is not installed, the standard library is used.
+        """
+        from_env = backend is None
+        if backend is None:
+            backend = os.getenv(JSON_BACKEND_ENV_VAR, JsonBackend.JSON.value)
+        if sort_keys is None:
+            sort_keys = os.getenv(JSON_SORT_KEYS_ENV_VAR, "true").lower() not in ("false", "0")
+        json_backend = JsonBackend(backend.lower() if isinstance(backend, str) else backend)
+        try:
+            encode = _json_encoders[json_backend]()
+        except ModuleNotFoundError:
+            if not from_env:
+                log.exception(
+                    "OpenLineage JSON backend `%s` requires `%s` package to be installed",
+                    json_backend,
+                    json_backend,
+                )
+                raise
+            log.warning(
+                "OpenLineage JSON backend `%s` set in %s requires `%s` package to be installed, "
+                "using `json` instead",
+                json_backend,
+                JSON_BACKEND_ENV_VAR,
+                json_backend,
+            )
+            json_backend = JsonBackend.JSON
+            encode = _json_encoders[json_backend]()
+        cls._encode = encode
+        cls._replace_non_json = json_backend is not JsonBackend.JSON
+        cls._json_backend = json_backend
+        cls._sort_keys = sort_keys
+
+    @classmethod
+    def get_json_backend(cls) -> JsonBackend:
+        if cls._json_backend is None:
+            cls.set_json_backend(None)
+        return cast(JsonBackend, cls._json_backend)
+
     @classmethod
     def remove_nulls_and_enums(cls, obj: Any) -> Any:
         if isinstance(obj, Enum):
@@ -38,21 +303,43 @@ class Serde:
                 ),
             )
 
-        # Pandas can use numpy.int64 object
-        if "numpy" in sys.modules and isinstance(obj, numpy.int64):
-            return int(obj)
-        return obj
+        return _from_numpy_int64(obj)
 
     @classmethod
     def to_dict(cls, obj: Any) -> dict[Any, Any]:
-        if not isinstance(obj, dict):
-            obj = attr.asdict(obj)
-        return cast(dict[Any, Any], cls.remove_nulls_and_enums(obj))
+        if isinstance(obj, dict):
+            return cast(dict[Any, Any], cls.remove_nulls_and_enums(resolve_lazy_facets_in_dict(obj)))
+        return _converter.to_dict(obj)
 
     @classmethod
     def to_json(cls, obj: Any) -> str:
-        return json.dumps(
-            cls.to_dict(obj),
-            sort_keys=True,
-            default=lambda o: f"<<non-serializable: {type(o).__qualname__}>>",
-        )
+        with span("serde.to_json"):
+            return json.dumps(
+                cls.to_dict(obj),
+                sort_keys=True,
+                default=_non_serializable,
+            )
+
+    @classmethod
+    def to_json_bytes(cls, obj: Any, sort_keys: bool | None = None) -> bytes:
+        """
+        Serializes `obj` to UTF-8 encoded JSON using the selected backend. Output of backends other than
+        the standard library may differ in whitespace and escaping of non-ASCII characters.
+        Keys are sorted unless disabled with `sort_keys` or `set_json_backend`, for consumers
+        that do not need canonical output.
+        """
+        if cls._encode is None:
+            cls.get_json_backend()
+        encode = cast(Callable[[Any, bool], bytes], cls._encode)
+        with span("serde.to_json"):
+            data = cls._to_json_dict(obj) if cls._replace_non_json else cls.to_dict(obj)
+            return encode(data, cls._sort_keys if sort_keys is None else sort_keys)
+
+    @classmethod
+    def _to_json_dict(cls, obj: Any) -> dict[Any, Any]:
+        """Same as `to_dict`, with values `json` module can't serialize replaced with placeholder."""
+        if isinstance(obj, dict):
+            return cast(
+                dict[Any, Any], _to_json_types(cls.remove_nulls_and_enums(resolve_lazy_facets_in_dict(obj)))
+            )
+        return _json_converter.to_dict(obj)
@@ -0,0 +1,266 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Lightweight tracing of lineage emission stages.
+
+Stages like extraction, preparing the event, serialization and emitting it by the transport are wrapped
+in spans. The current span is kept in a context variable, so spans started inside it - on the same thread,
+or in the same asyncio task - become its children. Finished spans are passed to span processors: built-in
+ones keep them in memory, append them to a file, or mirror them as OpenTelemetry spans.
+
+Without processors, starting a span only checks that list and returns a shared no-op context manager.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+import attr
+from openlineage.client.utils import get_only_specified_fields
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+log = logging.getLogger(__name__)
+
+
+@attr.s
+class Span:
+    name: str = attr.ib()
+    trace_id: str = attr.ib()
+    span_id: str = attr.ib()
+    parent_id: str | None = attr.ib(default=None)
+    attributes: dict[str, Any] = attr.ib(factory=dict)
+    # wall-clock seconds since epoch
+    start_time: float = attr.ib(factory=time.time)
+    end_time: float | None = attr.ib(default=None)
+    # seconds, measured with monotonic clock
+    duration: float | None = attr.ib(default=None)
+    # repr of exception raised in the span
+    error: str | None = attr.ib(default=None)
+    _started: float = attr.ib(factory=time.perf_counter, repr=False)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        return attr.asdict(self, filter=lambda a, _: a.name != "_started")
+
+
+class SpanProcessor:
+    """Receives spans when they start and end. Exceptions raised by processors are logged and ignored."""
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+@attr.s
+class TracingConfig:
+    # span processor configs, each with `type`: memory, file or opentelemetry
+    exporters: list[dict[str, Any]] = attr.ib(factory=list)
+
+    @classmethod
+    def from_dict(cls, params: dict[str, Any]) -> TracingConfig:
+        return cls(**get_only_specified_fields(cls, params))
+
+
+_current_span: ContextVar[Span | None] = ContextVar("openlineage_current_span", default=None)
+
+
+class _NoopScope:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args: object) -> None:
+        return None
+
+
+_NOOP_SCOPE = _NoopScope()
+
+
+class _SpanScope:
+    __slots__ = ("_token", "span", "tracer")
+
+    def __init__(self, tracer: Tracer, span: Span) -> None:
+        self.tracer = tracer
+        self.span = span
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self.span)
+        self.tracer._notify("on_start", self.span)  # noqa: SLF001
+        return self.span
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        span = self.span
+        span.duration = time.perf_counter() - span._started  # noqa: SLF001
+        span.end_time = span.start_time + span.duration
+        if exc_val is not None:
+            span.error = repr(exc_val)
+        _current_span.reset(self._token)
+        self.tracer._notify("on_end", span)  # noqa: SLF001
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.processors: list[SpanProcessor] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.processors)
+
+    def span(self, name: str, parent: Span | None = None, **attributes: Any) -> _SpanScope | _NoopScope:
+        """
+        Returns context manager of a span, yielding the Span, or None when tracing is disabled.
+        `parent` defaults to the current span; pass it to continue a trace on another thread.
+        """
+        if not self.processors:
+            return _NOOP_SCOPE
+        if parent is None:
+            parent = _current_span.get()
+        span_id = os.urandom(8).hex()
+        if parent is None:
+            span = Span(name, trace_id=os.urandom(16).hex(), span_id=span_id, attributes=attributes)
+        else:
+            span = Span(name, parent.trace_id, span_id, parent.span_id, attributes)
+        return _SpanScope(self, span)
+
+    def add_processor(self, processor: SpanProcessor) -> None:
+        self.processors = [*self.processors, processor]
+
+    def configure(self, config: TracingConfig) -> None:
+        """Replaces processors with ones created from config."""
+        previous, self.processors = self.processors, [create_processor(c) for c in config.exporters]
+        for processor in previous:
+            processor.close()
+
+    def close(self) -> None:
+        for processor in self.processors:
+            processor.close()
+
+    def _notify(self, method: str, span: Span) -> None:
+        for processor in self.processors:
+            try:
+                getattr(processor, method)(span)
+            except Exception:
+                log.exception("OpenLineage span processor %s failed", processor)
+
+
+class InMemorySpanExporter(SpanProcessor):
+    """Keeps up to `max_spans` most recent finished spans."""
+
+    def __init__(self, max_spans: int = 10000) -> None:
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+
+    @property
+    def spans(self) -> list[Span]:
+        return list(self._spans)
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+    def on_end(self, span: Span) -> None:
+        self._spans.append(span)
+
+
+class FileSpanExporter(SpanProcessor):
+    """Appends finished spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")  # noqa: SIM115
+
+    def on_end(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class OpenTelemetrySpanProcessor(SpanProcessor):
+    """Mirrors spans as OpenTelemetry spans of the globally configured tracer provider."""
+
+    def __init__(self, tracer_name: str = "openlineage") -> None:
+        try:
+            from opentelemetry import trace
+        except ModuleNotFoundError:
+            log.exception("OpenTelemetry span processor requires `opentelemetry-api` package.")
+            raise
+        self._trace = trace
+        self._tracer = trace.get_tracer(tracer_name)
+        self._otel_spans: dict[str, Any] = {}
+
+    def on_start(self, span: Span) -> None:
+        parent = self._otel_spans.get(span.parent_id) if span.parent_id else None
+        # without our parent, it's a child of the current OpenTelemetry span, e.g. of Airflow task
+        context = self._trace.set_span_in_context(parent) if parent is not None else None
+        self._otel_spans[span.span_id] = self._tracer.start_span(
+            span.name,
+            context=context,
+            attributes=_otel_attributes(span.attributes),
+            start_time=int(span.start_time * 1e9),
+        )
+
+    def on_end(self, span: Span) -> None:
+        otel_span = self._otel_spans.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        otel_span.set_attributes(_otel_attributes(span.attributes))
+        if span.error is not None:
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.error))
+        otel_span.end(end_time=int(span.end_time * 1e9) if span.end_time else None)
+
+
+def _otel_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
+    return {k: v if isinstance(v, (str, bool, int, float)) else str(v) for k, v in attributes.items()}
+
+
+def create_processor(config: dict[str, Any]) -> SpanProcessor:
+    params = {key: value for key, value in config.items() if key != "type"}
+    processor_type = config.get("type")
+    if processor_type == "memory":
+        return InMemorySpanExporter(**params)
+    if processor_type == "file":
+        return FileSpanExporter(**params)
+    if processor_type == "opentelemetry":
+        return OpenTelemetrySpanProcessor(**params)
+    msg = f"Unsupported OpenLineage tracing exporter type: `{processor_type}`"
+    raise ValueError(msg)
+
+
+_default_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _default_tracer
+
+
+def span(name: str, parent: Span | None = None, **attributes: Any) -> _SpanScope | _NoopScope:
+    """Starts span of the default tracer, see `Tracer.span`."""
+    return _default_tracer.span(name, parent, **attributes)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
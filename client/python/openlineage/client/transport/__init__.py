@@ -2,24 +2,54 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-from openlineage.client.transport.composite import CompositeTransport
-from openlineage.client.transport.console import ConsoleTransport
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from openlineage.client.transport.factory import DefaultTransportFactory
-from openlineage.client.transport.file import FileTransport
-from openlineage.client.transport.http import HttpConfig, HttpTransport
-from openlineage.client.transport.kafka import KafkaConfig, KafkaTransport
-from openlineage.client.transport.msk_iam import MSKIAMConfig, MSKIAMTransport
-from openlineage.client.transport.noop import NoopTransport
 from openlineage.client.transport.transport import Config, Transport, TransportFactory
 
+if TYPE_CHECKING:
+    from openlineage.client.transport.circuit_breaker import CircuitBreakerConfig, CircuitBreakerTransport
+    from openlineage.client.transport.composite import CompositeTransport  # noqa: F401
+    from openlineage.client.transport.console import ConsoleTransport
+    from openlineage.client.transport.file import FileTransport  # noqa: F401
+    from openlineage.client.transport.http import HttpConfig, HttpTransport
+    from openlineage.client.transport.kafka import KafkaConfig, KafkaTransport
+    from openlineage.client.transport.msk_iam import MSKIAMConfig, MSKIAMTransport
+    from openlineage.client.transport.noop import NoopTransport
+    from openlineage.client.transport.spool import SpoolConfig, SpoolTransport
+
+# Built-in transports are registered by import path and their modules, pulling in dependencies like
+# requests or confluent-kafka, are imported only when transport of that type is created or accessed.
+_LAZY_ATTRIBUTES = {
+    "CircuitBreakerConfig": "circuit_breaker",
+    "CircuitBreakerTransport": "circuit_breaker",
+    "CompositeTransport": "composite",
+    "ConsoleTransport": "console",
+    "FileTransport": "file",
+    "HttpConfig": "http",
+    "HttpTransport": "http",
+    "KafkaConfig": "kafka",
+    "KafkaTransport": "kafka",
+    "MSKIAMConfig": "msk_iam",
+    "MSKIAMTransport": "msk_iam",
+    "NoopTransport": "noop",
+    "SpoolConfig": "spool",
+    "SpoolTransport": "spool",
+}
+
 _factory = DefaultTransportFactory()
-_factory.register_transport(CompositeTransport.kind, CompositeTransport)
-_factory.register_transport(HttpTransport.kind, HttpTransport)
-_factory.register_transport(KafkaTransport.kind, KafkaTransport)
-_factory.register_transport(MSKIAMTransport.kind, MSKIAMTransport)
-_factory.register_transport(ConsoleTransport.kind, ConsoleTransport)
-_factory.register_transport(NoopTransport.kind, NoopTransport)
-_factory.register_transport(FileTransport.kind, FileTransport)
+_factory.register_transport("composite", "openlineage.client.transport.composite.CompositeTransport")
+_factory.register_transport("http", "openlineage.client.transport.http.HttpTransport")
+_factory.register_transport("kafka", "openlineage.client.transport.kafka.KafkaTransport")
+_factory.register_transport("msk-iam", "openlineage.client.transport.msk_iam.MSKIAMTransport")
+_factory.register_transport("console", "openlineage.client.transport.console.ConsoleTransport")
+_factory.register_transport("noop", "openlineage.client.transport.noop.NoopTransport")
+_factory.register_transport("file", "openlineage.client.transport.file.FileTransport")
+_factory.register_transport("spool", "openlineage.client.transport.spool.SpoolTransport")
+_factory.register_transport(
+    "circuit-breaker", "openlineage.client.transport.circuit_breaker.CircuitBreakerTransport"
+)
 
 
 def get_default_factory() -> DefaultTransportFactory:
@@ -33,18 +63,32 @@ def register_transport(clazz: type[Transport]) -> type[Transport]:
     return clazz
 
 
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
+    "CircuitBreakerConfig",
+    "CircuitBreakerTransport",
     "Config",
-    "TransportFactory",
+    "ConsoleTransport",
     "HttpConfig",
     "HttpTransport",
     "KafkaConfig",
     "KafkaTransport",
-    "MSKIAMTransport",
     "MSKIAMConfig",
-    "ConsoleTransport",
+    "MSKIAMTransport",
     "NoopTransport",
+    "SpoolConfig",
+    "SpoolTransport",
     "Transport",
-    "register_transport",
+    "TransportFactory",
     "get_default_factory",
+    "register_transport",
 ]
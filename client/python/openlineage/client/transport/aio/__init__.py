@@ -0,0 +1,71 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from openlineage.client.transport.aio.factory import DefaultAsyncTransportFactory
+from openlineage.client.transport.aio.transport import (
+    AsyncTransport,
+    AsyncTransportFactory,
+    SyncTransportAdapter,
+)
+
+if TYPE_CHECKING:
+    from openlineage.client.transport.aio.composite import AsyncCompositeTransport
+    from openlineage.client.transport.aio.console import AsyncConsoleTransport
+    from openlineage.client.transport.aio.file import AsyncFileTransport
+    from openlineage.client.transport.aio.http import AsyncHttpTransport
+    from openlineage.client.transport.aio.noop import AsyncNoopTransport
+
+# Like sync transports, built-in async transports are registered by import path and imported on first use.
+_LAZY_ATTRIBUTES = {
+    "AsyncCompositeTransport": "composite",
+    "AsyncConsoleTransport": "console",
+    "AsyncFileTransport": "file",
+    "AsyncHttpTransport": "http",
+    "AsyncNoopTransport": "noop",
+}
+
+_factory = DefaultAsyncTransportFactory()
+_factory.register_transport("composite", "openlineage.client.transport.aio.composite.AsyncCompositeTransport")
+_factory.register_transport("http", "openlineage.client.transport.aio.http.AsyncHttpTransport")
+_factory.register_transport("console", "openlineage.client.transport.aio.console.AsyncConsoleTransport")
+_factory.register_transport("noop", "openlineage.client.transport.aio.noop.AsyncNoopTransport")
+_factory.register_transport("file", "openlineage.client.transport.aio.file.AsyncFileTransport")
+
+
+def get_default_async_factory() -> DefaultAsyncTransportFactory:
+    return _factory
+
+
+# decorator to wrap async transports with
+def register_async_transport(clazz: type[AsyncTransport]) -> type[AsyncTransport]:
+    assert clazz.kind is not None
+    _factory.register_transport(clazz.kind, clazz)
+    return clazz
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "AsyncCompositeTransport",
+    "AsyncConsoleTransport",
+    "AsyncFileTransport",
+    "AsyncHttpTransport",
+    "AsyncNoopTransport",
+    "AsyncTransport",
+    "AsyncTransportFactory",
+    "SyncTransportAdapter",
+    "get_default_async_factory",
+    "register_async_transport",
+]
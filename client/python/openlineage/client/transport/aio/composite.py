@@ -0,0 +1,87 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+import logging
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from openlineage.client.transport.aio.transport import AsyncTransport
+from openlineage.client.transport.composite import CompositeConfig
+
+if TYPE_CHECKING:
+    from openlineage.client.client import Event
+
+log = logging.getLogger(__name__)
+
+
+class AsyncCompositeTransport(AsyncTransport):
+    """
+    Emits events using multiple async transports, concurrently if `parallel` is set, otherwise one after
+    another. Emission by a transport that does not finish within `timeout` is cancelled and counted as failed.
+    """
+
+    kind = "composite"
+    config_class = CompositeConfig
+
+    def __init__(self, config: CompositeConfig) -> None:
+        self.config = config
+        log.debug(
+            "Constructing OpenLineage async composite transport with the following transports: %s",
+            [str(x) for x in self.transports],
+        )
+
+    @cached_property
+    def transports(self) -> list[AsyncTransport]:
+        """Create and return a list of transports based on the config."""
+        from openlineage.client.transport.aio import get_default_async_factory
+
+        config_transports = self.config.transports
+        if isinstance(config_transports, dict):
+            config_transports = [
+                {**config, "name": name} for name, config in config_transports.items() if config
+            ]
+        return [get_default_async_factory().create(config) for config in config_transports]
+
+    async def emit(self, event: Event) -> None:
+        """Emit an event using all transports in the config."""
+        if not self.config.parallel:
+            for transport in self.transports:
+                try:
+                    await self._emit_with(transport, event)
+                except Exception as e:  # noqa: BLE001
+                    self._handle_failure(transport, e)
+            return
+        results = await asyncio.gather(
+            *(self._emit_with(transport, event) for transport in self.transports), return_exceptions=True
+        )
+        for transport, result in zip(self.transports, results):
+            if isinstance(result, Exception):
+                self._handle_failure(transport, result)
+
+    async def _emit_with(self, transport: AsyncTransport, event: Event) -> None:
+        try:
+            await asyncio.wait_for(transport.emit(event), self.config.timeout)
+        except asyncio.TimeoutError:
+            msg = f"Transport {transport} did not emit event within {self.config.timeout} seconds"
+            raise TimeoutError(msg) from None
+
+    def _handle_failure(self, transport: AsyncTransport, error: Exception) -> None:
+        if self.config.continue_on_failure:
+            log.warning("Transport %s failed to emit event with error: %s", transport, error)
+        else:
+            msg = f"Transport {transport} failed to emit event"
+            raise RuntimeError(msg) from error
+
+    async def wait_for_completion(self, timeout: float | None = None) -> bool:
+        results = await asyncio.gather(
+            *(transport.wait_for_completion(timeout) for transport in self.transports), return_exceptions=True
+        )
+        return all(result is True for result in results)
+
+    async def close(self, timeout: float | None = None) -> bool:
+        results = await asyncio.gather(
+            *(transport.close(timeout) for transport in self.transports), return_exceptions=True
+        )
+        return all(result is True for result in results)
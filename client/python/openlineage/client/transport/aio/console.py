@@ -0,0 +1,27 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from openlineage.client.serde import Serde
+from openlineage.client.transport.aio.transport import AsyncTransport
+from openlineage.client.transport.console import ConsoleConfig
+
+if TYPE_CHECKING:
+    from openlineage.client.client import Event
+
+# events are logged to the same logger as in sync ConsoleTransport
+log = logging.getLogger("openlineage.client.transport.console")
+
+
+class AsyncConsoleTransport(AsyncTransport):
+    kind = "console"
+    config_class = ConsoleConfig
+
+    def __init__(self, config: ConsoleConfig) -> None:  # noqa: ARG002
+        log.debug("Constructing OpenLineage async transport that will send events to console or logs")
+
+    async def emit(self, event: Event) -> None:
+        log.info(Serde.to_json(event))
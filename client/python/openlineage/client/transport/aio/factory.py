@@ -0,0 +1,81 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import inspect
+import logging
+import os
+from typing import Any
+
+from openlineage.client.transport.aio.noop import AsyncNoopTransport
+from openlineage.client.transport.aio.transport import (
+    AsyncTransport,
+    AsyncTransportFactory,
+    SyncTransportAdapter,
+)
+from openlineage.client.transport.noop import NoopConfig
+from openlineage.client.transport.transport import Config
+from openlineage.client.utils import try_import_from_string
+
+log = logging.getLogger(__name__)
+
+
+class DefaultAsyncTransportFactory(AsyncTransportFactory):
+    def __init__(self) -> None:
+        self.transports: dict[str, type[AsyncTransport] | str] = {}
+
+    def register_transport(self, of_type: str, clazz: type[AsyncTransport] | str) -> None:
+        self.transports[of_type] = clazz
+
+    def create(self, config: dict[str, Any] | None = None) -> AsyncTransport:
+        """
+        Initializes and returns an async transport based on the provided configuration.
+
+        Follows DefaultTransportFactory: with 'OPENLINEAGE_DISABLED' set to 'true' AsyncNoopTransport
+        is returned, and without configuration events are printed to console.
+        Transport types without async counterpart are created by the sync factory and run in a worker thread.
+        """
+        if os.getenv("OPENLINEAGE_DISABLED", "").lower().strip() == "true":
+            log.info("OpenLineage is disabled. No events will be emitted.")
+            return AsyncNoopTransport(NoopConfig())
+
+        if config:
+            return self._create_transport(config)
+
+        # If no config is passed, log events to console
+        from openlineage.client.transport.aio.console import AsyncConsoleTransport
+        from openlineage.client.transport.console import ConsoleConfig
+
+        log.warning("Couldn't initialize OpenLineage transport; will print events to console.")
+        return AsyncConsoleTransport(ConsoleConfig())
+
+    def _create_transport(self, config: dict[str, Any]) -> AsyncTransport:
+        if "type" not in config:
+            msg = "You need to pass transport type in config."
+            raise TypeError(msg)
+        transport_type = config["type"]
+
+        transport_class_type_or_str = self.transports.get(transport_type, transport_type)
+        if isinstance(transport_class_type_or_str, str):
+            transport_class = try_import_from_string(transport_class_type_or_str)
+        else:
+            transport_class = transport_class_type_or_str
+
+        if not inspect.isclass(transport_class) or not issubclass(transport_class, AsyncTransport):
+            from openlineage.client.transport import get_default_factory
+
+            log.debug("No async transport for `%s`, sync transport will run in worker thread", transport_type)
+            return SyncTransportAdapter(get_default_factory().create(config))
+
+        transport_name = config.pop("name", None)
+        config_class = transport_class.config_class
+        if isinstance(config_class, str):
+            config_class = try_import_from_string(config_class)
+        if not inspect.isclass(config_class) or not issubclass(config_class, Config):
+            msg = f"Config {config_class} has to be class, and subclass of Config"
+            raise TypeError(msg)
+
+        transport: AsyncTransport = transport_class(config_class.from_dict(config))  # type: ignore[call-arg]
+        if transport_name and not transport.name:
+            transport.name = transport_name
+        return transport
@@ -0,0 +1,38 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from openlineage.client.transport.aio.transport import AsyncTransport
+from openlineage.client.transport.file import FileConfig, FileTransport
+
+if TYPE_CHECKING:
+    from openlineage.client.client import Event
+
+log = logging.getLogger(__name__)
+
+
+class AsyncFileTransport(AsyncTransport):
+    """
+    Writes events like FileTransport. As asyncio has no asynchronous file I/O,
+    serialization and writes run in a worker thread and don't block the event loop.
+    """
+
+    kind = "file"
+    config_class = FileConfig
+
+    def __init__(self, config: FileConfig) -> None:
+        self.config = config
+        self._transport = FileTransport(config)
+
+    async def emit(self, event: Event) -> None:
+        await asyncio.to_thread(self._transport.emit, event)
+
+    async def wait_for_completion(self, timeout: float | None = None) -> bool:
+        return await asyncio.to_thread(self._transport.wait_for_completion, timeout)
+
+    async def close(self, timeout: float | None = None) -> bool:
+        return await asyncio.to_thread(self._transport.close, timeout)
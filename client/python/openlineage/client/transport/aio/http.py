@@ -0,0 +1,151 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+from urllib.parse import urljoin
+
+from openlineage.client.serde import Serde
+from openlineage.client.transport.aio.transport import AsyncTransport
+from openlineage.client.transport.http import HttpConfig, HttpRequestMixin
+
+if TYPE_CHECKING:
+    import httpx
+    from openlineage.client.client import Event
+
+log = logging.getLogger(__name__)
+
+# same limit as urllib3.util.Retry.DEFAULT_BACKOFF_MAX
+BACKOFF_MAX = 120.0
+
+
+class AsyncHttpTransport(HttpRequestMixin, AsyncTransport):
+    """
+    Sends events to HTTP endpoint using `httpx`, configured by the same HttpConfig as HttpTransport.
+
+    Number of requests in flight is capped by `pool_maxsize`; further emits wait for a free slot.
+    Retries follow `total`, `backoff_factor` and `status_forcelist` keys of `retry` config.
+    `session`, `adapter`, `batch` and `deferred_retry` options apply only to sync HttpTransport.
+    """
+
+    kind = "http"
+    config_class = HttpConfig
+
+    def __init__(self, config: HttpConfig) -> None:
+        url = config.url.strip()
+        self._validate_url(url)
+        self.config = config
+        self.url = url
+        self.endpoint = config.endpoint
+        self.timeout = config.timeout
+        self.verify = config.verify
+        self.compression = config.compression
+        if config.session or config.adapter or config.batch or config.deferred_retry:
+            log.warning(
+                "`session`, `adapter`, `batch` and `deferred_retry` options are ignored "
+                "by async HTTP transport."
+            )
+        # httpx client and semaphore are bound to event loop they were first used in
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # closing clients of previous event loops, referenced until done
+        self._closing: set[asyncio.Future[None]] = set()
+        log.debug(
+            "Constructing OpenLineage async transport that will send events to HTTP endpoint `%s`",
+            urljoin(url, config.endpoint),
+        )
+
+    async def emit(self, event: Event) -> httpx.Response:
+        body, headers = self._prepare_request(Serde.to_json_bytes(event))
+        client, semaphore = self._get_client()
+        async with semaphore:
+            return await self._post(client, urljoin(self.url, self.endpoint), body, headers)
+
+    async def close(self, timeout: float | None = None) -> bool:
+        """Closes connections of the client. Returns False if they were not closed within timeout."""
+        client, self._client = self._client, None
+        if client is None:
+            return True
+        if self._loop is not asyncio.get_running_loop():
+            self._release_client(client, self._loop)
+            return True
+        try:
+            await asyncio.wait_for(client.aclose(), timeout)
+        except asyncio.TimeoutError:
+            log.warning("OpenLineage async HTTP transport was not closed within %s seconds", timeout)
+            return False
+        return True
+
+    def _get_client(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._semaphore is None or self._loop is not loop:
+            if self._client is not None:
+                self._release_client(self._client, self._loop)
+            self._client = self._create_client()
+            self._semaphore = asyncio.Semaphore(self.config.pool_maxsize)
+            self._loop = loop
+        return self._client, self._semaphore
+
+    def _release_client(self, client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+        """
+        Closes client bound to event loop other than the current one, without waiting. It's closed in its own
+        loop if that is still running, otherwise in the current one, failures are only logged.
+        """
+        future: asyncio.Future[None]
+        if loop is not None and loop.is_running():
+            future = asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+        else:
+            future = asyncio.ensure_future(client.aclose())
+        self._closing.add(future)
+        future.add_done_callback(self._client_released)
+
+    def _client_released(self, future: asyncio.Future[None]) -> None:
+        self._closing.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            log.debug("Failed to close HTTP client of previous event loop", exc_info=future.exception())
+
+    def _create_client(self) -> httpx.AsyncClient:
+        try:
+            import httpx
+        except ModuleNotFoundError:
+            log.exception(
+                "OpenLineage client did not found httpx module. "
+                "Installing it is required for AsyncHttpTransport to work. "
+                "You can also get it via `pip install openlineage-python[async]`",
+            )
+            raise
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.config.pool_maxsize,
+                max_keepalive_connections=self.config.pool_maxsize,
+            ),
+            # waiting for connection from pool is bounded by semaphore, not by timeout
+            timeout=httpx.Timeout(self.timeout, pool=None),
+            verify=self.verify,
+        )
+
+    async def _post(
+        self, client: httpx.AsyncClient, url: str, body: bytes | str, headers: dict[str, str]
+    ) -> httpx.Response:
+        import httpx
+
+        retries = int(self.config.retry.get("total") or 0)
+        backoff_factor = float(self.config.retry.get("backoff_factor") or 0)
+        status_forcelist = set(self.config.retry.get("status_forcelist") or [])
+        attempt = 0
+        while True:
+            try:
+                response = await client.post(url, content=body, headers=headers)
+                if response.status_code not in status_forcelist or attempt >= retries:
+                    response.raise_for_status()
+                    return response
+            except httpx.TransportError:
+                if attempt >= retries:
+                    raise
+            attempt += 1
+            # the same schedule as urllib3: no delay before first retry, then exponential
+            if attempt > 1 and backoff_factor:
+                await asyncio.sleep(min(BACKOFF_MAX, backoff_factor * (2 ** (attempt - 1))))
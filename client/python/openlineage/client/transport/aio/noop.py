@@ -0,0 +1,25 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from openlineage.client.transport.aio.transport import AsyncTransport
+from openlineage.client.transport.noop import NoopConfig
+
+if TYPE_CHECKING:
+    from openlineage.client.client import Event
+
+log = logging.getLogger(__name__)
+
+
+class AsyncNoopTransport(AsyncTransport):
+    kind = "noop"
+    config_class = NoopConfig
+
+    def __init__(self, config: NoopConfig) -> None:  # noqa: ARG002
+        log.debug("Constructing OpenLineage async transport that will NOT send any events.")
+
+    async def emit(self, event: Event) -> None:  # noqa: ARG002
+        return None
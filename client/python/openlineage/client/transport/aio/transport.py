@@ -0,0 +1,66 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Asyncio counterparts of transports, used by AsyncOpenLineageClient.
+
+To implement custom async transport, subclass AsyncTransport the same way as Transport
+(see `openlineage.client.transport.transport`), but with coroutine `emit` method.
+Sync transports without async counterpart are wrapped by SyncTransportAdapter,
+which runs them in a worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from openlineage.client.transport.transport import Config, Transport
+
+if TYPE_CHECKING:
+    from openlineage.client.client import Event
+
+
+class AsyncTransport:
+    kind: str | None = None
+    name: str | None = None
+    config_class: type[Config] = Config
+
+    async def emit(self, event: Event) -> Any:
+        raise NotImplementedError
+
+    async def wait_for_completion(self, timeout: float | None = None) -> bool:  # noqa: ARG002
+        """Delivers buffered events. Returns False if not everything was delivered within timeout."""
+        return True
+
+    async def close(self, timeout: float | None = None) -> bool:
+        """Flushes and releases resources held by transport."""
+        return await self.wait_for_completion(timeout)
+
+    def __str__(self) -> str:
+        return f"<{self.__class__.__name__}(name={self.name}, kind={self.kind})>"
+
+
+class SyncTransportAdapter(AsyncTransport):
+    """Runs blocking transport in a worker thread, so it does not block the event loop."""
+
+    def __init__(self, transport: Transport) -> None:
+        self.transport = transport
+        self.kind = transport.kind
+        self.name = transport.name
+
+    async def emit(self, event: Event) -> Any:
+        return await asyncio.to_thread(self.transport.emit, event)
+
+    async def wait_for_completion(self, timeout: float | None = None) -> bool:
+        return await asyncio.to_thread(self.transport.wait_for_completion, timeout)
+
+    async def close(self, timeout: float | None = None) -> bool:
+        return await asyncio.to_thread(self.transport.close, timeout)
+
+    def __str__(self) -> str:
+        return f"<{self.__class__.__name__}(transport={self.transport})>"
+
+
+class AsyncTransportFactory:
+    def create(self, config: dict[str, Any] | None = None) -> AsyncTransport:
+        raise NotImplementedError
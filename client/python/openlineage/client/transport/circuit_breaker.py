@@ -0,0 +1,246 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+"""
+CircuitBreakerTransport stops calling the wrapped transport while it keeps failing.
+
+The circuit starts closed, passing every event to the wrapped transport. It opens after `failure_threshold`
+consecutive failures, or when at least `failure_rate` of the last `window` emissions failed. While open,
+events are emitted to the `fallback` transport if one is configured, otherwise `CircuitOpenError` is raised
+right away, without waiting for connection timeouts of the unavailable backend. After `open_duration`
+seconds, the circuit is half-open: up to `half_open_probes` events are passed to the wrapped transport as
+probes. If all of them succeed, the circuit closes; a failing probe opens it again.
+
+The wrapped transport has to report delivery failures by raising from `emit`. HttpTransport with `batch` or
+`deferred_retry` delivers events in background and returns before knowing the outcome, so it's rejected.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+import attr
+from openlineage.client.metrics import counter, gauge, get_metrics_registry
+from openlineage.client.serde import Serde
+from openlineage.client.transport.transport import Config, Transport, supports_emit_serialized
+from openlineage.client.utils import get_only_specified_fields
+
+if TYPE_CHECKING:
+    from openlineage.client.client import Event
+    from openlineage.client.metrics import Metric
+
+log = logging.getLogger(__name__)
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of emitting an event while the circuit is open and there is no fallback transport."""
+
+
+@attr.s
+class CircuitBreakerConfig(Config):
+    # config of the wrapped transport
+    transport: dict[str, Any] = attr.ib()
+    # config of transport receiving events while the circuit is open, None raises CircuitOpenError instead
+    fallback: dict[str, Any] | None = attr.ib(default=None)
+    # consecutive failures opening the circuit
+    failure_threshold: int = attr.ib(default=5)
+    # fraction of failed emissions in the last `window` opening the circuit, None disables it
+    failure_rate: float | None = attr.ib(default=None)
+    window: int = attr.ib(default=20)
+    # emissions in the window needed before `failure_rate` is checked
+    min_calls: int = attr.ib(default=10)
+    # seconds the circuit stays open before probing the wrapped transport
+    open_duration: float = attr.ib(default=30.0)
+    # events passed to the wrapped transport when half-open; all have to succeed to close the circuit
+    half_open_probes: int = attr.ib(default=1)
+
+    @classmethod
+    def from_dict(cls, params: dict[str, Any]) -> CircuitBreakerConfig:
+        if not isinstance(params.get("transport"), dict):
+            msg = "circuit breaker `transport` config has to be passed to CircuitBreakerConfig as dict"
+            raise RuntimeError(msg)  # noqa: TRY004
+        return cls(**get_only_specified_fields(cls, params))
+
+
+class CircuitBreakerTransport(Transport):
+    kind = "circuit-breaker"
+    config_class = CircuitBreakerConfig
+
+    def __init__(self, config: CircuitBreakerConfig) -> None:
+        self.config = config
+        self.successes = 0
+        self.failures = 0
+        # events not passed to the wrapped transport because the circuit was open
+        self.short_circuited = 0
+        # short-circuited events emitted to the fallback transport
+        self.diverted = 0
+        # number of times the circuit opened
+        self.opened = 0
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._outcomes: deque[bool] = deque(maxlen=config.window)
+        self._opened_at = 0.0
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        self._lock = threading.Lock()
+        if getattr(self.transport, "batcher", None) or getattr(self.transport, "retry_scheduler", None):
+            msg = (
+                f"Circuit breaker can't wrap {self.transport}, which delivers events in background "
+                "with `batch` or `deferred_retry` and doesn't report failures"
+            )
+            raise ValueError(msg)
+        get_metrics_registry().register(self)
+        log.debug("Constructing OpenLineage circuit breaker transport wrapping %s", self.transport)
+
+    @cached_property
+    def transport(self) -> Transport:
+        from openlineage.client.transport import get_default_factory
+
+        return get_default_factory().create(dict(self.config.transport))
+
+    @cached_property
+    def fallback(self) -> Transport | None:
+        if self.config.fallback is None:
+            return None
+        from openlineage.client.transport import get_default_factory
+
+        return get_default_factory().create(dict(self.config.fallback))
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def collect_metrics(self) -> list[Metric]:
+        tags = (("transport", self.kind),)
+        return [
+            counter("circuit_breaker.successes", self.successes, tags),
+            counter("circuit_breaker.failures", self.failures, tags),
+            counter("circuit_breaker.short_circuited", self.short_circuited, tags),
+            counter("circuit_breaker.diverted", self.diverted, tags),
+            counter("circuit_breaker.opened", self.opened, tags),
+            # number of circuits not closed
+            gauge("circuit_breaker.open", int(self.state != CircuitState.CLOSED), tags),
+        ]
+
+    def emit(self, event: Event) -> Any:
+        return self._emit(event, None)
+
+    def emit_serialized(self, payload: bytes, event: Event) -> Any:
+        return self._emit(event, payload)
+
+    def wait_for_completion(self, timeout: float | None = None) -> bool:
+        result = self.transport.wait_for_completion(timeout)
+        if self.fallback is not None:
+            result = self.fallback.wait_for_completion(timeout) and result
+        return result
+
+    def close(self, timeout: float | None = None) -> bool:
+        result = self.transport.close(timeout)
+        if self.fallback is not None:
+            result = self.fallback.close(timeout) and result
+        return result
+
+    def _emit(self, event: Event, payload: bytes | None) -> Any:
+        with self._lock:
+            permitted = self._acquire_permission()
+        if not permitted:
+            return self._short_circuit(event, payload)
+        try:
+            result = _emit_with(self.transport, event, payload)
+        except Exception:
+            self._record(success=False)
+            raise
+        self._record(success=True)
+        return result
+
+    def _acquire_permission(self) -> bool:
+        # has to be called with lock held
+        self._update_state()
+        if self._state == CircuitState.CLOSED:
+            return True
+        if self._state == CircuitState.HALF_OPEN and self._probes_started < self.config.half_open_probes:
+            self._probes_started += 1
+            return True
+        return False
+
+    def _update_state(self) -> None:
+        # has to be called with lock held
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.config.open_duration
+        ):
+            log.info("OpenLineage circuit breaker half-open, probing %s", self.transport)
+            self._state = CircuitState.HALF_OPEN
+            self._probes_started = 0
+            self._probes_succeeded = 0
+
+    def _record(self, success: bool) -> None:
+        with self._lock:
+            if success:
+                self.successes += 1
+                self._consecutive_failures = 0
+            else:
+                self.failures += 1
+                self._consecutive_failures += 1
+            self._outcomes.append(success)
+
+            if self._state == CircuitState.HALF_OPEN:
+                if not success:
+                    self._open()
+                    return
+                self._probes_succeeded += 1
+                if self._probes_succeeded >= self.config.half_open_probes:
+                    log.info("OpenLineage circuit breaker closed, %s recovered", self.transport)
+                    self._state = CircuitState.CLOSED
+                    self._outcomes.clear()
+            elif self._state == CircuitState.CLOSED and not success and self._should_open():
+                self._open()
+
+    def _should_open(self) -> bool:
+        # has to be called with lock held
+        if self._consecutive_failures >= self.config.failure_threshold:
+            return True
+        if self.config.failure_rate is None or len(self._outcomes) < self.config.min_calls:
+            return False
+        return self._outcomes.count(False) / len(self._outcomes) >= self.config.failure_rate
+
+    def _open(self) -> None:
+        # has to be called with lock held
+        log.warning(
+            "OpenLineage circuit breaker opened after failures of %s, skipping it for %s seconds",
+            self.transport,
+            self.config.open_duration,
+        )
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self.opened += 1
+
+    def _short_circuit(self, event: Event, payload: bytes | None) -> Any:
+        self.short_circuited += 1
+        if self.fallback is None:
+            msg = f"Circuit breaker of {self.transport} is open"
+            raise CircuitOpenError(msg)
+        self.diverted += 1
+        return _emit_with(self.fallback, event, payload)
+
+
+def _emit_with(transport: Transport, event: Event, payload: bytes | None) -> Any:
+    if supports_emit_serialized(transport):
+        return transport.emit_serialized(Serde.to_json_bytes(event) if payload is None else payload, event)
+    return transport.emit(event)
@@ -4,15 +4,25 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 import attr
-from openlineage.client.transport.transport import Config, Transport
+from openlineage.client.metrics import counter, gauge, get_metrics_registry
+from openlineage.client.serde import Serde
+from openlineage.client.tracing import current_span, span
+from openlineage.client.transport.transport import Config, Transport, supports_emit_serialized
 from openlineage.client.utils import get_only_specified_fields
 
 if TYPE_CHECKING:
     from openlineage.client.client import Event
+    from openlineage.client.metrics import Metric
+    from openlineage.client.tracing import Span
 
 log = logging.getLogger(__name__)
 
@@ -34,10 +44,24 @@ class CompositeConfig(Config):
             all configured transports, regardless of whether any previous transport
             in the list failed to emit the event. If set to False, an error in one
             transport will halt the emission process for subsequent transports.
+
+        parallel:
+            If set to True, the event is emitted by all transports concurrently, each transport on
+            its own thread, so the slowest transport determines the latency instead of the sum of
+            all of them. With `continue_on_failure` set to False, an error is raised after all
+            transports finished or timed out.
+
+        timeout:
+            In parallel mode, maximum number of seconds to wait for each transport to emit the event.
+            A transport that did not finish in time is counted as failed, its emission continues in
+            the background and the transport is skipped, counted as failed, until it finishes.
+            None waits indefinitely.
     """
 
     transports: list[dict[str, Any]] | dict[str, dict[str, Any]] = attr.ib()
     continue_on_failure: bool = attr.ib(default=True)
+    parallel: bool = attr.ib(default=False)
+    timeout: float | None = attr.ib(default=None)
 
     @classmethod
     def from_dict(cls, params: dict[str, Any]) -> CompositeConfig:
@@ -48,6 +72,68 @@ class CompositeConfig(Config):
         return cls(**get_only_specified_fields(cls, params))
 
 
+class TransportStats:
+    """Emission counters and latency of a single child transport of CompositeTransport."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.emitted = 0
+        self.failed = 0
+        # included in `failed`
+        self.timed_out = 0
+        # included in `failed`, events not passed to transport still emitting previous one
+        self.skipped = 0
+        # seconds, over finished emissions
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def average_latency(self) -> float:
+        finished = self.emitted + self.failed - self.timed_out - self.skipped
+        return self.total_latency / finished if finished else 0.0
+
+    def record(self, latency: float | None, failed: bool) -> None:
+        """Records emission result. `latency` is None when emission timed out."""
+        with self._lock:
+            if failed:
+                self.failed += 1
+            else:
+                self.emitted += 1
+            if latency is None:
+                self.timed_out += 1
+            else:
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+
+    def record_skipped(self) -> None:
+        with self._lock:
+            self.failed += 1
+            self.skipped += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"<TransportStats(name={self.name}, emitted={self.emitted}, failed={self.failed}, "
+            f"timed_out={self.timed_out}, skipped={self.skipped}, "
+            f"average_latency={self.average_latency:.4f})>"
+        )
+
+
+class _LazyPayload:
+    """Serializes event on first request, shared by all transports emitting it."""
+
+    def __init__(self, event: Event, payload: bytes | None) -> None:
+        self.event = event
+        self.payload = payload
+        self._lock = threading.Lock()
+
+    def get(self) -> bytes:
+        with self._lock:
+            if self.payload is None:
+                self.payload = Serde.to_json_bytes(self.event)
+            return self.payload
+
+
 class CompositeTransport(Transport):
     """CompositeTransport is a transport class that emits events using multiple transports."""
 
@@ -57,10 +143,17 @@ class CompositeTransport(Transport):
     def __init__(self, config: CompositeConfig) -> None:
         """Initialize a CompositeTransport object."""
         self.config = config
+        # one single-thread executor per transport, so a hung transport doesn't hold up the others
+        self._executors: list[ThreadPoolExecutor] = []
+        self._executor_pid: int | None = None
+        # last emission of each transport in parallel mode
+        self._futures: list[Future[tuple[float, Exception | None]] | None] = []
+        self._executor_lock = threading.Lock()
         log.debug(
             "Constructing OpenLineage composite transport with the following transports: %s",
             [str(x) for x in self.transports],
         )
+        get_metrics_registry().register(self)
 
     @cached_property
     def transports(self) -> list[Transport]:
@@ -77,15 +170,145 @@ class CompositeTransport(Transport):
             transports.append(get_default_factory().create(transport_config))
         return transports
 
+    @cached_property
+    def stats(self) -> list[TransportStats]:
+        """Per-transport counters, in the same order as `transports`."""
+        return [TransportStats(transport.name or str(transport)) for transport in self.transports]
+
+    def collect_metrics(self) -> list[Metric]:
+        metrics = []
+        for stats in self.stats:
+            tags = (("transport", stats.name),)
+            metrics += [
+                counter("composite.emitted", stats.emitted, tags),
+                counter("composite.failed", stats.failed, tags),
+                counter("composite.timed_out", stats.timed_out, tags),
+                counter("composite.skipped", stats.skipped, tags),
+                counter("composite.latency_seconds", stats.total_latency, tags),
+                gauge("composite.max_latency_seconds", stats.max_latency, tags),
+                gauge("composite.average_latency_seconds", stats.average_latency, tags),
+            ]
+        return metrics
+
     def emit(self, event: Event) -> None:
         """Emit an event using all transports in the config."""
+        self._emit(event, None)
+
+    def emit_serialized(self, payload: bytes, event: Event) -> None:
+        self._emit(event, payload)
+
+    def _emit(self, event: Event, payload: bytes | None) -> None:
+        # Event is serialized at most once and the payload is shared by all transports accepting it.
+        lazy_payload = _LazyPayload(event, payload)
+        if self.config.parallel and len(self.transports) > 1:
+            self._emit_parallel(event, lazy_payload)
+            return
+        for transport, stats in zip(self.transports, self.stats):
+            log.debug("Emitting event using transport %s", transport)
+            start = time.monotonic()
+            try:
+                _emit_with(transport, event, lazy_payload)
+            except Exception as e:  # noqa: BLE001
+                stats.record(time.monotonic() - start, failed=True)
+                self._handle_failure(transport, e)
+            else:
+                stats.record(time.monotonic() - start, failed=False)
+
+    def _emit_parallel(self, event: Event, lazy_payload: _LazyPayload) -> None:
+        executors = self._get_executors()
+        # executor threads continue the trace of the emitting thread
+        parent = current_span()
+        errors: list[tuple[Transport, Exception]] = []
+        futures: list[Future[tuple[float, Exception | None]] | None] = []
+        for i, (transport, stats) in enumerate(zip(self.transports, self.stats)):
+            previous = self._futures[i]
+            if previous is not None and not previous.done():
+                # don't queue events behind emission that timed out, it may never finish
+                stats.record_skipped()
+                msg = f"Transport {transport} is still emitting previous event"
+                errors.append((transport, TimeoutError(msg)))
+                futures.append(None)
+                continue
+            submitted = executors[i].submit(_timed_emit_with, transport, event, lazy_payload, parent)
+            self._futures[i] = submitted
+            futures.append(submitted)
+        wait_for_futures([future for future in futures if future], timeout=self.config.timeout)
+        for transport, stats, future in zip(self.transports, self.stats, futures):
+            if future is None:
+                continue
+            if not future.done():
+                stats.record(None, failed=True)
+                msg = f"Transport {transport} did not emit event within {self.config.timeout} seconds"
+                errors.append((transport, TimeoutError(msg)))
+                continue
+            latency, error = future.result()
+            stats.record(latency, failed=error is not None)
+            if error is not None:
+                errors.append((transport, error))
+        for transport, error in errors:
+            self._handle_failure(transport, error)
+
+    def _handle_failure(self, transport: Transport, error: Exception) -> None:
+        if self.config.continue_on_failure:
+            log.warning("Transport %s failed to emit event with error: %s", transport, error)
+        else:
+            msg = f"Transport {transport} failed to emit event"
+            raise RuntimeError(msg) from error
+
+    def _get_executors(self) -> list[ThreadPoolExecutor]:
+        with self._executor_lock:
+            # executor threads do not survive fork
+            if not self._executors or self._executor_pid != os.getpid():
+                self._executors = [
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"openlineage-composite-{i}")
+                    for i in range(len(self.transports))
+                ]
+                self._futures = [None] * len(self.transports)
+                self._executor_pid = os.getpid()
+            return self._executors
+
+    def wait_for_completion(self, timeout: float | None = None) -> bool:
+        """Wait for all child transports, sharing the timeout between them."""
+        return self._call_children("wait_for_completion", timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Close all child transports, sharing the timeout between them."""
+        result = self._call_children("close", timeout)
+        with self._executor_lock:
+            if self._executor_pid == os.getpid():
+                for executor in self._executors:
+                    executor.shutdown(wait=False)
+            self._executors = []
+        return result
+
+    def _call_children(self, method: str, timeout: float | None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        result = True
         for transport in self.transports:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
             try:
-                log.debug("Emitting event using transport %s", transport)
-                transport.emit(event)
+                result = getattr(transport, method)(remaining) and result
             except Exception as e:  # noqa: BLE001
-                if self.config.continue_on_failure:
-                    log.warning("Transport %s failed to emit event with error: %s", transport, e)
-                else:
-                    msg = f"Transport {transport} failed to emit event"
-                    raise RuntimeError(msg) from e
+                log.warning("Transport %s failed to %s with error: %s", transport, method, e)
+                result = False
+        return result
+
+
+def _emit_with(transport: Transport, event: Event, lazy_payload: _LazyPayload) -> None:
+    if supports_emit_serialized(transport):
+        transport.emit_serialized(lazy_payload.get(), event)
+    else:
+        transport.emit(event)
+
+
+def _timed_emit_with(
+    transport: Transport, event: Event, lazy_payload: _LazyPayload, parent: Span | None
+) -> tuple[float, Exception | None]:
+    log.debug("Emitting event using transport %s", transport)
+    start = time.monotonic()
+    try:
+        with span("composite.emit", parent=parent, transport=transport.kind):
+            _emit_with(transport, event, lazy_payload)
+    except Exception as e:  # noqa: BLE001
+        return time.monotonic() - start, e
+    return time.monotonic() - start, None
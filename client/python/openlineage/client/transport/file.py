@@ -3,25 +3,56 @@
 
 from __future__ import annotations
 
+import gzip
 import io
 import logging
+import os
+import shutil
+import threading
+import time
+import weakref
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from openlineage.client.metrics import counter, get_metrics_registry
 from openlineage.client.serde import Serde
 from openlineage.client.transport.transport import Config, Transport
+from openlineage.client.utils import ExitStage, register_exit_hook
 
 if TYPE_CHECKING:
     from openlineage.client.client import Event
+    from openlineage.client.metrics import Metric
 
 log = logging.getLogger(__name__)
 
 
+class FileCompression(Enum):
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    def __str__(self) -> str:
+        return self.value
+
+
 @dataclass
 class FileConfig(Config):
     log_file_path: str
     append: bool = False
+    # Keep `log_file_path` open and append events to it as NDJSON through a buffer.
+    # Options below apply only in this mode.
+    keep_open: bool = False
+    # rotate file after it reaches this size in bytes
+    rotate_bytes: int | None = None
+    # rotate file after it was written to for this many seconds
+    rotate_interval: float | None = None
+    # compression of rotated files
+    compression: FileCompression | None = None
+    # max seconds events are kept in the buffer before written to the file
+    flush_interval: float = 1.0
+    # buffer is written to the file when it grows over this size in bytes
+    buffer_size: int = 64 * 1024
 
     @classmethod
     def from_dict(cls, params: dict[str, Any]) -> FileConfig:
@@ -29,7 +60,17 @@ class FileConfig(Config):
             msg = "`log_file_path` key not passed to FileConfig"
             raise RuntimeError(msg)
 
-        return cls(log_file_path=params["log_file_path"], append=params.get("append", False))
+        compression = params.get("compression")
+        return cls(
+            log_file_path=params["log_file_path"],
+            append=params.get("append", False),
+            keep_open=params.get("keep_open", False),
+            rotate_bytes=params.get("rotate_bytes"),
+            rotate_interval=params.get("rotate_interval"),
+            compression=FileCompression(compression) if compression else None,
+            flush_interval=params.get("flush_interval", 1.0),
+            buffer_size=params.get("buffer_size", 64 * 1024),
+        )
 
 
 class FileTransport(Transport):
@@ -38,6 +79,10 @@ class FileTransport(Transport):
 
     def __init__(self, config: FileConfig) -> None:
         self.config = config
+        self.writer = NdjsonFileWriter(config) if config.keep_open else None
+        # size of written events, before compression of rotated files
+        self.serialized_bytes = 0
+        get_metrics_registry().register(self)
         log.debug(
             "Constructing OpenLineage transport that will send events "
             "to file(s) using the following config: %s",
@@ -45,6 +90,14 @@ class FileTransport(Transport):
         )
 
     def emit(self, event: Event) -> None:
+        self.emit_serialized(Serde.to_json_bytes(event), event)
+
+    def emit_serialized(self, payload: bytes, event: Event) -> None:  # noqa: ARG002
+        self.serialized_bytes += len(payload)
+        if self.writer:
+            self.writer.write(payload)
+            return
+
         if self.config.append:
             log_file_path = self.config.log_file_path
         else:
@@ -53,9 +106,212 @@ class FileTransport(Transport):
 
         log.debug("Openlineage event will be emitted to file: `%s`", log_file_path)
         try:
-            with open(log_file_path, "a" if self.config.append else "w") as log_file_handle:
-                log_file_handle.write(Serde.to_json(event) + "\n")
+            with open(log_file_path, "ab" if self.config.append else "wb") as log_file_handle:
+                log_file_handle.write(payload + b"\n")
         except (PermissionError, io.UnsupportedOperation) as error:
             # If we lack write permissions or file is opened in wrong mode
             msg = f"Log file `{log_file_path}` is not writeable"
             raise RuntimeError(msg) from error
+
+    def collect_metrics(self) -> list[Metric]:
+        return [counter("transport.serialized_bytes", self.serialized_bytes, (("transport", self.kind),))]
+
+    def wait_for_completion(self, timeout: float | None = None) -> bool:
+        if self.writer:
+            return self.writer.flush(timeout)
+        return True
+
+    def close(self, timeout: float | None = None) -> bool:
+        if self.writer:
+            return self.writer.close(timeout)
+        return True
+
+
+class NdjsonFileWriter:
+    """
+    Appends events to a file held open, one JSON per line, through an in-memory buffer.
+
+    Buffer is written when it exceeds `buffer_size`, when `flush_interval` passed since the first buffered
+    event (also by a background thread when no events follow), on flush and on close. Writes happen
+    in whole lines with files opened in append mode. After rotation, the file is renamed
+    to `{log_file_path}-{datetime}` and compressed in a background thread if configured.
+    """
+
+    def __init__(self, config: FileConfig) -> None:
+        self.config = config
+        self.rotated_files: list[str] = []
+        # checked up front, not when the first rotated file is compressed
+        self._zstandard = _import_zstandard() if config.compression == FileCompression.ZSTD else None
+        self._closed = False
+        self._init_state()
+        _live_writers.add(self)
+
+    def _init_state(self) -> None:
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._buffer = bytearray()
+        self._buffered_since: float | None = None
+        self._fd: int | None = None
+        self._file_size = 0
+        self._opened_at = 0.0
+        self._flusher: threading.Thread | None = None
+        self._compressors: list[threading.Thread] = []
+
+    def write(self, payload: bytes) -> None:
+        if self._pid != os.getpid():
+            # Buffer and descriptor are copies of the parent's: writing them would duplicate its events.
+            if self._fd is not None:
+                os.close(self._fd)
+            self._init_state()
+        with self._lock:
+            if self._closed:
+                log.warning("OpenLineage file transport is closed, dropping event.")
+                return
+            if self._buffered_since is None:
+                self._buffered_since = time.monotonic()
+                self._ensure_flusher()
+            self._buffer += payload
+            self._buffer += b"\n"
+            if (
+                len(self._buffer) >= self.config.buffer_size
+                or time.monotonic() - self._buffered_since >= self.config.flush_interval
+            ):
+                self._write_buffer()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Writes buffered events to the file and waits for compression of rotated files."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            if self._pid == os.getpid():
+                self._write_buffer()
+            compressors = list(self._compressors)
+        for thread in compressors:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        return not any(thread.is_alive() for thread in compressors)
+
+    def close(self, timeout: float | None = None) -> bool:
+        with self._lock:
+            if self._closed:
+                return True
+            self._closed = True
+            self._wakeup.notify_all()
+        result = self.flush(timeout)
+        with self._lock:
+            if self._fd is not None and self._pid == os.getpid():
+                os.close(self._fd)
+            self._fd = None
+        return result
+
+    def _write_buffer(self) -> None:
+        # has to be called with lock held
+        if not self._buffer:
+            return
+        try:
+            if self._fd is not None and self._should_rotate():
+                self._rotate()
+            if self._fd is None:
+                self._open()
+            view = memoryview(self._buffer)
+            while view:
+                view = view[os.write(self._fd, view) :]  # type: ignore[arg-type]
+        except OSError as error:
+            msg = f"Log file `{self.config.log_file_path}` is not writeable"
+            raise RuntimeError(msg) from error
+        self._file_size += len(self._buffer)
+        self._buffer = bytearray()
+        self._buffered_since = None
+
+    def _should_rotate(self) -> bool:
+        if (
+            self.config.rotate_bytes is not None
+            and self._file_size + len(self._buffer) > self.config.rotate_bytes
+        ):
+            return self._file_size > 0
+        if self.config.rotate_interval is not None:
+            return time.monotonic() - self._opened_at >= self.config.rotate_interval
+        return False
+
+    def _open(self) -> None:
+        self._fd = os.open(self.config.log_file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._file_size = os.fstat(self._fd).st_size
+        self._opened_at = time.monotonic()
+
+    def _rotate(self) -> None:
+        os.close(self._fd)  # type: ignore[arg-type]
+        self._fd = None
+        rotated_path = f"{self.config.log_file_path}-{datetime.now().strftime('%Y%m%d-%H%M%S.%f')}"
+        try:
+            os.rename(self.config.log_file_path, rotated_path)
+        except FileNotFoundError:
+            # rotated by another process
+            return
+        if self.config.compression is None:
+            self.rotated_files.append(rotated_path)
+            return
+        thread = threading.Thread(
+            target=self._compress, args=(rotated_path,), name="openlineage-file-compressor", daemon=True
+        )
+        self._compressors = [t for t in self._compressors if t.is_alive()] + [thread]
+        thread.start()
+
+    def _compress(self, path: str) -> None:
+        compressed_path = f"{path}.{'gz' if self.config.compression == FileCompression.GZIP else 'zst'}"
+        try:
+            with open(path, "rb") as source, open(compressed_path + ".tmp", "wb") as target:
+                if self.config.compression == FileCompression.GZIP:
+                    with gzip.GzipFile(fileobj=target, mode="wb") as gzip_target:
+                        shutil.copyfileobj(source, gzip_target)
+                else:
+                    self._zstandard.ZstdCompressor().copy_stream(source, target)
+            os.replace(compressed_path + ".tmp", compressed_path)
+            os.remove(path)
+            self.rotated_files.append(compressed_path)
+        except Exception:
+            log.exception("Failed to compress rotated OpenLineage events file `%s`", path)
+
+    def _ensure_flusher(self) -> None:
+        # has to be called with lock held
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(
+                target=self._run_flusher, name="openlineage-file-flusher", daemon=True
+            )
+            self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        with self._lock:
+            while not self._closed:
+                if self._buffered_since is None:
+                    self._wakeup.wait(self.config.flush_interval)
+                    continue
+                remaining = self._buffered_since + self.config.flush_interval - time.monotonic()
+                if remaining > 0:
+                    self._wakeup.wait(remaining)
+                    continue
+                try:
+                    self._write_buffer()
+                except RuntimeError:
+                    log.exception("Failed to write OpenLineage events to `%s`", self.config.log_file_path)
+                    # retried after the interval, not in a busy loop
+                    self._wakeup.wait(self.config.flush_interval)
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ModuleNotFoundError:
+        log.exception("OpenLineage file compression `zstd` requires `zstandard` package to be installed")
+        raise
+    return zstandard
+
+
+_live_writers: weakref.WeakSet[NdjsonFileWriter] = weakref.WeakSet()
+
+
+def _close_live_writers() -> None:
+    for writer in list(_live_writers):
+        if not writer._closed and writer._pid == os.getpid():  # noqa: SLF001
+            writer.close()
+
+
+register_exit_hook(_close_live_writers, ExitStage.TRANSPORTS)
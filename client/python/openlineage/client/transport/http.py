@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import gzip
+import heapq
 import inspect
+import itertools
 import logging
+import os
+import random
+import threading
+import time
 import warnings
+import weakref
+from collections import deque
 from enum import Enum
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 from urllib.parse import urljoin
 
 import attr
@@ -15,22 +23,31 @@ import urllib3.util
 
 if TYPE_CHECKING:
     from openlineage.client.client import Event, OpenLineageClientOptions
+    from openlineage.client.metrics import Metric
     from requests import Response
 
 import http.client as http_client
 
+from openlineage.client.metrics import counter, gauge, get_metrics_registry
 from openlineage.client.serde import Serde
 from openlineage.client.transport.transport import Config, Transport
-from openlineage.client.utils import get_only_specified_fields, try_import_from_string
+from openlineage.client.utils import (
+    ExitStage,
+    get_only_specified_fields,
+    import_from_string,
+    register_exit_hook,
+    try_import_from_string,
+)
 from requests import Session
 from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import HTTPError, Timeout
 
 log = logging.getLogger(__name__)
 
 
 class TokenProvider:
-    def __init__(self, config: dict[str, str]) -> None:
-        ...
+    def __init__(self, config: dict[str, str]) -> None: ...
 
     def get_bearer(self) -> str | None:
         return None
@@ -70,6 +87,78 @@ def create_token_provider(auth: dict[str, str]) -> TokenProvider:
     return TokenProvider({})
 
 
+class HttpBatchFormat(Enum):
+    # events sent as single JSON array
+    JSON = "json"
+    # events sent as newline delimited JSON
+    NDJSON = "ndjson"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@attr.s
+class HttpBatchConfig:
+    # endpoint accepting batches of events, appended to `url`
+    endpoint: str = attr.ib(default="api/v1/lineage/batch")
+    # maximum number of events sent in single request
+    max_events: int = attr.ib(default=100)
+    # maximum size of uncompressed request body in bytes
+    max_bytes: int = attr.ib(default=1024 * 1024)
+    # maximum number of seconds an event waits in the batch before it is sent
+    max_linger: float = attr.ib(default=1.0)
+    format: HttpBatchFormat = attr.ib(default=HttpBatchFormat.JSON, converter=HttpBatchFormat)
+    # callable, or its import path, receiving HttpBatchResult of every sent batch
+    on_batch_result: Callable[[HttpBatchResult], Any] | None = attr.ib(default=None)
+
+    @classmethod
+    def from_dict(cls, params: dict[str, Any]) -> HttpBatchConfig:
+        specified_dict = get_only_specified_fields(cls, params)
+        if isinstance(specified_dict.get("on_batch_result"), str):
+            specified_dict["on_batch_result"] = import_from_string(specified_dict["on_batch_result"])
+        return cls(**specified_dict)
+
+
+@attr.s
+class HttpDeferredRetryConfig:
+    # maximum number of attempts of sending single request, including the first one
+    max_attempts: int = attr.ib(default=5)
+    # seconds before first retry, multiplied by `multiplier` for each next one up to `max_backoff`
+    initial_backoff: float = attr.ib(default=0.5)
+    multiplier: float = attr.ib(default=2.0)
+    max_backoff: float = attr.ib(default=30.0)
+    # fraction of the backoff that is randomized, 0 disables jitter
+    jitter: float = attr.ib(default=0.5)
+    # seconds since the first attempt after which request is given up
+    max_age: float = attr.ib(default=300.0)
+    # maximum number of requests waiting for retry, requests over the budget are given up
+    budget: int = attr.ib(default=1000)
+    # HTTP status codes that are retried, in addition to connection errors and timeouts
+    status_forcelist: list[int] = attr.ib(factory=lambda: [429, 500, 502, 503, 504])
+
+    @classmethod
+    def from_dict(cls, params: dict[str, Any]) -> HttpDeferredRetryConfig:
+        return cls(**get_only_specified_fields(cls, params))
+
+
+@attr.s
+class HttpBatchResult:
+    """
+    Outcome of sending a single batch. `failed` holds (index in batch, error) pairs.
+    `deferred` is set when the batch failed and was handed over to the retry scheduler.
+    """
+
+    size: int = attr.ib()
+    response: Response | None = attr.ib(default=None)
+    failed: list[tuple[int, str]] = attr.ib(factory=list)
+    error: Exception | None = attr.ib(default=None)
+    deferred: bool = attr.ib(default=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.failed
+
+
 def get_session() -> Session:
     from requests import Session
 
@@ -102,6 +191,14 @@ class HttpConfig(Config):
             "allowed_methods": ["HEAD", "POST"],
         }
     )
+    # send events in batches to batch endpoint instead of one request per event
+    batch: HttpBatchConfig | None = attr.ib(default=None)
+    # number of connection pools (hosts) cached by the transport's session
+    pool_connections: int = attr.ib(default=10)
+    # maximum number of connections kept open to a single host
+    pool_maxsize: int = attr.ib(default=10)
+    # retry failed requests in background instead of blocking the emitting thread, replaces `retry`
+    deferred_retry: HttpDeferredRetryConfig | None = attr.ib(default=None)
 
     @classmethod
     def from_dict(cls, params: dict[str, Any]) -> HttpConfig:
@@ -113,6 +210,12 @@ class HttpConfig(Config):
         compression = specified_dict.get("compression")
         if compression:
             specified_dict["compression"] = HttpCompression(compression)
+        if isinstance(specified_dict.get("batch"), dict):
+            specified_dict["batch"] = HttpBatchConfig.from_dict(specified_dict["batch"])
+        if isinstance(specified_dict.get("deferred_retry"), dict):
+            specified_dict["deferred_retry"] = HttpDeferredRetryConfig.from_dict(
+                specified_dict["deferred_retry"]
+            )
         return cls(**specified_dict)
 
     @classmethod
@@ -132,20 +235,14 @@ class HttpConfig(Config):
         )
 
 
-class HttpTransport(Transport):
-    kind = "http"
-    config_class = HttpConfig
+class HttpRequestMixin:
+    """Preparation of HTTP requests shared by sync and async HTTP transports."""
 
-    def __init__(self, config: HttpConfig) -> None:
-        url = config.url.strip()
-        self.config = config
+    config: HttpConfig
+    compression: HttpCompression | None
 
-        log.debug(
-            "Constructing OpenLineage transport that will send events "
-            "to HTTP endpoint `%s` using the following config: %s",
-            urljoin(url, config.endpoint),
-            config,
-        )
+    @staticmethod
+    def _validate_url(url: str) -> None:
         try:
             from urllib3.util import parse_url
 
@@ -157,52 +254,166 @@ class HttpTransport(Transport):
             if not (parsed.scheme and parsed.netloc):
                 msg = f"Need valid url for OpenLineageClient, passed {url}"
                 raise ValueError(msg)
+
+    def _auth_headers(self, token_provider: TokenProvider) -> dict:  # type: ignore[type-arg]
+        bearer = token_provider.get_bearer()
+        if bearer:
+            return {"Authorization": bearer}
+        return {}
+
+    def _prepare_request(
+        self, event_str: str | bytes, content_type: str = "application/json"
+    ) -> tuple[bytes | str, dict[str, str]]:
+        headers = {
+            "Content-Type": content_type,
+            **self._auth_headers(self.config.auth),
+            **self.config.custom_headers,
+        }
+        if self.compression == HttpCompression.GZIP:
+            headers["Content-Encoding"] = "gzip"
+            if isinstance(event_str, str):
+                event_str = event_str.encode("utf-8")
+            return gzip.compress(event_str), headers
+
+        return event_str, headers
+
+
+class HttpTransport(HttpRequestMixin, Transport):
+    kind = "http"
+    config_class = HttpConfig
+
+    def __init__(self, config: HttpConfig) -> None:
+        url = config.url.strip()
+        self.config = config
+
+        log.debug(
+            "Constructing OpenLineage transport that will send events "
+            "to HTTP endpoint `%s` using the following config: %s",
+            urljoin(url, config.endpoint),
+            config,
+        )
+        self._validate_url(url)
         self.url = url
         self.endpoint = config.endpoint
         self.session = None
         if config.session:
             self.session = config.session
             self._prepare_session(self.session)
+        # Session owned by transport when none is passed in config. It is kept open between events to reuse
+        # connections, and recreated in forked processes, as connections can't be shared between processes.
+        self._owned_session: Session | None = None
+        self._owned_session_pid: int | None = None
+        self._session_lock = threading.Lock()
+        _live_transports.add(self)
         self.timeout = config.timeout
         self.verify = config.verify
         self.compression = config.compression
-
-    def emit(self, event: Event) -> Response:
+        self.retry_scheduler = (
+            HttpRetryScheduler(self, config.deferred_retry) if config.deferred_retry else None
+        )
+        self.batcher = HttpBatcher(self, config.batch) if config.batch else None
+        # size of emitted events before compression
+        self.serialized_bytes = 0
+        get_metrics_registry().register(self)
+
+    def emit(self, event: Event) -> Response | None:
+        return self.emit_serialized(Serde.to_json_bytes(event), event)
+
+    def emit_serialized(self, payload: bytes, event: Event) -> Response | None:  # noqa: ARG002
+        self.serialized_bytes += len(payload)
+        if self.batcher:
+            self.batcher.add(payload)
+            return None
+        body, headers = self._prepare_request(payload)
+        return self._post_or_defer(urljoin(self.url, self.endpoint), body, headers)
+
+    def collect_metrics(self) -> list[Metric]:
+        tags = (("transport", self.kind),)
+        metrics = [counter("transport.serialized_bytes", self.serialized_bytes, tags)]
+        if self.batcher:
+            metrics += [
+                counter("http.batch.sent", self.batcher.batches_sent, tags),
+                counter("http.batch.events_sent", self.batcher.events_sent, tags),
+                counter("http.batch.events_failed", self.batcher.events_failed, tags),
+                gauge("http.batch.buffered_bytes", self.batcher.buffered_bytes, tags),
+            ]
+        if self.retry_scheduler:
+            metrics += [
+                counter("http.retry.retries", self.retry_scheduler.retries, tags),
+                counter("http.retry.succeeded", self.retry_scheduler.succeeded, tags),
+                counter("http.retry.given_up", self.retry_scheduler.given_up, tags),
+                gauge("http.retry.pending", self.retry_scheduler.pending, tags),
+                # seconds from first failed attempt until successful retry
+                counter("http.retry.latency_seconds", self.retry_scheduler.total_retry_latency, tags),
+                gauge("http.retry.max_latency_seconds", self.retry_scheduler.max_retry_latency, tags),
+                gauge("http.retry.average_latency_seconds", self.retry_scheduler.average_retry_latency, tags),
+            ]
+        return metrics
+
+    def wait_for_completion(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        result = self.batcher.flush(timeout) if self.batcher else True
+        if self.retry_scheduler:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            result = self.retry_scheduler.flush(remaining) and result
+        return result
+
+    def close(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        result = self.batcher.close(timeout) if self.batcher else True
+        if self.retry_scheduler:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            result = self.retry_scheduler.close(remaining) and result
+        with self._session_lock:
+            if self._owned_session is not None and self._owned_session_pid == os.getpid():
+                self._owned_session.close()
+            self._owned_session = None
+        return result
+
+    def _get_session(self) -> Session:
+        if self.session:
+            return self.session
+        pid = os.getpid()
+        with self._session_lock:
+            if self._owned_session is None or self._owned_session_pid != pid:
+                session = Session()
+                self._prepare_session(session)
+                self._owned_session = session
+                self._owned_session_pid = pid
+            return self._owned_session
+
+    def _post_or_defer(self, url: str, body: bytes | str, headers: dict[str, str]) -> Response | None:
+        """Posts request. Returns None if it failed and will be retried by the retry scheduler."""
+        if not self.retry_scheduler:
+            return self._post(url, body, headers)
+        try:
+            return self._post(url, body, headers)
+        except Exception as e:
+            if not self.retry_scheduler.is_retryable(e):
+                raise
+            log.debug("Failed to send OpenLineage request, deferring retry: %s", e)
+            self.retry_scheduler.schedule(url, body, headers)
+            return None
+
+    def _post(self, url: str, body: bytes | str, headers: dict[str, str]) -> Response:
         # If anyone overrides debuglevel manually, we can potentially leak secrets to logs.
         # Override this setting to make sure it does not happen.
         prev_debuglevel = http_client.HTTPConnection.debuglevel
         http_client.HTTPConnection.debuglevel = 0
-        body, headers = self._prepare_request(Serde.to_json(event))
 
-        if self.session:
-            resp = self.session.post(
-                url=urljoin(self.url, self.endpoint),
+        try:
+            resp = self._get_session().post(
+                url=url,
                 data=body,
                 headers=headers,
                 timeout=self.timeout,
                 verify=self.verify,
             )
-        else:
-            with Session() as session:
-                self._prepare_session(session)
-                resp = session.post(
-                    url=urljoin(self.url, self.endpoint),
-                    data=body,
-                    headers=headers,
-                    timeout=self.timeout,
-                    verify=self.verify,
-                )
-            resp.close()
-        http_client.HTTPConnection.debuglevel = prev_debuglevel
+        finally:
+            http_client.HTTPConnection.debuglevel = prev_debuglevel
         resp.raise_for_status()
         return resp
 
-    def _auth_headers(self, token_provider: TokenProvider) -> dict:  # type: ignore[type-arg]
-        bearer = token_provider.get_bearer()
-        if bearer:
-            return {"Authorization": bearer}
-        return {}
-
     def _prepare_session(self, session: Session) -> None:
         if self.config.adapter:
             session.mount(self.url, self.config.adapter)
@@ -210,17 +421,390 @@ class HttpTransport(Transport):
             session.mount(self.url, self._prepare_adapter())
 
     def _prepare_adapter(self) -> HTTPAdapter:
-        retry = urllib3.util.Retry(**self.config.retry)
-        return HTTPAdapter(max_retries=retry)
+        # with deferred retries, failed request is handed over to retry scheduler right away
+        retry = (
+            urllib3.util.Retry(0) if self.config.deferred_retry else urllib3.util.Retry(**self.config.retry)
+        )
+        return HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            max_retries=retry,
+        )
 
-    def _prepare_request(self, event_str: str) -> tuple[bytes | str, dict[str, str]]:
-        headers = {
-            "Content-Type": "application/json",
-            **self._auth_headers(self.config.auth),
-            **self.config.custom_headers,
-        }
-        if self.compression == HttpCompression.GZIP:
-            headers["Content-Encoding"] = "gzip"
-            return gzip.compress(event_str.encode("utf-8")), headers
 
-        return event_str, headers
+class HttpBatcher:
+    """
+    Collects serialized events and sends them to the batch endpoint of HttpTransport.
+
+    A batch is sent when it reaches `max_events` or `max_bytes`, or when its oldest event waited
+    `max_linger` seconds. Full batches are sent on the emitting thread, lingering ones by a daemon thread.
+    Outcome of every batch is passed to `on_batch_result` callback, if set. Events added after the batcher
+    is closed are sent right away, one per batch. Forked child process starts with an empty buffer,
+    events buffered in the parent are sent by the parent.
+    """
+
+    def __init__(self, transport: HttpTransport, config: HttpBatchConfig) -> None:
+        if config.max_events <= 0 or config.max_bytes <= 0:
+            msg = "`max_events` and `max_bytes` of HTTP batch config have to be positive"
+            raise ValueError(msg)
+        self.transport = transport
+        self.config = config
+        self.url = urljoin(transport.url, config.endpoint)
+        self.on_batch_result: Callable[[HttpBatchResult], Any] | None = config.on_batch_result
+        self.batches_sent = 0
+        self.events_sent = 0
+        self.events_failed = 0
+        self._closed = False
+        self._init_state()
+        _live_batchers.add(self)
+
+    def _init_state(self) -> None:
+        self._pid = os.getpid()
+        self._buffer: list[bytes] = []
+        self._buffer_bytes = 0
+        self._oldest: float | None = None
+        # batches cut from the buffer and not sent yet, oldest first
+        self._pending: deque[list[bytes]] = deque()
+        self._lock = threading.Lock()
+        # serializes sending so batches reach the backend in order they were cut in
+        self._send_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._linger_thread: threading.Thread | None = None
+
+    @property
+    def buffered_bytes(self) -> int:
+        return self._buffer_bytes
+
+    def add(self, payload: bytes) -> None:
+        if self._pid != os.getpid():
+            # linger thread does not survive fork, events buffered in the parent are sent there
+            self._init_state()
+        with self._lock:
+            if self._closed:
+                self._pending.append([payload])
+            else:
+                if self._buffer and self._buffer_bytes + len(payload) > self.config.max_bytes:
+                    self._pending.append(self._take_batch())
+                self._buffer.append(payload)
+                self._buffer_bytes += len(payload)
+                if len(self._buffer) >= self.config.max_events or self._buffer_bytes >= self.config.max_bytes:
+                    self._pending.append(self._take_batch())
+                elif self._oldest is None:
+                    self._oldest = time.monotonic()
+                    self._ensure_linger_thread()
+                    self._wakeup.notify()
+            if not self._pending:
+                return
+        self._send_pending()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Sends buffered events. Returns False if any of the events was not accepted, or if batch in-flight
+        on another thread was not sent before timeout expired - buffered events are then left for later.
+        """
+        if self._pid != os.getpid():
+            self._init_state()
+        # waits for batch that might be in-flight on linger thread
+        if not self._send_lock.acquire(timeout=-1 if timeout is None else timeout):
+            return False
+        try:
+            with self._lock:
+                if self._buffer:
+                    self._pending.append(self._take_batch())
+            return self._send_pending_locked()
+        finally:
+            self._send_lock.release()
+
+    def close(self, timeout: float | None = None) -> bool:
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify_all()
+        return self.flush(timeout)
+
+    def _take_batch(self) -> list[bytes]:
+        # has to be called with lock held
+        batch, self._buffer = self._buffer, []
+        self._buffer_bytes = 0
+        self._oldest = None
+        return batch
+
+    def _ensure_linger_thread(self) -> None:
+        # has to be called with lock held
+        if self._linger_thread is None or not self._linger_thread.is_alive():
+            self._linger_thread = threading.Thread(
+                target=self._linger, name="openlineage-http-batcher", daemon=True
+            )
+            self._linger_thread.start()
+
+    def _linger(self) -> None:
+        # state is replaced when it's reset in forked process, the thread then exits
+        wakeup = self._wakeup
+        while True:
+            with wakeup:
+                while not self._closed and wakeup is self._wakeup:
+                    if self._oldest is None:
+                        wakeup.wait()
+                        continue
+                    remaining = self._oldest + self.config.max_linger - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    wakeup.wait(remaining)
+                if self._closed or wakeup is not self._wakeup:
+                    return
+                self._pending.append(self._take_batch())
+            self._send_pending()
+
+    def _encode(self, batch: list[bytes]) -> bytes:
+        if self.config.format == HttpBatchFormat.NDJSON:
+            return b"\n".join(batch) + b"\n"
+        return b"[" + b",".join(batch) + b"]"
+
+    def _send_pending(self) -> bool:
+        with self._send_lock:
+            return self._send_pending_locked()
+
+    def _send_pending_locked(self) -> bool:
+        # has to be called with send lock held, batches cut by other threads meanwhile are sent too
+        ok = True
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return ok
+                batch = self._pending.popleft()
+            ok = self._send_locked(batch).ok and ok
+
+    def _send_locked(self, batch: list[bytes]) -> HttpBatchResult:
+        # has to be called with send lock held
+        content_type = (
+            "application/x-ndjson" if self.config.format == HttpBatchFormat.NDJSON else "application/json"
+        )
+        body, headers = self.transport._prepare_request(self._encode(batch), content_type)  # noqa: SLF001
+        try:
+            response = self.transport._post_or_defer(self.url, body, headers)  # noqa: SLF001
+            if response is None:
+                result = HttpBatchResult(size=len(batch), deferred=True)
+            else:
+                result = HttpBatchResult(
+                    size=len(batch), response=response, failed=self._parse_failures(response)
+                )
+        except Exception as e:  # noqa: BLE001
+            log.warning("Failed to send batch of %d OpenLineage events: %s", len(batch), e)
+            result = HttpBatchResult(size=len(batch), error=e)
+
+        self.batches_sent += 1
+        if result.error:
+            self.events_failed += len(batch)
+        elif not result.deferred:
+            self.events_failed += len(result.failed)
+            self.events_sent += len(batch) - len(result.failed)
+            for index, error in result.failed:
+                log.warning("OpenLineage event at index %d of batch was rejected: %s", index, error)
+        if self.on_batch_result:
+            try:
+                self.on_batch_result(result)
+            except Exception as e:  # noqa: BLE001
+                log.warning("OpenLineage batch result callback failed: %s", e)
+        return result
+
+    @staticmethod
+    def _parse_failures(response: Response) -> list[tuple[int, str]]:
+        """
+        Reads rejected events from partially accepted batch.
+        Expected response body: `{"failed": [{"index": <position in batch>, "error": <reason>}, ...]}`
+        """
+        try:
+            content = response.json() if response.content else None
+        except ValueError:
+            return []
+        if not isinstance(content, dict) or not isinstance(content.get("failed"), list):
+            return []
+        return [
+            (int(item.get("index", -1)), str(item.get("error", "")))
+            for item in content["failed"]
+            if isinstance(item, dict)
+        ]
+
+
+class HttpRetryScheduler:
+    """
+    Retries failed requests of HttpTransport on a daemon thread, so emitting thread does not wait for backoff.
+
+    Requests are retried with exponential backoff and jitter until they succeed, fail with a non-retryable
+    error, reach `max_attempts` or `max_age`. At most `budget` requests wait for retry at a time; requests
+    failing when the budget is used up are given up right away. Retried requests can reach the backend
+    out of order.
+    """
+
+    def __init__(self, transport: HttpTransport, config: HttpDeferredRetryConfig) -> None:
+        self.transport = transport
+        self.config = config
+        self.retries = 0
+        self.succeeded = 0
+        self.given_up = 0
+        # seconds from first failure to successful retry
+        self.total_retry_latency = 0.0
+        self.max_retry_latency = 0.0
+        self._closed = False
+        self._init_state()
+        _live_retry_schedulers.add(self)
+
+    def _init_state(self) -> None:
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._all_done = threading.Condition(self._lock)
+        # (due time, sequence number, request)
+        self._heap: list[tuple[float, int, _DeferredRequest]] = []
+        self._in_flight = 0
+        self._sequence = itertools.count()
+        self._worker: threading.Thread | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of requests waiting for retry, including the one being retried."""
+        return len(self._heap) + self._in_flight
+
+    @property
+    def average_retry_latency(self) -> float:
+        return self.total_retry_latency / self.succeeded if self.succeeded else 0.0
+
+    def is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, HTTPError):
+            return error.response is not None and error.response.status_code in self.config.status_forcelist
+        return isinstance(error, (RequestsConnectionError, Timeout))
+
+    def schedule(self, url: str, body: bytes | str, headers: dict[str, str]) -> bool:
+        """Schedules retry of request that failed once. Returns False if it was given up."""
+        if self._pid != os.getpid():
+            # worker thread does not survive fork, requests scheduled in the parent are retried there
+            self._init_state()
+        request = _DeferredRequest(url, body, headers, first_failure=time.monotonic())
+        with self._lock:
+            if self._closed or self.pending >= self.config.budget:
+                self._give_up(request, "retry budget exhausted" if not self._closed else "transport closed")
+                return False
+            self._push(request)
+            self._ensure_worker()
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits until scheduled requests succeed or are given up. Returns False if timeout expired first."""
+        with self._lock:
+            return self._all_done.wait_for(lambda: self.pending == 0, timeout=timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        flushed = self.flush(timeout)
+        with self._lock:
+            self._closed = True
+            for _, _, request in self._heap:
+                self._give_up(request, "transport closed")
+            self._heap.clear()
+            self._wakeup.notify_all()
+        return flushed
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(
+            self.config.initial_backoff * self.config.multiplier ** (attempt - 1), self.config.max_backoff
+        )
+        return delay * (1 - self.config.jitter * random.random())  # noqa: S311
+
+    def _push(self, request: _DeferredRequest) -> None:
+        # has to be called with lock held
+        due = time.monotonic() + self._backoff(request.attempts)
+        heapq.heappush(self._heap, (due, next(self._sequence), request))
+        self._wakeup.notify()
+
+    def _give_up(self, request: _DeferredRequest, reason: str) -> None:
+        self.given_up += 1
+        log.warning(
+            "Giving up OpenLineage request to %s after %d attempts: %s", request.url, request.attempts, reason
+        )
+
+    def _ensure_worker(self) -> None:
+        # has to be called with lock held
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="openlineage-http-retry", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._closed:
+                    if not self._heap:
+                        self._wakeup.wait()
+                        continue
+                    remaining = self._heap[0][0] - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wakeup.wait(remaining)
+                if self._closed:
+                    return
+                _, _, request = heapq.heappop(self._heap)
+                self._in_flight += 1
+            self._retry(request)
+            with self._lock:
+                self._in_flight -= 1
+                if self.pending == 0:
+                    self._all_done.notify_all()
+
+    def _retry(self, request: _DeferredRequest) -> None:
+        request.attempts += 1
+        self.retries += 1
+        try:
+            self.transport._post(request.url, request.body, request.headers)  # noqa: SLF001
+        except Exception as e:  # noqa: BLE001
+            age = time.monotonic() - request.first_failure
+            if not self.is_retryable(e):
+                self._give_up(request, str(e))
+            elif request.attempts >= self.config.max_attempts:
+                self._give_up(request, f"max attempts reached, last error: {e}")
+            elif age >= self.config.max_age:
+                self._give_up(request, f"max age reached, last error: {e}")
+            else:
+                with self._lock:
+                    self._push(request)
+            return
+        latency = time.monotonic() - request.first_failure
+        self.succeeded += 1
+        self.total_retry_latency += latency
+        self.max_retry_latency = max(self.max_retry_latency, latency)
+
+
+@attr.s
+class _DeferredRequest:
+    url: str = attr.ib()
+    body: bytes | str = attr.ib()
+    headers: dict[str, str] = attr.ib()
+    first_failure: float = attr.ib()
+    # attempts made so far, including the first one on emitting thread
+    attempts: int = attr.ib(default=1)
+
+
+_live_transports: weakref.WeakSet[HttpTransport] = weakref.WeakSet()
+_live_batchers: weakref.WeakSet[HttpBatcher] = weakref.WeakSet()
+_live_retry_schedulers: weakref.WeakSet[HttpRetryScheduler] = weakref.WeakSet()
+
+
+def _flush_live_batchers() -> None:
+    for batcher in list(_live_batchers):
+        if not batcher._closed and batcher._pid == os.getpid():  # noqa: SLF001
+            batcher.close()
+
+
+def _close_live_retry_schedulers() -> None:
+    # runs before batchers are closed: batches failing at exit are not retried
+    for scheduler in list(_live_retry_schedulers):
+        if not scheduler._closed and scheduler._pid == os.getpid():  # noqa: SLF001
+            scheduler.close(timeout=0)
+
+
+def _reset_session_locks() -> None:
+    # lock could have been held by another thread when the process forked
+    for transport in list(_live_transports):
+        transport._session_lock = threading.Lock()  # noqa: SLF001
+
+
+register_exit_hook(_close_live_retry_schedulers, ExitStage.TRANSPORTS)
+register_exit_hook(_flush_live_batchers, ExitStage.TRANSPORTS)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_session_locks)
@@ -2,27 +2,58 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import gzip
+import json
 import logging
-from typing import TYPE_CHECKING, Any, TypeVar
+import os
+import threading
+import time
+import weakref
+from enum import Enum
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 import attr
 from openlineage.client import event_v2
 from openlineage.client.facet_v2 import parent_run
+from openlineage.client.metrics import counter, get_metrics_registry
 from openlineage.client.run import DatasetEvent, JobEvent, RunEvent
 from openlineage.client.serde import Serde
-from openlineage.client.transport.transport import Config, Transport
-from openlineage.client.utils import get_only_specified_fields
+from openlineage.client.transport.transport import Config, Transport, supports_emit_serialized
+from openlineage.client.utils import ExitStage, get_only_specified_fields, register_exit_hook
 from packaging.version import Version
 
 if TYPE_CHECKING:
     from confluent_kafka import KafkaError, Message
     from openlineage.client.client import Event
     from openlineage.client.facet import ParentRunFacet
+    from openlineage.client.metrics import Metric
 
 log = logging.getLogger(__name__)
 
 _T = TypeVar("_T", bound="KafkaConfig")
 
+# librdkafka default of `message.max.bytes`
+DEFAULT_MAX_MESSAGE_BYTES = 1000000
+
+
+class OversizePolicy(Enum):
+    # gzip the payload, marking it with `content-encoding: gzip` message header
+    COMPRESS = "compress"
+    # remove `heavy_facets` from datasets of the event
+    DROP_FACETS = "drop_facets"
+    # emit the event with `oversize_transport` instead of Kafka
+    ROUTE = "route"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+def _oversize_policies(value: str | list[str | OversizePolicy]) -> list[OversizePolicy]:
+    if isinstance(value, str):
+        value = [value]
+    return [OversizePolicy(policy) for policy in value]
+
 
 @attr.s
 class KafkaConfig(Config):
@@ -40,6 +71,30 @@ class KafkaConfig(Config):
     # some cases - for example in Airflow integration, so flushing is desirable there.
     flush: bool = attr.ib(default=True)
 
+    # When `flush` is false: flush after this many messages were produced since the last flush
+    flush_every: int | None = attr.ib(default=None)
+
+    # When `flush` is false: flush when at least this many milliseconds passed since the last flush.
+    # Checked on emit; without either of `flush_every` and `flush_interval_ms` producer flushes
+    # only on `client.flush()`, `client.close()`, before fork and at interpreter exit.
+    flush_interval_ms: int | None = attr.ib(default=None)
+
+    # Max seconds single flush waits for delivery of buffered messages
+    flush_timeout: float = attr.ib(default=10.0)
+
+    # Size limit of key and payload, defaults to `message.max.bytes` from producer `config`
+    max_message_bytes: int | None = attr.ib(default=None)
+
+    # What to do with events over the size limit. Policies are tried in order: compress, drop facets, route.
+    # Without any, events are passed to the producer, which fails on them.
+    oversize_policy: list[OversizePolicy] = attr.ib(factory=list, converter=_oversize_policies)
+
+    # Dataset facets dropped one by one, in this order, by `drop_facets` policy
+    heavy_facets: list[str] = attr.ib(factory=lambda: ["columnLineage", "schema"])
+
+    # Config of transport receiving events over the size limit with `route` policy
+    oversize_transport: dict[str, Any] | None = attr.ib(default=None)
+
     @classmethod
     def from_dict(cls: type[_T], params: dict[str, Any]) -> _T:
         # alias message_key to messageKey
@@ -70,101 +125,227 @@ class KafkaTransport(Transport):
         self.flush = config.flush
         self.message_key = config.messageKey
         self.kafka_config = config
-        self._is_airflow_sqlalchemy = _check_if_airflow_sqlalchemy_context()
+        # delivery reports, counted when producer serves callbacks on poll or flush
+        self.delivered = 0
+        self.delivery_failed = 0
+        self._stats_lock = threading.Lock()
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        # events over the size limit, by the way they were handled
+        self.oversize_compressed = 0
+        self.oversize_degraded = 0
+        self.oversize_routed = 0
+        self.oversize_rejected = 0
+        # size of produced messages
+        self.serialized_bytes = 0
         self.producer = None
+        self._producer_pid: int | None = None
+        self._producer_lock = threading.Lock()
+        # producers inherited through fork; kept referenced, as destroying them in child could hang
+        self._inherited_producers: list[Any] = []
+        # In Airflow SQLAlchemy context the transport is created before worker processes are forked,
+        # so producer is created lazily, in the process that emits.
+        self._is_airflow_sqlalchemy = _check_if_airflow_sqlalchemy_context()
         if not self._is_airflow_sqlalchemy:
-            self._setup_producer(self.kafka_config.config)
+            self._get_producer()
+        _live_transports.add(self)
+        get_metrics_registry().register(self)
         log.debug("Constructing OpenLineage transport that will send events to kafka topic `%s`", self.topic)
 
-    def _get_message_key(self, event: Event) -> str | None:
-        if isinstance(event, (DatasetEvent, event_v2.DatasetEvent)):
-            return f"dataset:{event.dataset.namespace}/{event.dataset.name}"
-
-        if isinstance(event, (JobEvent, event_v2.JobEvent)):
-            return f"job:{event.job.namespace}/{event.job.name}"
-
+    def _get_message_key(self, event: Event | dict[str, Any]) -> str | None:
         if isinstance(event, (RunEvent, event_v2.RunEvent)):
             return self._get_run_message_key(event)
-
-        return None
+        return get_message_key(event)
 
     def _get_run_message_key(self, event: RunEvent | event_v2.RunEvent) -> str:
-        """
-        To keep order of events in Kafka topic, we need to send them to the same partition.
-        This is the case for:
-            1. different runs of the same job.
-            2. runs in the chain parent -> child -> grandchild.
-
-        For (1) Kafka message_key has format "run:<namespace>/<name>".
-        For (2) source for `<namespace>` and `<name>` is selected using this order:
-        - run.facets.parent.root.job
-        - run.facets.parent.job
-        - run.job
-        """
-
-        run_default_result = f"run:{event.job.namespace}/{event.job.name}"
-
-        run_facets: dict[str, Any] = event.run.facets or {}
-        parent_run_facet: ParentRunFacet | parent_run.ParentRunFacet | None = run_facets.get("parent")
-        if not parent_run_facet:
-            return run_default_result
-
-        parent_job_namespace: str | None = None
-        parent_job_name: str | None = None
-        if isinstance(parent_run_facet, parent_run.ParentRunFacet):
-            (
-                parent_job_namespace,
-                parent_job_name,
-            ) = self._get_run_message_key_args_from_parent_run_facet_v2(parent_run_facet)
-        else:
-            (
-                parent_job_namespace,
-                parent_job_name,
-            ) = self._get_run_message_key_args_from_parent_run_facet(parent_run_facet)
-
-        if not parent_job_namespace or not parent_job_name:
-            return run_default_result
-
-        return f"run:{parent_job_namespace}/{parent_job_name}"
+        return _get_run_message_key(
+            event,
+            self._get_run_message_key_args_from_parent_run_facet,
+            self._get_run_message_key_args_from_parent_run_facet_v2,
+        )
 
     def _get_run_message_key_args_from_parent_run_facet(
         self,
         parent_run_facet: ParentRunFacet,
     ) -> tuple[str | None, str | None]:
-        parent_job_namespace = parent_run_facet.job.get("namespace")
-        parent_job_name = parent_run_facet.job.get("name")
-        return parent_job_namespace, parent_job_name
+        return _get_run_message_key_args_from_parent_run_facet(parent_run_facet)
 
     def _get_run_message_key_args_from_parent_run_facet_v2(
         self,
         parent_run_facet: parent_run.ParentRunFacet,
     ) -> tuple[str, str]:
-        if parent_run_facet.root:
-            root_job_namespace: str = parent_run_facet.root.job.namespace
-            root_job_name: str = parent_run_facet.root.job.name
-            return root_job_namespace, root_job_name
-
-        parent_job_namespace: str = parent_run_facet.job.namespace
-        parent_job_name: str = parent_run_facet.job.name
-        return parent_job_namespace, parent_job_name
+        return _get_run_message_key_args_from_parent_run_facet_v2(parent_run_facet)
 
     def emit(self, event: Event) -> None:
-        if self._is_airflow_sqlalchemy:
-            self._setup_producer(self.kafka_config.config)
+        self.emit_serialized(Serde.to_json_bytes(event), event)
 
+    def emit_serialized(self, payload: bytes, event: Event) -> None:
+        producer = self._get_producer()
         key = self.message_key or self._get_message_key(event)
 
-        self.producer.produce(  # type: ignore[attr-defined]
+        kwargs: dict[str, Any] = {}
+        if self.kafka_config.oversize_policy and self._is_oversize(payload, key):
+            handled = self._handle_oversize(payload, event, key)
+            if handled is None:
+                return
+            payload, kwargs["headers"] = handled
+
+        producer.produce(
             topic=self.topic,
             key=key,
-            value=Serde.to_json(event).encode("utf-8"),
-            on_delivery=on_delivery,
+            value=payload,
+            on_delivery=self._on_delivery,
+            **kwargs,
+        )
+        self.serialized_bytes += len(payload)
+        self._unflushed += 1
+        if self.flush or self._flush_due():
+            self._flush(self.kafka_config.flush_timeout)
+        else:
+            # serve delivery callbacks of already sent messages without blocking
+            producer.poll(0)
+
+    def collect_metrics(self) -> list[Metric]:
+        tags = (("transport", self.kind),)
+        return [
+            counter("transport.serialized_bytes", self.serialized_bytes, tags),
+            counter("kafka.delivered", self.delivered, tags),
+            counter("kafka.delivery_failed", self.delivery_failed, tags),
+            counter("kafka.oversize.compressed", self.oversize_compressed, tags),
+            counter("kafka.oversize.degraded", self.oversize_degraded, tags),
+            counter("kafka.oversize.routed", self.oversize_routed, tags),
+            counter("kafka.oversize.rejected", self.oversize_rejected, tags),
+        ]
+
+    def wait_for_completion(self, timeout: float | None = None) -> bool:
+        if self.producer is None or self._producer_pid != os.getpid():
+            return True
+        return self._flush(self.kafka_config.flush_timeout if timeout is None else timeout) == 0
+
+    def close(self, timeout: float | None = None) -> bool:
+        result = self.wait_for_completion(timeout)
+        _live_transports.discard(self)
+        return result
+
+    @cached_property
+    def max_message_bytes(self) -> int:
+        if self.kafka_config.max_message_bytes is not None:
+            return self.kafka_config.max_message_bytes
+        return int(self.kafka_config.config.get("message.max.bytes", DEFAULT_MAX_MESSAGE_BYTES))
+
+    @cached_property
+    def oversize_transport(self) -> Transport | None:
+        if self.kafka_config.oversize_transport is None:
+            return None
+        from openlineage.client.transport import get_default_factory
+
+        return get_default_factory().create(dict(self.kafka_config.oversize_transport))
+
+    def _is_oversize(self, payload: bytes, key: str | None) -> bool:
+        return len(payload) + len((key or "").encode()) > self.max_message_bytes
+
+    def _handle_oversize(
+        self, payload: bytes, event: Event, key: str | None
+    ) -> tuple[bytes, list[tuple[str, bytes]] | None] | None:
+        """
+        Returns payload fitting the size limit with its message headers, or None if the event was routed
+        to `oversize_transport`. If no policy succeeds, original payload is returned.
+        """
+        policies = self.kafka_config.oversize_policy
+        if OversizePolicy.COMPRESS in policies:
+            compressed = gzip.compress(payload)
+            if not self._is_oversize(compressed, key):
+                self.oversize_compressed += 1
+                return compressed, [("content-encoding", b"gzip")]
+
+        if OversizePolicy.DROP_FACETS in policies:
+            degraded = self._drop_heavy_facets(payload, key)
+            if degraded is not None:
+                self.oversize_degraded += 1
+                return degraded
+
+        if OversizePolicy.ROUTE in policies and self.oversize_transport is not None:
+            log.warning("OpenLineage event over Kafka size limit, emitting it with oversize transport.")
+            if supports_emit_serialized(self.oversize_transport):
+                self.oversize_transport.emit_serialized(payload, event)
+            else:
+                self.oversize_transport.emit(event)
+            self.oversize_routed += 1
+            return None
+
+        log.warning(
+            "OpenLineage event of %d bytes is over Kafka size limit of %d bytes.",
+            len(payload),
+            self.max_message_bytes,
+        )
+        self.oversize_rejected += 1
+        return payload, None
+
+    def _drop_heavy_facets(
+        self, payload: bytes, key: str | None
+    ) -> tuple[bytes, list[tuple[str, bytes]] | None] | None:
+        event = json.loads(payload)
+        datasets = [*event.get("inputs", []), *event.get("outputs", [])]
+        if "dataset" in event:
+            datasets.append(event["dataset"])
+        compress = OversizePolicy.COMPRESS in self.kafka_config.oversize_policy
+
+        for facet in self.kafka_config.heavy_facets:
+            dropped = False
+            for dataset in datasets:
+                for facets_key in ("facets", "inputFacets", "outputFacets"):
+                    if facet in (dataset.get(facets_key) or {}):
+                        del dataset[facets_key][facet]
+                        dropped = True
+            if not dropped:
+                continue
+            log.warning("OpenLineage event over Kafka size limit, dropped `%s` dataset facets.", facet)
+            degraded = Serde.to_json_bytes(event)
+            if not self._is_oversize(degraded, key):
+                return degraded, None
+            if compress:
+                compressed = gzip.compress(degraded)
+                if not self._is_oversize(compressed, key):
+                    return compressed, [("content-encoding", b"gzip")]
+        return None
+
+    def _flush_due(self) -> bool:
+        config = self.kafka_config
+        if config.flush_every is not None and self._unflushed >= config.flush_every:
+            return True
+        return (
+            config.flush_interval_ms is not None
+            and (time.monotonic() - self._last_flush) * 1000 >= config.flush_interval_ms
         )
-        if self.flush:
-            rest = self.producer.flush(timeout=10)  # type: ignore[attr-defined]
-            log.debug("Amount of messages left in Kafka buffers after flush %d", rest)
-        if self._is_airflow_sqlalchemy:
-            self.producer = None
+
+    def _flush(self, timeout: float) -> int:
+        rest: int = self.producer.flush(timeout=timeout)  # type: ignore[attr-defined]
+        log.debug("Amount of messages left in Kafka buffers after flush %d", rest)
+        self._unflushed = rest
+        self._last_flush = time.monotonic()
+        return rest
+
+    def _on_delivery(self, err: KafkaError, msg: Message) -> None:
+        with self._stats_lock:
+            if err:
+                self.delivery_failed += 1
+            else:
+                self.delivered += 1
+        on_delivery(err, msg)
+
+    def _get_producer(self) -> Any:
+        """Returns producer of the current process, creating it on first use and after fork."""
+        pid = os.getpid()
+        if self.producer is not None and self._producer_pid == pid:
+            return self.producer
+        with self._producer_lock:
+            if self.producer is None or self._producer_pid != pid:
+                if self.producer is not None:
+                    # librdkafka threads do not survive fork, so producer of the parent process is not usable
+                    self._inherited_producers.append(self.producer)
+                    self._unflushed = 0
+                self._setup_producer(self.kafka_config.config)
+        return self.producer
 
     def _setup_producer(self, config: dict) -> None:  # type: ignore[type-arg]
         try:
@@ -178,6 +359,7 @@ class KafkaTransport(Transport):
                     "log_level": 7,
                 }
             self.producer = kafka.Producer({**added_config, **config})
+            self._producer_pid = os.getpid()
         except ModuleNotFoundError:
             log.exception(
                 "OpenLineage client did not found confluent-kafka module. "
@@ -187,6 +369,132 @@ class KafkaTransport(Transport):
             raise
 
 
+def get_message_key(event: Event | dict[str, Any]) -> str | None:
+    """
+    Default Kafka message key of the event. Events with the same key are related and have to keep their order.
+    """
+    if isinstance(event, dict):
+        # event in its JSON form, e.g. read back from a file or queue
+        return _get_message_key_from_dict(event)
+
+    if isinstance(event, (DatasetEvent, event_v2.DatasetEvent)):
+        return f"dataset:{event.dataset.namespace}/{event.dataset.name}"
+
+    if isinstance(event, (JobEvent, event_v2.JobEvent)):
+        return f"job:{event.job.namespace}/{event.job.name}"
+
+    if isinstance(event, (RunEvent, event_v2.RunEvent)):
+        return _get_run_message_key(event)
+
+    return None
+
+
+def _get_run_message_key(
+    event: RunEvent | event_v2.RunEvent,
+    get_parent_args: Callable[[ParentRunFacet], tuple[str | None, str | None]] | None = None,
+    get_parent_args_v2: Callable[[parent_run.ParentRunFacet], tuple[str, str]] | None = None,
+) -> str:
+    """
+    To keep order of events in Kafka topic, we need to send them to the same partition.
+    This is the case for:
+        1. different runs of the same job.
+        2. runs in the chain parent -> child -> grandchild.
+
+    For (1) Kafka message_key has format "run:<namespace>/<name>".
+    For (2) source for `<namespace>` and `<name>` is selected using this order:
+    - run.facets.parent.root.job
+    - run.facets.parent.job
+    - run.job
+    """
+
+    run_default_result = f"run:{event.job.namespace}/{event.job.name}"
+
+    run_facets: dict[str, Any] = event.run.facets or {}
+    parent_run_facet: ParentRunFacet | parent_run.ParentRunFacet | None = run_facets.get("parent")
+    if not parent_run_facet:
+        return run_default_result
+
+    parent_job_namespace: str | None = None
+    parent_job_name: str | None = None
+    if isinstance(parent_run_facet, parent_run.ParentRunFacet):
+        (
+            parent_job_namespace,
+            parent_job_name,
+        ) = (get_parent_args_v2 or _get_run_message_key_args_from_parent_run_facet_v2)(parent_run_facet)
+    else:
+        (
+            parent_job_namespace,
+            parent_job_name,
+        ) = (get_parent_args or _get_run_message_key_args_from_parent_run_facet)(parent_run_facet)
+
+    if not parent_job_namespace or not parent_job_name:
+        return run_default_result
+
+    return f"run:{parent_job_namespace}/{parent_job_name}"
+
+
+def _get_message_key_from_dict(event: dict[str, Any]) -> str | None:
+    """Same as `get_message_key`, for events in their JSON form."""
+    if "run" in event and "job" in event:
+        parent = (event["run"].get("facets") or {}).get("parent") or {}
+        parent_job = (parent.get("root") or {}).get("job") or parent.get("job") or {}
+        if parent_job.get("namespace") and parent_job.get("name"):
+            return f"run:{parent_job['namespace']}/{parent_job['name']}"
+        return f"run:{event['job']['namespace']}/{event['job']['name']}"
+
+    if "dataset" in event:
+        return f"dataset:{event['dataset']['namespace']}/{event['dataset']['name']}"
+
+    if "job" in event:
+        return f"job:{event['job']['namespace']}/{event['job']['name']}"
+
+    return None
+
+
+def _get_run_message_key_args_from_parent_run_facet(
+    parent_run_facet: ParentRunFacet,
+) -> tuple[str | None, str | None]:
+    parent_job_namespace = parent_run_facet.job.get("namespace")
+    parent_job_name = parent_run_facet.job.get("name")
+    return parent_job_namespace, parent_job_name
+
+
+def _get_run_message_key_args_from_parent_run_facet_v2(
+    parent_run_facet: parent_run.ParentRunFacet,
+) -> tuple[str, str]:
+    if parent_run_facet.root:
+        root_job_namespace: str = parent_run_facet.root.job.namespace
+        root_job_name: str = parent_run_facet.root.job.name
+        return root_job_namespace, root_job_name
+
+    parent_job_namespace: str = parent_run_facet.job.namespace
+    parent_job_name: str = parent_run_facet.job.name
+    return parent_job_namespace, parent_job_name
+
+
+_live_transports: weakref.WeakSet[KafkaTransport] = weakref.WeakSet()
+
+
+def _flush_live_transports(timeout: float | None = None) -> None:
+    # messages buffered by librdkafka are lost if the process exits before they are sent
+    for transport in list(_live_transports):
+        try:
+            transport.wait_for_completion(timeout)
+        except Exception:
+            log.warning("Failed to flush OpenLineage Kafka producer", exc_info=True)
+
+
+def _serve_delivery_reports_before_fork() -> None:
+    # The parent keeps its producer and sends buffered messages after fork, so forking does not wait for
+    # the broker - only delivery reports received so far are served, before the child inherits the queue.
+    _flush_live_transports(timeout=0)
+
+
+register_exit_hook(_flush_live_transports, ExitStage.TRANSPORTS)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_serve_delivery_reports_before_fork)
+
+
 def _check_if_airflow_sqlalchemy_context() -> bool:
     try:
         from airflow.version import version  # type: ignore[import-not-found]
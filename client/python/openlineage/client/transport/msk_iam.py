@@ -5,10 +5,12 @@ from __future__ import annotations
 import functools
 import logging
 import os
-from typing import Any
+import threading
+import time
+from typing import Any, Callable
 
 import attr
-from openlineage.client.transport import KafkaConfig, KafkaTransport
+from openlineage.client.transport.kafka import KafkaConfig, KafkaTransport
 
 log = logging.getLogger(__name__)
 
@@ -43,7 +45,7 @@ class MSKIAMConfig(KafkaConfig):
     aws_debug_creds: bool = attr.ib(default=False)
 
 
-def _oauth_cb(config: MSKIAMConfig, *_: Any) -> tuple[str, float]:
+def _generate_auth_token(config: MSKIAMConfig) -> tuple[str, float]:
     from aws_msk_iam_sasl_signer import MSKAuthTokenProvider  # type: ignore[import-untyped]
 
     region = config.region
@@ -68,6 +70,108 @@ def _oauth_cb(config: MSKIAMConfig, *_: Any) -> tuple[str, float]:
     return auth_token, expiry_ms / 1000
 
 
+class _TokenCache:
+    """
+    Process-wide cache of MSK auth tokens, shared by all transports using the same credentials.
+
+    Token is generated synchronously only when there is none or it has expired. A cached token is refreshed
+    in a background thread `refresh_ahead` seconds before it expires - scheduled when it's cached, and also
+    triggered on lookup, as timer threads do not survive fork. If refresh fails, cached token is still used
+    until it expires, and refresh is retried after `retry_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[MSKIAMConfig], tuple[str, float]] = _generate_auth_token,
+        refresh_ahead: float = 60.0,
+        retry_interval: float = 10.0,
+    ) -> None:
+        self.generate = generate
+        self.refresh_ahead = refresh_ahead
+        self.retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._tokens: dict[tuple[Any, ...], tuple[str, float]] = {}
+        self._key_locks: dict[tuple[Any, ...], threading.Lock] = {}
+        self._refreshing: set[tuple[Any, ...]] = set()
+        self._pid = os.getpid()
+
+    @staticmethod
+    def _key(config: MSKIAMConfig) -> tuple[Any, ...]:
+        return config.region, config.aws_profile, config.role_arn, config.aws_debug_creds
+
+    def get(self, config: MSKIAMConfig) -> tuple[str, float]:
+        key = self._key(config)
+        with self._lock:
+            if self._pid != os.getpid():
+                # refresh threads of parent process are not running in this one
+                # and locks held by them at fork would never be released
+                self._pid = os.getpid()
+                self._refreshing.clear()
+                self._key_locks = {}
+            token = self._tokens.get(key)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        now = time.time()
+        if token is not None and token[1] > now:
+            if token[1] - now <= self.refresh_ahead:
+                self._schedule_refresh(key, config, 0)
+            return token
+
+        # only one thread generates token, others wait for it
+        with key_lock:
+            token = self._tokens.get(key)
+            if token is None or token[1] <= time.time():
+                token = self._store(key, config, self.generate(config))
+        return token
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+    def _store(
+        self, key: tuple[Any, ...], config: MSKIAMConfig, token: tuple[str, float], refreshed: bool = False
+    ) -> tuple[str, float]:
+        with self._lock:
+            self._tokens[key] = token
+            if refreshed:
+                # refresh is still pending until new token is visible, so lookups don't schedule another one
+                self._refreshing.discard(key)
+        delay = token[1] - self.refresh_ahead - time.time()
+        if delay > 0:
+            self._schedule_refresh(key, config, delay)
+        return token
+
+    def _schedule_refresh(self, key: tuple[Any, ...], config: MSKIAMConfig, delay: float) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        timer = threading.Timer(delay, self._refresh, args=(key, config))
+        timer.name = "openlineage-msk-token-refresh"
+        timer.daemon = True
+        timer.start()
+
+    def _refresh(self, key: tuple[Any, ...], config: MSKIAMConfig) -> None:
+        try:
+            token = self.generate(config)
+        except Exception:
+            log.warning("Failed to refresh MSK auth token, using cached one until it expires", exc_info=True)
+            with self._lock:
+                self._refreshing.discard(key)
+                cached = self._tokens.get(key)
+            if cached is not None and cached[1] - time.time() > self.retry_interval:
+                self._schedule_refresh(key, config, self.retry_interval)
+            return
+        self._store(key, config, token, refreshed=True)
+
+
+_token_cache = _TokenCache()
+
+
+def _oauth_cb(config: MSKIAMConfig, *_: Any) -> tuple[str, float]:
+    return _token_cache.get(config)
+
+
 class MSKIAMTransport(KafkaTransport):
     kind = "msk-iam"
     config_class = MSKIAMConfig
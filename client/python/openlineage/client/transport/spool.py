@@ -0,0 +1,531 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+"""
+SpoolTransport appends serialized events to a write-ahead log on local disk and returns immediately.
+A background drainer thread forwards them to the wrapped transport, retrying with backoff while it fails.
+
+The log is a directory of segment files, each containing one JSON event per line. Segment names start
+with creation time and pid of the writing process, and end with `.open` while the process is writing to
+them and `.log` once they are sealed. Progress of the drainer is stored per segment in `checkpoint.json`,
+so events that were not forwarded before the process exited are forwarded on the next start.
+Processes sharing the directory each write their own segments; only one of them, holding `drainer.lock`,
+forwards events. Events are delivered at least once.
+Closing the transport waits at most `close_timeout` seconds for spooled events to be forwarded.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from enum import Enum
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+import attr
+from openlineage.client import event_v2
+from openlineage.client.facet_v2 import parent_run
+from openlineage.client.generated.base import StaticDataset
+from openlineage.client.metrics import counter, gauge, get_metrics_registry
+from openlineage.client.serde import Serde
+from openlineage.client.transport.transport import Config, Transport, supports_emit_serialized
+from openlineage.client.utils import get_only_specified_fields
+
+try:
+    import fcntl
+except ImportError:  # Windows, only single process can use the spool directory
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from openlineage.client.client import Event
+    from openlineage.client.metrics import Metric
+
+log = logging.getLogger(__name__)
+
+OPEN_SUFFIX = ".open"
+SEALED_SUFFIX = ".log"
+CHECKPOINT_FILE = "checkpoint.json"
+DRAINER_LOCK_FILE = "drainer.lock"
+
+
+class FsyncPolicy(Enum):
+    # fsync after every event
+    ALWAYS = "always"
+    # fsync at most once per `fsync_interval` seconds
+    INTERVAL = "interval"
+    # leave writing to disk to the operating system
+    NEVER = "never"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@attr.s
+class SpoolConfig(Config):
+    # directory holding segments and checkpoint, created if it does not exist
+    directory: str = attr.ib()
+    # config of transport events are forwarded to
+    transport: dict[str, Any] = attr.ib()
+    # size after which segment is sealed and a new one started
+    segment_max_bytes: int = attr.ib(default=16 * 1024 * 1024)
+    # new events are dropped when segments take more space on disk, None means no limit
+    max_bytes: int | None = attr.ib(default=None)
+    fsync: FsyncPolicy = attr.ib(default=FsyncPolicy.INTERVAL, converter=FsyncPolicy)
+    fsync_interval: float = attr.ib(default=1.0)
+    # seconds to wait after first failed forwarding attempt, doubled after each following failure
+    backoff: float = attr.ib(default=1.0)
+    max_backoff: float = attr.ib(default=60.0)
+    # attempts after which event is dropped, None retries until it is forwarded
+    max_attempts: int | None = attr.ib(default=None)
+    # how often drainer looks for events written by other processes
+    poll_interval: float = attr.ib(default=1.0)
+    # seconds `close` without timeout waits for events to be forwarded, the rest is forwarded on next start
+    close_timeout: float = attr.ib(default=5.0)
+
+    @classmethod
+    def from_dict(cls, params: dict[str, Any]) -> SpoolConfig:
+        if "directory" not in params:
+            msg = "spool `directory` not passed to SpoolConfig"
+            raise RuntimeError(msg)
+        if not isinstance(params.get("transport"), dict):
+            msg = "spool `transport` config has to be passed to SpoolConfig as dict"
+            raise RuntimeError(msg)  # noqa: TRY004
+        return cls(**get_only_specified_fields(cls, params))
+
+
+class SpoolTransport(Transport):
+    kind = "spool"
+    config_class = SpoolConfig
+
+    def __init__(self, config: SpoolConfig) -> None:
+        self.config = config
+        self.spooled = 0
+        self.forwarded = 0
+        self.dropped = 0
+        self.failed_attempts = 0
+        os.makedirs(config.directory, exist_ok=True)
+        self._pid = -1
+        self._segment_fd: int | None = None
+        self._lock_fd: int | None = None
+        self._init_state()
+        log.debug(
+            "Constructing OpenLineage transport that will spool events to `%s` and forward them to %s",
+            config.directory,
+            self.transport,
+        )
+        get_metrics_registry().register(self)
+        # forward events left by previous runs
+        self._ensure_drainer()
+
+    @cached_property
+    def transport(self) -> Transport:
+        from openlineage.client.transport import get_default_factory
+
+        return get_default_factory().create(dict(self.config.transport))
+
+    def _init_state(self) -> None:
+        if self._pid != -1:
+            # After fork, descriptors of the parent are copies: the child has to use its own segment,
+            # and the drainer lock stays with the parent.
+            for fd in (self._segment_fd, self._lock_fd):
+                if fd is not None:
+                    os.close(fd)
+        self._pid = os.getpid()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._stop = threading.Event()
+        self._closed = False
+        self._segment_fd = None
+        self._segment_name: str | None = None
+        self._segment_size = 0
+        # size of segments on disk other than the current one, refreshed on rotation
+        self._other_segments_size = 0
+        self._last_fsync = time.monotonic()
+        self._last_checkpoint_fsync = self._last_fsync
+        self._lock_fd = None
+        self._drainer: threading.Thread | None = None
+
+    def collect_metrics(self) -> list[Metric]:
+        tags = (("transport", self.kind),)
+        return [
+            counter("spool.spooled", self.spooled, tags),
+            counter("spool.forwarded", self.forwarded, tags),
+            counter("spool.dropped", self.dropped, tags),
+            counter("spool.failed_attempts", self.failed_attempts, tags),
+            # approximate, size of other segments is refreshed on rotation
+            gauge("spool.bytes", self._other_segments_size + self._segment_size, tags),
+        ]
+
+    def emit(self, event: Event) -> None:
+        self.emit_serialized(Serde.to_json_bytes(event), event)
+
+    def emit_serialized(self, payload: bytes, event: Event) -> None:  # noqa: ARG002
+        if self._pid != os.getpid():
+            self._init_state()
+        line = payload + b"\n"
+        with self._write_lock:
+            if self._closed:
+                log.warning("OpenLineage spool transport is closed, dropping event.")
+                self.dropped += 1
+                return
+            if not self._has_space(len(line)):
+                log.warning("OpenLineage spool `%s` is full, dropping event.", self.config.directory)
+                self.dropped += 1
+                return
+            fd = self._current_segment(len(line))
+            _write_all(fd, line)
+            self._segment_size += len(line)
+            self._last_fsync = self._fsync(fd, self._last_fsync)
+            self.spooled += 1
+        self._ensure_drainer()
+        with self._wakeup:
+            self._wakeup.notify_all()
+
+    def wait_for_completion(self, timeout: float | None = None) -> bool:
+        """Waits until all spooled events are forwarded. Events left in the spool are not lost."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._pending_bytes() > 0:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            with self._wakeup:
+                self._wakeup.notify_all()
+                self._wakeup.wait(0.05 if remaining is None else min(0.05, remaining))
+        return self.transport.wait_for_completion(
+            None if deadline is None else max(0.0, deadline - time.monotonic())
+        )
+
+    def close(self, timeout: float | None = None) -> bool:
+        """
+        Seals the current segment and stops the drainer. Waits at most `timeout`, or `close_timeout` when
+        not passed, for spooled events to be forwarded - the rest is forwarded on next start.
+        """
+        if timeout is None:
+            timeout = self.config.close_timeout
+        deadline = time.monotonic() + timeout
+        drained = self.wait_for_completion(timeout)
+        if self._pid != os.getpid():
+            self._init_state()
+        with self._write_lock:
+            self._closed = True
+            self._seal_segment()
+        self._stop.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        if self._drainer is not None and self._drainer is not threading.current_thread():
+            self._drainer.join(max(0.0, deadline - time.monotonic()))
+        if drained and self._lock_fd is not None:
+            # removes the segment sealed above, all its events have been forwarded
+            self._drain()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+        if not drained:
+            log.info(
+                "OpenLineage events remain spooled in `%s` and will be forwarded on next start.",
+                self.config.directory,
+            )
+        return self.transport.close(max(0.0, deadline - time.monotonic())) and drained
+
+    def _has_space(self, size: int) -> bool:
+        # has to be called with write lock held
+        if self.config.max_bytes is None:
+            return True
+        if self._other_segments_size + self._segment_size + size <= self.config.max_bytes:
+            return True
+        # drainer may have removed segments since the last check
+        self._other_segments_size = self._segments_size(exclude=self._segment_name)
+        return self._other_segments_size + self._segment_size + size <= self.config.max_bytes
+
+    def _current_segment(self, size: int) -> int:
+        # has to be called with write lock held
+        if self._segment_fd is not None and self._segment_size + size <= self.config.segment_max_bytes:
+            return self._segment_fd
+        self._seal_segment()
+        self._segment_name = f"{time.time_ns():020d}-{self._pid}"
+        self._segment_fd = os.open(
+            self._path(self._segment_name + OPEN_SUFFIX), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+        self._segment_size = 0
+        self._other_segments_size = self._segments_size(exclude=self._segment_name)
+        return self._segment_fd
+
+    def _seal_segment(self) -> None:
+        # has to be called with write lock held
+        if self._segment_fd is None or self._segment_name is None:
+            return
+        if self.config.fsync != FsyncPolicy.NEVER:
+            os.fsync(self._segment_fd)
+        os.close(self._segment_fd)
+        os.rename(
+            self._path(self._segment_name + OPEN_SUFFIX), self._path(self._segment_name + SEALED_SUFFIX)
+        )
+        self._segment_fd = None
+        self._segment_name = None
+
+    def _fsync(self, fd: int, last_fsync: float) -> float:
+        """Syncs file according to fsync policy. Returns time of its last fsync."""
+        if self.config.fsync == FsyncPolicy.ALWAYS or (
+            self.config.fsync == FsyncPolicy.INTERVAL
+            and time.monotonic() - last_fsync >= self.config.fsync_interval
+        ):
+            os.fsync(fd)
+            return time.monotonic()
+        return last_fsync
+
+    def _ensure_drainer(self) -> None:
+        if self._drainer is None or not self._drainer.is_alive():
+            self._drainer = threading.Thread(target=self._run, name="openlineage-spool-drainer", daemon=True)
+            self._drainer.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            processed = self.forwarded + self.dropped
+            try:
+                if self._acquire_drainer_lock():
+                    self._drain()
+            except Exception:
+                log.exception("OpenLineage spool drainer failed, will retry.")
+            with self._wakeup:
+                self._wakeup.notify_all()
+                # events may have been spooled while draining
+                if self.forwarded + self.dropped == processed:
+                    self._wakeup.wait(self.config.poll_interval)
+
+    def _acquire_drainer_lock(self) -> bool:
+        if fcntl is None or self._lock_fd is not None:
+            return True
+        fd = os.open(self._path(DRAINER_LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._lock_fd = fd
+        return True
+
+    def _drain(self) -> bool:
+        """Forwards events from all segments. Returns False if it stopped on an event it could not forward."""
+        checkpoint = self._read_checkpoint()
+        for name, path, sealed in self._segments():
+            offset = checkpoint.get(name, 0)
+            try:
+                with open(path, "rb") as segment:
+                    segment.seek(offset)
+                    data = segment.read()
+            except FileNotFoundError:
+                # sealed in the meantime, will be read on the next pass
+                continue
+            position = 0
+            while (end := data.find(b"\n", position)) != -1:
+                if not self._forward(data[position:end]):
+                    return False
+                position = end + 1
+                checkpoint[name] = offset + position
+                self._write_checkpoint(checkpoint)
+            if sealed:
+                if position < len(data):
+                    log.warning(
+                        "Dropping incomplete OpenLineage event at the end of spool segment `%s`.", path
+                    )
+                    self.dropped += 1
+                os.remove(path)
+                checkpoint.pop(name, None)
+                self._write_checkpoint(checkpoint)
+        return True
+
+    def _forward(self, line: bytes) -> bool:
+        try:
+            # Spooled events might have been written by another process, so they are rebuilt from JSON.
+            event = _to_event(json.loads(line))
+        except (ValueError, TypeError, KeyError, AttributeError):
+            log.warning("Dropping corrupted OpenLineage event from spool `%s`.", self.config.directory)
+            self.dropped += 1
+            return True
+        attempt = 0
+        while True:
+            try:
+                if supports_emit_serialized(self.transport):
+                    self.transport.emit_serialized(line, event)
+                else:
+                    self.transport.emit(event)
+            except (TypeError, AttributeError) as e:
+                # wrapped transport can't handle the event, retrying it would block the spool
+                log.warning("Dropping spooled OpenLineage event the wrapped transport can't emit: %s", e)
+                self.failed_attempts += 1
+                self.dropped += 1
+                return True
+            except Exception as e:  # noqa: BLE001
+                attempt += 1
+                self.failed_attempts += 1
+                if self.config.max_attempts is not None and attempt >= self.config.max_attempts:
+                    log.warning("Dropping spooled OpenLineage event after %d failed attempts: %s", attempt, e)
+                    self.dropped += 1
+                    return True
+                delay = min(self.config.max_backoff, self.config.backoff * 2 ** (attempt - 1))
+                log.warning("Failed to forward spooled OpenLineage event, retrying in %.1fs: %s", delay, e)
+                if self._stop.wait(delay):
+                    return False
+            else:
+                self.forwarded += 1
+                return True
+
+    def _segments(self) -> list[tuple[str, str, bool]]:
+        """Returns name, path and whether no more events will be written for each segment, oldest first."""
+        segments = []
+        for file_name in sorted(os.listdir(self.config.directory)):
+            name, suffix = os.path.splitext(file_name)
+            if suffix == SEALED_SUFFIX:
+                segments.append((name, self._path(file_name), True))
+            elif suffix == OPEN_SUFFIX:
+                segments.append((name, self._path(file_name), self._is_abandoned(name)))
+        return segments
+
+    def _is_abandoned(self, name: str) -> bool:
+        """Checks whether the process that opened segment exited without sealing it."""
+        pid = int(name.rsplit("-", 1)[1])
+        if pid == os.getpid():
+            # pid can be reused, e.g. by containers restarted with pid 1
+            return name != self._segment_name
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+        return False
+
+    def _segments_size(self, exclude: str | None) -> int:
+        size = 0
+        for file_name in os.listdir(self.config.directory):
+            name, suffix = os.path.splitext(file_name)
+            if suffix in (OPEN_SUFFIX, SEALED_SUFFIX) and name != exclude:
+                size += _file_size(self._path(file_name))
+        return size
+
+    def _pending_bytes(self) -> int:
+        checkpoint = self._read_checkpoint()
+        return sum(max(0, _file_size(path) - checkpoint.get(name, 0)) for name, path, _ in self._segments())
+
+    def _read_checkpoint(self) -> dict[str, int]:
+        try:
+            with open(self._path(CHECKPOINT_FILE)) as f:
+                return dict(json.load(f))
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            log.warning("Ignoring corrupted OpenLineage spool checkpoint, events may be forwarded again.")
+            return {}
+
+    def _write_checkpoint(self, checkpoint: dict[str, int]) -> None:
+        tmp_path = self._path(CHECKPOINT_FILE + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            self._last_checkpoint_fsync = self._fsync(f.fileno(), self._last_checkpoint_fsync)
+        os.replace(tmp_path, self._path(CHECKPOINT_FILE))
+
+    def _path(self, file_name: str) -> str:
+        return os.path.join(self.config.directory, file_name)
+
+
+def _to_event(data: dict[str, Any]) -> Event:
+    """
+    Rebuilds spooled event for the wrapped transport. Facets are left as dicts, which are serialized the same
+    way as facet objects, except for `parent` run facet read by transports, e.g. for Kafka message key.
+    """
+    common = {"eventTime": data["eventTime"], "producer": data.get("producer", "")}
+    event: Event
+    if "run" in data:
+        event = event_v2.RunEvent(
+            eventType=event_v2.RunState(data["eventType"]) if data.get("eventType") else None,
+            run=event_v2.Run(
+                runId=data["run"]["runId"], facets=_to_run_facets(data["run"].get("facets") or {})
+            ),
+            job=_to_job(data["job"]),
+            inputs=[_to_input_dataset(dataset) for dataset in data.get("inputs", [])],
+            outputs=[_to_output_dataset(dataset) for dataset in data.get("outputs", [])],
+            **common,
+        )
+    elif "job" in data:
+        event = event_v2.JobEvent(
+            job=_to_job(data["job"]),
+            inputs=[_to_input_dataset(dataset) for dataset in data.get("inputs", [])],
+            outputs=[_to_output_dataset(dataset) for dataset in data.get("outputs", [])],
+            **common,
+        )
+    elif "dataset" in data:
+        dataset = data["dataset"]
+        event = event_v2.DatasetEvent(
+            dataset=StaticDataset(
+                namespace=dataset["namespace"], name=dataset["name"], facets=dataset.get("facets", {})
+            ),
+            **common,
+        )
+    else:
+        msg = "Spooled JSON is not an OpenLineage event"
+        raise ValueError(msg)
+    if "schemaURL" in data:
+        # schema URL of event classes is fixed, events might have been emitted with another one
+        event.schemaURL = data["schemaURL"]
+    return event
+
+
+def _to_run_facets(facets: dict[str, Any]) -> dict[str, Any]:
+    parent = facets.get("parent")
+    if not isinstance(parent, dict):
+        return facets
+    root = parent.get("root")
+    facet = parent_run.ParentRunFacet(
+        run=parent_run.Run(runId=parent["run"]["runId"]),
+        job=parent_run.Job(namespace=parent["job"]["namespace"], name=parent["job"]["name"]),
+        root=parent_run.Root(
+            run=parent_run.RootRun(runId=root["run"]["runId"]),
+            job=parent_run.RootJob(namespace=root["job"]["namespace"], name=root["job"]["name"]),
+        )
+        if root
+        else None,
+        producer=parent.get("_producer", ""),
+    )
+    if "_schemaURL" in parent:
+        facet._schemaURL = parent["_schemaURL"]  # noqa: SLF001
+    return {**facets, "parent": facet}
+
+
+def _to_job(data: dict[str, Any]) -> event_v2.Job:
+    return event_v2.Job(namespace=data["namespace"], name=data["name"], facets=data.get("facets", {}))
+
+
+def _to_input_dataset(data: dict[str, Any]) -> event_v2.InputDataset:
+    return event_v2.InputDataset(
+        namespace=data["namespace"],
+        name=data["name"],
+        facets=data.get("facets", {}),
+        inputFacets=data.get("inputFacets", {}),
+    )
+
+
+def _to_output_dataset(data: dict[str, Any]) -> event_v2.OutputDataset:
+    return event_v2.OutputDataset(
+        namespace=data["namespace"],
+        name=data["name"],
+        facets=data.get("facets", {}),
+        outputFacets=data.get("outputFacets", {}),
+    )
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        # removed by drainer in the meantime
+        return 0
@@ -7,6 +7,9 @@ Transport needs to
  * specify class variable `config` that will point to Config class that Transport requires
  * __init__ that will accept specified Config class instance
  * implement `emit` method that will accept RunEvent
+ * optionally implement `emit_serialized` if it sends event serialized with `Serde.to_json_bytes`,
+   so that CompositeTransport can serialize event once for all its transports
+ * optionally implement `wait_for_completion` and `close` methods if it buffers events or holds resources
 
 Config file is read and parameters there are passed to `from_dict` classmethod.
 The config class can have more complex attributes, but needs to be able to
@@ -44,10 +47,35 @@ class Transport:
     def emit(self, event: Event) -> Any:
         raise NotImplementedError
 
+    def emit_serialized(self, payload: bytes, event: Event) -> Any:  # noqa: ARG002
+        """Emits event, for which `payload` is the result of `Serde.to_json_bytes(event)`."""
+        return self.emit(event)
+
+    def wait_for_completion(self, timeout: float | None = None) -> bool:  # noqa: ARG002
+        """Delivers buffered events. Returns False if not everything was delivered within timeout."""
+        return True
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Flushes and releases resources held by transport."""
+        return self.wait_for_completion(timeout)
+
     def __str__(self) -> str:
         return f"<{self.__class__.__name__}(name={self.name}, kind={self.kind})>"
 
 
+def supports_emit_serialized(transport: Transport) -> bool:
+    """
+    Checks whether transport's class implements `emit_serialized` itself. If a subclass overrides only `emit`,
+    the inherited `emit_serialized` would skip the override, so the event has to be passed to `emit` instead.
+    """
+    for klass in type(transport).__mro__:
+        if "emit_serialized" in klass.__dict__:
+            return klass is not Transport
+        if "emit" in klass.__dict__:
+            return False
+    return False
+
+
 class TransportFactory:
     def create(self, config: dict[str, str] | None = None) -> Transport:
         raise NotImplementedError
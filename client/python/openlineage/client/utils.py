@@ -2,9 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import atexit
 import importlib
 import logging
-from typing import Any, ClassVar, cast
+from enum import IntEnum
+from typing import Any, Callable, ClassVar, cast
 
 import attr
 
@@ -29,6 +31,39 @@ def try_import_from_string(path: str) -> type[Any] | None:
         return None
 
 
+class ExitStage(IntEnum):
+    """Order in which exit hooks run, independent of the order their modules were imported in."""
+
+    # async emitters hand queued events over to transports
+    EMITTERS = 0
+    # transports send buffered events
+    TRANSPORTS = 1
+    # metrics are exported last, including ones recorded by earlier stages
+    METRICS = 2
+
+
+_exit_hooks: list[tuple[ExitStage, int, Callable[[], None]]] = []
+
+
+def register_exit_hook(hook: Callable[[], None], stage: ExitStage) -> Callable[[], None]:
+    """
+    Runs hook at interpreter exit after hooks of earlier stages. Hooks of the same stage run in order of
+    registration.
+    """
+    if not _exit_hooks:
+        atexit.register(_run_exit_hooks)
+    _exit_hooks.append((stage, len(_exit_hooks), hook))
+    return hook
+
+
+def _run_exit_hooks() -> None:
+    for _, _, hook in sorted(_exit_hooks, key=lambda item: item[:2]):
+        try:
+            hook()
+        except Exception:
+            log.exception("OpenLineage exit hook %s failed", hook)
+
+
 # Filter dictionary to get only those key: value pairs that have
 # key specified in passed attr class
 def get_only_specified_fields(clazz: type[Any], params: dict[str, Any]) -> dict[str, Any]:
@@ -0,0 +1,303 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from openlineage.client import AsyncOpenLineageClient
+from openlineage.client.event_v2 import Job, Run, RunEvent, RunState
+from openlineage.client.transport.aio import (
+    AsyncCompositeTransport,
+    AsyncConsoleTransport,
+    AsyncFileTransport,
+    AsyncHttpTransport,
+    AsyncNoopTransport,
+    AsyncTransport,
+    SyncTransportAdapter,
+    get_default_async_factory,
+)
+from openlineage.client.transport.composite import CompositeConfig
+from openlineage.client.transport.http import HttpCompression, HttpConfig
+from openlineage.client.uuid import generate_new_uuid
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def make_event(name: str = "job") -> RunEvent:
+    return RunEvent(
+        eventType=RunState.START,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId=str(generate_new_uuid())),
+        job=Job(namespace="default", name=name),
+    )
+
+
+class RecordingTransport(AsyncTransport):
+    kind = "recording"
+
+    def __init__(self, fail: bool = False, delay: float = 0) -> None:
+        self.fail = fail
+        self.delay = delay
+        self.events: list[RunEvent] = []
+        self.closed = False
+
+    async def emit(self, event: RunEvent) -> None:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            msg = "emit failed"
+            raise RuntimeError(msg)
+        self.events.append(event)
+
+    async def close(self, timeout: float | None = None) -> bool:  # noqa: ARG002
+        self.closed = True
+        return True
+
+
+def mock_http_transport(handler, **config) -> AsyncHttpTransport:
+    transport = AsyncHttpTransport(HttpConfig(url="http://backend:5000", **config))
+    transport._create_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))  # noqa: SLF001
+    return transport
+
+
+def test_async_client_emits_with_passed_transport() -> None:
+    transport = RecordingTransport()
+    event = make_event()
+
+    async def run() -> None:
+        async with AsyncOpenLineageClient(transport=transport) as client:
+            await client.emit(event)
+
+    asyncio.run(run())
+    assert transport.events == [event]
+    assert transport.closed
+
+
+def test_async_client_fails_with_wrong_event_type() -> None:
+    client = AsyncOpenLineageClient(transport=RecordingTransport())
+    with pytest.raises(ValueError, match="`emit` only accepts RunEvent, DatasetEvent, JobEvent class"):
+        asyncio.run(client.emit("event"))
+
+
+def test_async_client_applies_filters_and_tags() -> None:
+    transport = RecordingTransport()
+    client = AsyncOpenLineageClient(
+        transport=transport,
+        config={"filters": [{"type": "exact", "match": "filtered"}], "tags": {"job": {"team": "lineage"}}},
+    )
+
+    async def run() -> None:
+        await client.emit(make_event("filtered"))
+        await client.emit(make_event("kept"))
+
+    asyncio.run(run())
+    assert [e.job.name for e in transport.events] == ["kept"]
+    assert transport.events[0].job.facets["tags"].tags[0].key == "team"
+
+
+@patch.dict(os.environ, {"OPENLINEAGE_DISABLED": "true"})
+def test_async_client_disabled() -> None:
+    assert isinstance(AsyncOpenLineageClient().transport, AsyncNoopTransport)
+
+
+@patch.dict(os.environ, {"OPENLINEAGE_URL": "http://backend:5000", "OPENLINEAGE_API_KEY": "key"})
+def test_async_client_http_transport_from_env_variables() -> None:
+    transport = AsyncOpenLineageClient().transport
+    assert isinstance(transport, AsyncHttpTransport)
+    assert transport.url == "http://backend:5000"
+    assert transport.config.auth.api_key == "key"
+
+
+def test_async_client_from_config() -> None:
+    client = AsyncOpenLineageClient(
+        config={
+            "transport": {
+                "type": "composite",
+                "transports": {
+                    "local": {"type": "console"},
+                    "remote": {"type": "http", "url": "http://x:5000"},
+                },
+            }
+        }
+    )
+    assert isinstance(client.transport, AsyncCompositeTransport)
+    assert [type(t) for t in client.transport.transports] == [AsyncConsoleTransport, AsyncHttpTransport]
+    assert client.transport.transports[0].name == "local"
+
+
+def test_async_factory_wraps_sync_only_transport() -> None:
+    transport = get_default_async_factory().create({"type": "tests.transport.FakeTransport"})
+    assert isinstance(transport, SyncTransportAdapter)
+    assert transport.kind == "fake"
+
+
+def test_sync_transport_adapter_runs_in_thread() -> None:
+    sync_transport = MagicMock()
+    event = make_event()
+    asyncio.run(SyncTransportAdapter(sync_transport).emit(event))
+    sync_transport.emit.assert_called_once_with(event)
+
+
+def test_async_http_transport_posts_event() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201)
+
+    transport = mock_http_transport(
+        handler, compression=HttpCompression.GZIP, custom_headers={"X-Custom": "1"}
+    )
+    event = make_event()
+    asyncio.run(transport.emit(event))
+
+    assert len(requests) == 1
+    assert str(requests[0].url) == "http://backend:5000/api/v1/lineage"
+    assert requests[0].headers["Content-Encoding"] == "gzip"
+    assert requests[0].headers["X-Custom"] == "1"
+    assert json.loads(gzip.decompress(requests[0].content))["job"]["name"] == "job"
+
+
+def test_async_http_transport_retries() -> None:
+    statuses = [503, 502, 201]
+    responses = iter(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+        return httpx.Response(next(responses))
+
+    transport = mock_http_transport(handler, retry={"total": 2, "status_forcelist": [502, 503]})
+    assert asyncio.run(transport.emit(make_event())).status_code == statuses[-1]
+
+
+def test_async_http_transport_raises_after_retries() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+        return httpx.Response(503)
+
+    transport = mock_http_transport(handler, retry={"total": 1, "status_forcelist": [503]})
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(transport.emit(make_event()))
+
+
+def test_async_http_transport_caps_requests_in_flight() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return httpx.Response(201)
+
+    transport = mock_http_transport(handler, pool_maxsize=8)
+
+    async def run() -> None:
+        await asyncio.gather(*(transport.emit(make_event()) for _ in range(2000)))
+        await transport.close()
+
+    asyncio.run(run())
+    assert 1 <= max_in_flight <= transport.config.pool_maxsize
+
+
+def test_async_http_transport_close_honours_timeout() -> None:
+    transport = mock_http_transport(lambda _: httpx.Response(201))
+
+    async def slow_close() -> None:
+        await asyncio.sleep(5)
+
+    async def run() -> bool:
+        await transport.emit(make_event())
+        transport._client.aclose = slow_close  # noqa: SLF001
+        return await transport.close(timeout=0.01)
+
+    assert not asyncio.run(run())
+    assert transport._client is None  # noqa: SLF001
+
+
+def test_async_http_transport_warns_about_ignored_deferred_retry(caplog: pytest.LogCaptureFixture) -> None:
+    AsyncHttpTransport(HttpConfig.from_dict({"url": "http://backend:5000", "deferred_retry": {}}))
+    assert "`deferred_retry`" in caplog.text
+
+
+def test_async_http_transport_closes_client_of_previous_event_loop() -> None:
+    transport = mock_http_transport(lambda _: httpx.Response(201))
+    asyncio.run(transport.emit(make_event()))
+    first_client = transport._client  # noqa: SLF001
+
+    async def run() -> None:
+        await transport.emit(make_event())
+        await asyncio.sleep(0)
+        await transport.close()
+
+    asyncio.run(run())
+    assert first_client is not None
+    assert first_client.is_closed
+    assert not transport._closing  # noqa: SLF001
+
+
+def test_async_composite_transport_continues_on_failure() -> None:
+    config = CompositeConfig(transports=[], continue_on_failure=True)
+    transport = AsyncCompositeTransport(config)
+    failing, working = RecordingTransport(fail=True), RecordingTransport()
+    transport.__dict__["transports"] = [failing, working]
+
+    asyncio.run(transport.emit(make_event()))
+    assert len(working.events) == 1
+
+
+def test_async_composite_transport_raises_on_failure() -> None:
+    transport = AsyncCompositeTransport(CompositeConfig(transports=[], continue_on_failure=False))
+    failing, working = RecordingTransport(fail=True), RecordingTransport()
+    transport.__dict__["transports"] = [failing, working]
+
+    with pytest.raises(RuntimeError, match="failed to emit event"):
+        asyncio.run(transport.emit(make_event()))
+    # transports are called one after another, emission stops at the first failure
+    assert working.events == []
+
+
+def test_async_composite_transport_parallel_raises_after_all_finished() -> None:
+    config = CompositeConfig(transports=[], continue_on_failure=False, parallel=True)
+    transport = AsyncCompositeTransport(config)
+    failing, working = RecordingTransport(fail=True), RecordingTransport()
+    transport.__dict__["transports"] = [failing, working]
+
+    with pytest.raises(RuntimeError, match="failed to emit event"):
+        asyncio.run(transport.emit(make_event()))
+    assert len(working.events) == 1
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_async_composite_transport_honours_timeout(parallel: bool) -> None:
+    config = CompositeConfig(transports=[], continue_on_failure=False, parallel=parallel, timeout=0.01)
+    transport = AsyncCompositeTransport(config)
+    slow, working = RecordingTransport(delay=5), RecordingTransport()
+    transport.__dict__["transports"] = [working, slow]
+
+    with pytest.raises(RuntimeError, match="failed to emit event") as exc_info:
+        asyncio.run(transport.emit(make_event()))
+    assert isinstance(exc_info.value.__cause__, TimeoutError)
+    assert len(working.events) == 1
+    assert slow.events == []
+
+
+def test_async_file_transport(tmp_path: Path) -> None:
+    from openlineage.client.transport.file import FileConfig
+
+    log_file = tmp_path / "events.json"
+    transport = AsyncFileTransport(FileConfig(log_file_path=str(log_file), append=True))
+
+    async def run() -> None:
+        await asyncio.gather(*(transport.emit(make_event(str(i))) for i in range(10)))
+
+    asyncio.run(run())
+    lines = log_file.read_text().splitlines()
+    assert sorted(json.loads(line)["job"]["name"] for line in lines) == [str(i) for i in range(10)]
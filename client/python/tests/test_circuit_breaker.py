@@ -0,0 +1,168 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from openlineage.client import OpenLineageClient
+from openlineage.client.event_v2 import Job, Run, RunEvent, RunState
+from openlineage.client.transport import Config, Transport, get_default_factory
+from openlineage.client.transport.circuit_breaker import (
+    CircuitBreakerConfig,
+    CircuitBreakerTransport,
+    CircuitOpenError,
+    CircuitState,
+)
+from openlineage.client.uuid import generate_new_uuid
+
+
+def make_event(name: str = "job") -> RunEvent:
+    return RunEvent(
+        eventType=RunState.START,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId=str(generate_new_uuid())),
+        job=Job(namespace="default", name=name),
+    )
+
+
+class SwitchableTransport(Transport):
+    """Fails while `failing` is set, records events otherwise."""
+
+    kind = "switchable"
+
+    def __init__(self, config: Config) -> None:  # noqa: ARG002
+        self.failing = False
+        self.calls = 0
+        self.events: list[Any] = []
+
+    def emit(self, event: Any) -> None:
+        self.calls += 1
+        if self.failing:
+            msg = "backend unavailable"
+            raise ConnectionError(msg)
+        self.events.append(event)
+
+
+def breaker(**config: Any) -> CircuitBreakerTransport:
+    return CircuitBreakerTransport(
+        CircuitBreakerConfig(transport={"type": "tests.test_circuit_breaker.SwitchableTransport"}, **config)
+    )
+
+
+def fail_times(transport: CircuitBreakerTransport, times: int) -> None:
+    for _ in range(times):
+        with pytest.raises(ConnectionError):
+            transport.emit(make_event())
+
+
+def test_circuit_breaker_config_requires_transport() -> None:
+    with pytest.raises(RuntimeError, match="transport"):
+        CircuitBreakerConfig.from_dict({"failure_threshold": 3})
+
+
+@pytest.mark.parametrize("option", ["batch", "deferred_retry"])
+def test_circuit_breaker_rejects_http_transport_delivering_in_background(option: str) -> None:
+    config = CircuitBreakerConfig(transport={"type": "http", "url": "http://backend:5000", option: {}})
+    with pytest.raises(ValueError, match="in background"):
+        CircuitBreakerTransport(config)
+
+
+def test_circuit_breaker_from_client_config() -> None:
+    failure_threshold = 2
+    transport = get_default_factory().create(
+        {"type": "circuit-breaker", "transport": {"type": "console"}, "failure_threshold": failure_threshold}
+    )
+    assert isinstance(transport, CircuitBreakerTransport)
+    assert transport.kind == "circuit-breaker"
+    assert transport.transport.kind == "console"
+    assert transport.config.failure_threshold == failure_threshold
+
+
+def test_circuit_breaker_opens_after_consecutive_failures() -> None:
+    failure_threshold = 3
+    transport = breaker(failure_threshold=failure_threshold)
+    transport.transport.failing = True
+    fail_times(transport, failure_threshold)
+    assert transport.state is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        transport.emit(make_event())
+    assert transport.transport.calls == failure_threshold
+    assert (transport.opened, transport.short_circuited) == (1, 1)
+
+
+def test_circuit_breaker_success_resets_consecutive_failures() -> None:
+    transport = breaker(failure_threshold=2)
+    for _ in range(3):
+        transport.transport.failing = True
+        fail_times(transport, 1)
+        transport.transport.failing = False
+        transport.emit(make_event())
+    assert transport.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_opens_on_failure_rate() -> None:
+    transport = breaker(failure_threshold=100, failure_rate=0.5, window=4, min_calls=4)
+    for failing in (False, True, False, True):
+        transport.transport.failing = failing
+        if failing:
+            fail_times(transport, 1)
+        else:
+            transport.emit(make_event())
+    assert transport.state is CircuitState.OPEN
+
+
+def test_circuit_breaker_diverts_to_fallback_while_open() -> None:
+    transport = breaker(failure_threshold=1, fallback={"type": "tests.transport.AccumulatingTransport"})
+    transport.transport.failing = True
+    fail_times(transport, 1)
+
+    event = make_event()
+    transport.emit(event)
+    assert transport.fallback.events == [event]
+    assert transport.diverted == 1
+
+
+def test_circuit_breaker_half_open_probe_closes_circuit() -> None:
+    transport = breaker(failure_threshold=1, open_duration=30, half_open_probes=2)
+    transport.transport.failing = True
+    fail_times(transport, 1)
+
+    with patch("time.monotonic", return_value=transport._opened_at + 30):  # noqa: SLF001
+        assert transport.state is CircuitState.HALF_OPEN
+        transport.transport.failing = False
+        transport.emit(make_event())
+        assert transport.state is CircuitState.HALF_OPEN
+        transport.emit(make_event())
+        assert transport.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_failed_probe_reopens_circuit() -> None:
+    transport = breaker(failure_threshold=1, open_duration=30)
+    transport.transport.failing = True
+    fail_times(transport, 1)
+    opened_at = transport._opened_at  # noqa: SLF001
+
+    with patch("time.monotonic", return_value=opened_at + 30):
+        fail_times(transport, 1)
+        assert transport.state is CircuitState.OPEN
+        # only one probe was let through
+        with pytest.raises(CircuitOpenError):
+            transport.emit(make_event())
+    assert transport.opened == len(["failure", "failed probe"])
+
+
+def test_client_with_circuit_breaker() -> None:
+    client = OpenLineageClient(
+        config={
+            "transport": {
+                "type": "circuit-breaker",
+                "transport": {"type": "tests.test_circuit_breaker.SwitchableTransport"},
+            }
+        }
+    )
+    event = make_event()
+    client.emit(event)
+    assert client.transport.transport.events == [event]
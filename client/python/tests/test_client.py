@@ -10,7 +10,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from openlineage.client import event_v2
-from openlineage.client.client import OpenLineageClient, OpenLineageClientOptions, OpenLineageConfig
+from openlineage.client.client import (
+    OpenLineageClient,
+    OpenLineageClientOptions,
+    OpenLineageConfig,
+    invalidate_config_cache,
+)
 from openlineage.client.facets import FacetsConfig
 from openlineage.client.generated.environment_variables_run import (
     EnvironmentVariable,
@@ -103,7 +108,7 @@ def test_client_sends_proper_json_with_minimal_run_event() -> None:
     )
     session.post.assert_called_with(
         url="http://example.com/api/v1/lineage",
-        data=body,
+        data=body.encode("utf-8"),
         headers={"Content-Type": "application/json"},
         timeout=5.0,
         verify=True,
@@ -131,7 +136,7 @@ def test_client_sends_proper_json_with_minimal_dataset_event() -> None:
     )
     session.post.assert_called_with(
         url="http://example.com/api/v1/lineage",
-        data=body,
+        data=body.encode("utf-8"),
         headers={"Content-Type": "application/json"},
         timeout=5.0,
         verify=True,
@@ -160,7 +165,7 @@ def test_client_sends_proper_json_with_minimal_job_event() -> None:
 
     session.post.assert_called_with(
         url="http://example.com/api/v1/lineage",
-        data=body,
+        data=body.encode("utf-8"),
         headers={"Content-Type": "application/json"},
         timeout=5.0,
         verify=True,
@@ -520,6 +525,46 @@ def test_config_property_loads_yaml(mock_get_config_content, mock_find_yaml):
     assert config.transport["url"] == "http://localhost:5050"
 
 
+def test_config_is_cached_until_file_or_env_vars_change(mocker: MockerFixture, tmp_path: Path) -> None:
+    config_path = tmp_path / "openlineage.yml"
+    config_path.write_text("transport:\n  type: http\n  url: http://localhost:5050\n")
+    mocker.patch.dict(os.environ, {"OPENLINEAGE_CONFIG": str(config_path)})
+    read_file = mocker.patch.object(
+        OpenLineageClient,
+        "_get_config_file_content",
+        side_effect=OpenLineageClient._get_config_file_content,  # noqa: SLF001
+    )
+
+    assert OpenLineageClient().config.transport["url"] == "http://localhost:5050"
+    assert OpenLineageClient().config.transport["url"] == "http://localhost:5050"
+    reads = 1
+    assert read_file.call_count == reads
+
+    config_path.write_text("transport:\n  type: http\n  url: http://localhost:5051\n")
+    assert OpenLineageClient().config.transport["url"] == "http://localhost:5051"
+    reads += 1
+    assert read_file.call_count == reads
+
+    mocker.patch.dict(os.environ, {"OPENLINEAGE__TRANSPORT__ENDPOINT": "api/v2"})
+    config = OpenLineageClient().config
+    assert config.transport["url"] == "http://localhost:5051"
+    assert config.transport["endpoint"] == "api/v2"
+    reads += 1
+    assert read_file.call_count == reads
+
+    invalidate_config_cache()
+    OpenLineageClient()
+    reads += 1
+    assert read_file.call_count == reads
+
+
+def test_cached_config_is_not_shared_between_clients(mocker: MockerFixture) -> None:
+    mocker.patch.dict(os.environ, {"OPENLINEAGE__TRANSPORT__TYPE": "console"})
+    mocker.patch.object(OpenLineageClient, "_find_yaml_config_path", return_value=None)
+    OpenLineageClient().config.transport["type"] = "http"
+    assert OpenLineageClient().config.transport == {"type": "console"}
+
+
 @patch.dict(
     "os.environ",
     {"OPENLINEAGE_URL": "http://example.com", "OPENLINEAGE_ENDPOINT": "v7", "OPENLINEAGE_API_KEY": "xxx"},
@@ -1114,6 +1159,53 @@ def test_client_keeps_key_case_for_existing_tags(transport, run_event_multi):
         assert event_tags == expected_tags
 
 
+def test_client_does_not_modify_configured_tags_when_overriding_key_case(transport):
+    client = OpenLineageClient(transport=transport, config={"tags": {"run": {"environment": "PRODUCTION"}}})
+    run = event_v2.Run(
+        runId=str(generate_new_uuid()),
+        facets={"tags": TagsRunFacet(tags=[TagsRunFacetFields("ENVIRONMENT", "STAGING", "USER")])},
+    )
+    event = event_v2.RunEvent(
+        eventType=event_v2.RunState.START,
+        eventTime="2021-11-03T10:53:52.427343",
+        run=run,
+        job=event_v2.Job(namespace="namespace", name="name"),
+    )
+    client.emit(event)
+    assert transport.event.run.facets["tags"].tags == [
+        TagsRunFacetFields("ENVIRONMENT", "PRODUCTION", "USER")
+    ]
+    assert client.config.tags.run == [TagsRunFacetFields("environment", "PRODUCTION", "USER")]
+
+
+def test_client_prepares_environment_facet_once(transport, caplog: pytest.LogCaptureFixture) -> None:
+    def emit_run_event() -> list[EnvironmentVariable]:
+        client.emit(
+            event_v2.RunEvent(
+                eventType=event_v2.RunState.START,
+                eventTime="2021-11-03T10:53:52.427343",
+                run=event_v2.Run(runId=str(generate_new_uuid())),
+                job=event_v2.Job(namespace="namespace", name="name"),
+            )
+        )
+        return transport.event.run.facets["environmentVariables"].environmentVariables
+
+    config = {"facets": {"environment_variables": ["ENV_VAR_1", "MISSING_VAR"]}}
+    with (
+        patch.dict(os.environ, {"ENV_VAR_1": "value1"}),
+        caplog.at_level(logging.WARNING, logger="openlineage.client.client"),
+    ):
+        client = OpenLineageClient(transport=transport, config=config)
+        os.environ["ENV_VAR_1"] = "value2"
+        assert emit_run_event() == [EnvironmentVariable(name="ENV_VAR_1", value="value1")]
+        assert emit_run_event() == [EnvironmentVariable(name="ENV_VAR_1", value="value1")]
+
+        client.refresh_configured_facets()
+        assert emit_run_event() == [EnvironmentVariable(name="ENV_VAR_1", value="value2")]
+    # logged when facets are prepared, not for every event
+    assert caplog.text.count("The following environment variables are missing") == len(["init", "refresh"])
+
+
 def test_client_creates_tag_facets_for_job_events(transport, job_event_multi):
     """
     Same code is used for run and job events to update facets. This just verifies
@@ -1161,3 +1253,58 @@ def test_client_does_not_update_run_tags_for_job_events(transport, job_event_mul
         event_tags = sorted(transport.event.job.facets["tags"].tags, key=lambda x: x.key)
         expected_tags = sorted(tags, key=lambda x: x.key)
         assert event_tags == expected_tags
+
+
+def _event_with_lazy_facets(name: str, **facets) -> event_v2.RunEvent:
+    return event_v2.RunEvent(
+        eventType=event_v2.RunState.START,
+        eventTime="2024-01-01T00:00:00Z",
+        run=event_v2.Run(runId=str(generate_new_uuid()), facets=facets),
+        job=event_v2.Job(namespace="default", name=name),
+        outputs=[
+            event_v2.OutputDataset(namespace="default", name="table", facets={"schema": facets.get("schema")})
+        ],
+    )
+
+
+def test_client_resolves_lazy_facets_once_before_emitting() -> None:
+    transport = MagicMock()
+    calls = []
+
+    def environment() -> EnvironmentVariablesRunFacet:
+        calls.append("environment")
+        return EnvironmentVariablesRunFacet(environmentVariables=[EnvironmentVariable(name="A", value="1")])
+
+    def failing() -> None:
+        msg = "git unavailable"
+        raise RuntimeError(msg)
+
+    client = OpenLineageClient(transport=transport)
+    event = _event_with_lazy_facets(
+        "job", environmentVariables=environment, nothing=lambda: None, failing=failing
+    )
+    client.emit(event)
+
+    emitted = transport.emit.call_args.args[0]
+    assert list(emitted.run.facets) == ["environmentVariables"]
+    assert emitted.run.facets["environmentVariables"].environmentVariables[0].name == "A"
+    assert calls == ["environment"]
+
+
+def test_client_does_not_resolve_lazy_facets_of_filtered_event() -> None:
+    transport = MagicMock()
+    lazy_facet = MagicMock()
+    client = OpenLineageClient(
+        transport=transport, config={"filters": [{"type": "exact", "match": "filtered"}]}
+    )
+    client.emit(_event_with_lazy_facets("filtered", custom=lazy_facet, schema=lazy_facet))
+
+    lazy_facet.assert_not_called()
+    transport.emit.assert_not_called()
+
+
+@patch.dict(os.environ, {"OPENLINEAGE_DISABLED": "true"})
+def test_disabled_client_does_not_resolve_lazy_facets() -> None:
+    lazy_facet = MagicMock()
+    OpenLineageClient().emit(_event_with_lazy_facets("job", custom=lazy_facet))
+    lazy_facet.assert_not_called()
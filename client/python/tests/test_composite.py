@@ -2,10 +2,15 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import threading
+import time
+from typing import Any
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
+from openlineage.client.event_v2 import Job, Run, RunEvent, RunState
+from openlineage.client.serde import Serde
 from openlineage.client.transport.composite import CompositeConfig, CompositeTransport
 from openlineage.client.transport.transport import Transport
 
@@ -138,3 +143,167 @@ def test_emit_failure_continue_on_failure(mock_factory):
 
     mock_transport1.emit.assert_called_once_with(event)
     mock_transport2.emit.assert_called_once_with(event)
+
+
+def make_event() -> RunEvent:
+    return RunEvent(
+        eventType=RunState.START,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId="69f4acab-b87d-4fc0-b27b-8ea950370ff3"),
+        job=Job(namespace="default", name="job"),
+    )
+
+
+class SerializedTransport(Transport):
+    def __init__(self) -> None:
+        self.payloads: list[bytes] = []
+
+    def emit(self, event: Any) -> None:
+        self.emit_serialized(Serde.to_json_bytes(event), event)
+
+    def emit_serialized(self, payload: bytes, event: Any) -> None:  # noqa: ARG002
+        self.payloads.append(payload)
+
+
+class OverridingEmitTransport(SerializedTransport):
+    def emit(self, event: Any) -> None:  # noqa: ARG002
+        self.payloads.append(b"custom")
+
+
+def test_emit_serializes_event_once():
+    first, second, overriding = SerializedTransport(), SerializedTransport(), OverridingEmitTransport()
+    plain = MagicMock(spec=Transport)
+    transport = CompositeTransport(CompositeConfig(transports=[]))
+    transport.__dict__["transports"] = [first, plain, second, overriding]
+    event = make_event()
+
+    with mock.patch.object(Serde, "to_json_bytes", wraps=Serde.to_json_bytes) as to_json_bytes:
+        transport.emit(event)
+
+    to_json_bytes.assert_called_once_with(event)
+    assert first.payloads == second.payloads == [Serde.to_json_bytes(event)]
+    assert first.payloads[0] is second.payloads[0]
+    assert overriding.payloads == [b"custom"]
+    plain.emit.assert_called_once_with(event)
+
+
+def test_nested_composite_reuses_payload():
+    child = SerializedTransport()
+    nested = CompositeTransport(CompositeConfig(transports=[]))
+    nested.__dict__["transports"] = [child]
+    transport = CompositeTransport(CompositeConfig(transports=[]))
+    transport.__dict__["transports"] = [SerializedTransport(), nested]
+
+    with mock.patch.object(Serde, "to_json_bytes", return_value=b"{}") as to_json_bytes:
+        transport.emit(make_event())
+
+    to_json_bytes.assert_called_once()
+    assert child.payloads == [b"{}"]
+
+
+def parallel_composite(children: list[Transport], **config: Any) -> CompositeTransport:
+    transport = CompositeTransport(CompositeConfig(transports=[], parallel=True, **config))
+    transport.__dict__["transports"] = children
+    return transport
+
+
+def test_composite_loads_parallel_config() -> None:
+    params = {"transports": [], "parallel": True, "timeout": 2.5}
+    config = CompositeConfig.from_dict(params)
+    assert config.parallel is True
+    assert config.timeout == params["timeout"]
+
+
+def test_parallel_emit_runs_transports_concurrently() -> None:
+    barrier = threading.Barrier(3, timeout=5)
+    children = [MagicMock(spec=Transport) for _ in range(3)]
+    for child in children:
+        child.emit.side_effect = lambda _: barrier.wait()
+    transport = parallel_composite(children, continue_on_failure=False)
+
+    # would raise BrokenBarrierError if transports were called one after another
+    transport.emit(make_event())
+
+    assert [stats.emitted for stats in transport.stats] == [1, 1, 1]
+    transport.close()
+
+
+def test_parallel_emit_times_out_hung_transport() -> None:
+    release = threading.Event()
+    hung, working = MagicMock(spec=Transport), MagicMock(spec=Transport)
+    hung.emit.side_effect = lambda _: release.wait(5)
+    transport = parallel_composite([hung, working], timeout=0.05)
+
+    start = time.monotonic()
+    transport.emit(make_event())
+    assert time.monotonic() - start < 1
+
+    working.emit.assert_called_once()
+    hung_stats, working_stats = transport.stats
+    assert (hung_stats.failed, hung_stats.timed_out, hung_stats.emitted) == (1, 1, 0)
+    assert (working_stats.failed, working_stats.emitted) == (0, 1)
+    release.set()
+    transport.close()
+
+
+def test_parallel_emit_skips_transport_still_emitting_previous_event() -> None:
+    release = threading.Event()
+    hung, working = MagicMock(spec=Transport), MagicMock(spec=Transport)
+    hung.emit.side_effect = lambda _: release.wait(5)
+    transport = parallel_composite([hung, working], timeout=0.05)
+    events = [make_event() for _ in range(3)]
+
+    for event in events:
+        transport.emit(event)
+
+    hung.emit.assert_called_once()
+    assert working.emit.call_count == len(events)
+    hung_stats, working_stats = transport.stats
+    assert (hung_stats.timed_out, hung_stats.skipped, hung_stats.failed) == (1, 2, 3)
+    assert (working_stats.failed, working_stats.emitted) == (0, len(events))
+
+    release.set()
+    transport._futures[0].result(timeout=5)  # noqa: SLF001
+    # transport is used again after it finished
+    transport.emit(make_event())
+    assert hung.emit.call_count == len(["first", "after release"])
+    transport.close()
+
+
+def test_composite_exports_latency_metrics() -> None:
+    transport = parallel_composite([MagicMock(spec=Transport)])
+    transport.emit(make_event())
+
+    metrics = {metric.name: metric for metric in transport.collect_metrics()}
+    stats = transport.stats[0]
+    assert metrics["composite.latency_seconds"].value == stats.total_latency
+    assert metrics["composite.max_latency_seconds"].value == stats.max_latency
+    assert metrics["composite.average_latency_seconds"].value == stats.average_latency
+    assert metrics["composite.skipped"].value == 0
+    transport.close()
+
+
+def test_parallel_emit_raises_without_continue_on_failure() -> None:
+    failing, working = MagicMock(spec=Transport), MagicMock(spec=Transport)
+    failing.emit.side_effect = Exception("Error")
+    transport = parallel_composite([failing, working], continue_on_failure=False)
+
+    with pytest.raises(RuntimeError, match="failed to emit event"):
+        transport.emit(make_event())
+
+    working.emit.assert_called_once()
+    assert transport.stats[0].failed == 1
+    assert transport.stats[1].emitted == 1
+
+
+def test_sequential_emit_records_stats() -> None:
+    failing, working = MagicMock(spec=Transport), MagicMock(spec=Transport)
+    failing.emit.side_effect = Exception("Error")
+    transport = CompositeTransport(CompositeConfig(transports=[]))
+    transport.__dict__["transports"] = [failing, working]
+
+    transport.emit(make_event())
+    transport.emit(make_event())
+
+    assert [(s.emitted, s.failed) for s in transport.stats] == [(0, 2), (2, 0)]
+    assert transport.stats[1].max_latency >= transport.stats[1].average_latency >= 0
@@ -0,0 +1,264 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from openlineage.client import OpenLineageClient
+from openlineage.client.emitter import AsyncEmitter, EmitterConfig, OverflowPolicy
+from openlineage.client.event_v2 import Job, Run, RunEvent, RunState
+from openlineage.client.facet_v2 import parent_run
+from openlineage.client.transport.kafka import get_message_key
+from openlineage.client.uuid import generate_new_uuid
+
+
+def make_event(name: str = "job", parent: str | None = None, state: RunState = RunState.START) -> RunEvent:
+    facets = {}
+    if parent:
+        facets["parent"] = parent_run.ParentRunFacet(
+            job=parent_run.Job(namespace="default", name=parent),
+            run=parent_run.Run(runId=str(generate_new_uuid())),
+        )
+    return RunEvent(
+        eventType=state,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId=str(generate_new_uuid()), facets=facets),
+        job=Job(namespace="default", name=name),
+    )
+
+
+class BlockingEmit:
+    """Emit function that blocks until released, recording received events."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.events: list[RunEvent] = []
+
+    def __call__(self, event: RunEvent) -> None:
+        self.started.set()
+        self.release.wait(5)
+        self.events.append(event)
+
+
+def test_emitter_config_from_dict() -> None:
+    params = {"type": "async", "queue_size": 10, "overflow_policy": "drop_oldest", "unknown": "value"}
+    config = EmitterConfig.from_dict(params)
+    assert config.is_async
+    assert config.queue_size == params["queue_size"]
+    assert config.overflow_policy is OverflowPolicy.DROP_OLDEST
+    assert config.block_timeout is None
+    assert config.close_timeout == EmitterConfig().close_timeout
+
+
+def test_emitter_config_defaults_to_sync() -> None:
+    assert not EmitterConfig().is_async
+
+
+def test_emitter_config_wrong_workers() -> None:
+    with pytest.raises(ValueError, match="workers"):
+        AsyncEmitter(MagicMock(), EmitterConfig(type="async", workers=0))
+
+
+def test_emitter_config_wrong_overflow_policy() -> None:
+    with pytest.raises(ValueError, match="wrong"):
+        EmitterConfig.from_dict({"overflow_policy": "wrong"})
+
+
+def test_async_emitter_emits_in_order() -> None:
+    emitted = []
+    emitter = AsyncEmitter(emitted.append, EmitterConfig(type="async"))
+    events = [make_event(str(i)) for i in range(100)]
+    for event in events:
+        assert emitter.submit(event)
+    assert emitter.flush(timeout=5)
+    assert emitted == events
+    assert emitter.emitted == len(events)
+    assert emitter.close(timeout=5)
+
+
+def test_async_emitter_continues_after_failure() -> None:
+    results = [RuntimeError("fail"), None]
+    emit_fn = MagicMock(side_effect=results)
+    emitter = AsyncEmitter(emit_fn, EmitterConfig(type="async"))
+    emitter.submit(make_event())
+    emitter.submit(make_event())
+    assert emitter.flush(timeout=5)
+    assert emit_fn.call_count == len(results)
+    assert emitter.failed == 1
+    assert emitter.emitted == 1
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected_names"),
+    [
+        (OverflowPolicy.DROP_NEWEST, ["in-flight", "1", "2"]),
+        (OverflowPolicy.DROP_OLDEST, ["in-flight", "2", "3"]),
+    ],
+)
+def test_async_emitter_overflow_policy(policy: OverflowPolicy, expected_names: list[str]) -> None:
+    emit_fn = BlockingEmit()
+    config = EmitterConfig(type="async", queue_size=2, overflow_policy=policy)
+    emitter = AsyncEmitter(emit_fn, config)
+
+    emitter.submit(make_event("in-flight"))
+    assert emit_fn.started.wait(5)
+    results = [emitter.submit(make_event(name)) for name in ("1", "2", "3")]
+    assert emitter.queue_depth == config.queue_size
+    emit_fn.release.set()
+
+    assert emitter.flush(timeout=5)
+    assert [e.job.name for e in emit_fn.events] == expected_names
+    assert emitter.dropped == 1
+    assert results == ([True, True, False] if policy is OverflowPolicy.DROP_NEWEST else [True, True, True])
+
+
+def test_async_emitter_block_policy_times_out() -> None:
+    emit_fn = BlockingEmit()
+    emitter = AsyncEmitter(
+        emit_fn, EmitterConfig(type="async", queue_size=1, overflow_policy="block", block_timeout=0.01)
+    )
+    emitter.submit(make_event("in-flight"))
+    assert emit_fn.started.wait(5)
+    assert emitter.submit(make_event("queued"))
+    assert not emitter.submit(make_event("timed-out"))
+    assert emitter.dropped == 1
+    emit_fn.release.set()
+    assert emitter.close(timeout=5)
+    assert [e.job.name for e in emit_fn.events] == ["in-flight", "queued"]
+
+
+def test_async_emitter_flush_times_out() -> None:
+    emit_fn = BlockingEmit()
+    emitter = AsyncEmitter(emit_fn, EmitterConfig(type="async"))
+    emitter.submit(make_event())
+    assert not emitter.flush(timeout=0.01)
+    emit_fn.release.set()
+    assert emitter.flush(timeout=5)
+
+
+def test_async_emitter_drops_events_after_close() -> None:
+    emit_fn = MagicMock()
+    emitter = AsyncEmitter(emit_fn, EmitterConfig(type="async"))
+    assert emitter.close(timeout=5)
+    assert not emitter.submit(make_event())
+    emit_fn.assert_not_called()
+
+
+def test_client_with_async_emitter_does_not_block_on_transport() -> None:
+    transport = MagicMock()
+    emit_fn = BlockingEmit()
+    transport.emit.side_effect = emit_fn
+    client = OpenLineageClient(transport=transport, config={"emitter": {"type": "async"}})
+
+    event = make_event()
+    client.emit(event)
+    assert emit_fn.started.wait(5)
+    assert emit_fn.events == []
+
+    emit_fn.release.set()
+    assert client.flush(timeout=5)
+    assert emit_fn.events == [event]
+    transport.wait_for_completion.assert_called_once()
+
+
+def test_client_close_closes_emitter_and_transport() -> None:
+    transport = MagicMock()
+    client = OpenLineageClient(transport=transport, config={"emitter": {"type": "async"}})
+    client.emit(make_event())
+    assert client.close(timeout=5)
+    transport.emit.assert_called_once()
+    transport.close.assert_called_once()
+
+
+def test_client_sync_by_default() -> None:
+    transport = MagicMock()
+    client = OpenLineageClient(transport=transport)
+    event = make_event()
+    client.emit(event)
+    transport.emit.assert_called_once_with(event)
+    assert client.flush()
+
+
+def test_sharded_emitter_keeps_order_within_key() -> None:
+    emitted: dict[str, list[str]] = {}
+    threads: dict[str, set[str]] = {}
+    lock = threading.Lock()
+
+    def emit_fn(event: RunEvent) -> None:
+        key = get_message_key(event)
+        with lock:
+            emitted.setdefault(key, []).append(event.eventType.value)
+            threads.setdefault(key, set()).add(threading.current_thread().name)
+
+    emitter = AsyncEmitter(emit_fn, EmitterConfig(type="async", workers=4), key_fn=get_message_key)
+    jobs = 20
+    for i in range(jobs):
+        emitter.submit(make_event(f"parent-{i}"))
+        emitter.submit(make_event(f"child-{i}", parent=f"parent-{i}", state=RunState.COMPLETE))
+        emitter.submit(make_event(f"parent-{i}", state=RunState.COMPLETE))
+
+    assert emitter.flush(timeout=5)
+    assert len(emitted) == jobs
+    assert all(states == ["START", "COMPLETE", "COMPLETE"] for states in emitted.values())
+    assert all(len(names) == 1 for names in threads.values())
+    assert emitter.close(timeout=5)
+
+
+def test_sharded_emitter_emits_different_keys_concurrently() -> None:
+    blocked = BlockingEmit()
+    emitted = []
+
+    def emit_fn(event: RunEvent) -> None:
+        if event.job.name == "slow":
+            blocked(event)
+        else:
+            emitted.append(event)
+
+    # keys picked to land on different shards
+    emitter = AsyncEmitter(
+        emit_fn, EmitterConfig(type="async", workers=2), key_fn=lambda e: 0 if e.job.name == "slow" else 1
+    )
+    emitter.submit(make_event("slow"))
+    assert blocked.started.wait(5)
+    emitter.submit(make_event("fast"))
+    assert not emitter.flush(timeout=0.5)
+    assert [e.job.name for e in emitted] == ["fast"]
+
+    blocked.release.set()
+    assert emitter.close(timeout=5)
+
+
+def test_sharded_emitter_drops_oldest_event_of_all_shards() -> None:
+    emit_fn = BlockingEmit()
+    config = EmitterConfig(type="async", workers=2, queue_size=3, overflow_policy="drop_oldest")
+    # events named "a..." and "b..." land on different shards
+    emitter = AsyncEmitter(emit_fn, config, key_fn=lambda e: int(e.job.name.startswith("b")))
+
+    emitter.submit(make_event("a-in-flight"))
+    emitter.submit(make_event("b-in-flight"))
+    deadline = time.monotonic() + 5
+    while emitter.queue_depth and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for name in ("a1", "b1", "b2", "a2"):
+        emitter.submit(make_event(name))
+    emit_fn.release.set()
+
+    assert emitter.close(timeout=5)
+    assert sorted(e.job.name for e in emit_fn.events) == ["a-in-flight", "a2", "b-in-flight", "b1", "b2"]
+    assert emitter.dropped == 1
+
+
+def test_client_with_sharded_emitter() -> None:
+    transport = MagicMock()
+    client = OpenLineageClient(transport=transport, config={"emitter": {"type": "async", "workers": 3}})
+    events = [make_event(str(i)) for i in range(10)]
+    for event in events:
+        client.emit(event)
+    assert client.close(timeout=5)
+    assert sorted(call.args[0].job.name for call in transport.emit.call_args_list) == sorted(
+        e.job.name for e in events
+    )
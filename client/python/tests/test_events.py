@@ -2,14 +2,22 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import datetime
+import gc
 import json
 import os
+import sys
+import uuid
+from enum import Enum
+from typing import Any
+from unittest.mock import patch
 
 import attr
 import pytest
-from openlineage.client import facet, run
+from openlineage.client import event_v2, facet, run
+from openlineage.client.facet_v2 import column_lineage_dataset, documentation_job, schema_dataset
 from openlineage.client.run import RunState
-from openlineage.client.serde import Serde
+from openlineage.client.serde import JsonBackend, Serde
 
 
 def get_sorted_json(file_name: str) -> str:
@@ -259,3 +267,221 @@ def test_job_event() -> None:
     )
 
     assert Serde.to_json(job_event) == get_sorted_json("serde_example_job_event.json")
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@attr.s
+class CollectionsObject:
+    values: tuple[str, ...] = attr.ib()
+    enums: list[Color] = attr.ib()
+    mapping: dict[str, Any] = attr.ib()
+    nested: set[int] = attr.ib(factory=set)
+
+
+def test_serde_compiled_matches_asdict() -> None:
+    schema = schema_dataset.SchemaDatasetFacet(
+        fields=[
+            schema_dataset.SchemaDatasetFacetFields(
+                name=f"col_{i}",
+                type="struct",
+                fields=[schema_dataset.SchemaDatasetFacetFields(name="nested", type=None)],
+            )
+            for i in range(10)
+        ]
+    )
+    column_lineage = column_lineage_dataset.ColumnLineageDatasetFacet(
+        fields={
+            f"col_{i}": column_lineage_dataset.Fields(
+                inputFields=[
+                    column_lineage_dataset.InputField(
+                        namespace="ns",
+                        name="input",
+                        field=f"col_{i}",
+                        transformations=[column_lineage_dataset.Transformation(type="DIRECT", masking=False)],
+                    )
+                ]
+            )
+            for i in range(10)
+        }
+    )
+    documentation = documentation_job.DocumentationJobFacet(description="desc").with_additional_properties(
+        custom={"key": None, "list": [None, {}, {"a": None}, 1]}
+    )
+    event = event_v2.RunEvent(
+        eventType=event_v2.RunState.COMPLETE,
+        eventTime="2021-11-03T10:53:52.427343",
+        run=event_v2.Run(runId="69f4acab-b87d-4fc0-b27b-8ea950370ff3"),
+        job=event_v2.Job(namespace="openlineage", name="name", facets={"documentation": documentation}),
+        outputs=[
+            event_v2.OutputDataset(
+                namespace="openlineage",
+                name="output",
+                facets={"schema": schema, "columnLineage": column_lineage},
+            )
+        ],
+    )
+    collections = CollectionsObject(
+        values=("a", "b"), enums=[Color.RED], mapping={"color": Color.RED, "empty": None}, nested={1}
+    )
+
+    for obj in (event, collections):
+        assert Serde.to_dict(obj) == Serde.remove_nulls_and_enums(attr.asdict(obj))
+        assert Serde.to_json(obj) == json.dumps(
+            Serde.remove_nulls_and_enums(attr.asdict(obj)), sort_keys=True
+        )
+
+
+def test_serde_to_dict_rejects_non_attrs_object() -> None:
+    with pytest.raises(attr.exceptions.NotAnAttrsClassError):
+        Serde.to_dict(object())
+
+
+def test_serde_releases_serializers_of_collected_classes() -> None:
+    from openlineage.client.serde import _serializers
+
+    facet_with_properties = documentation_job.DocumentationJobFacet(
+        description="desc"
+    ).with_additional_properties(custom="value")
+    class_id = id(facet_with_properties.__class__)
+    assert Serde.to_dict(facet_with_properties)["custom"] == "value"
+    assert class_id in _serializers
+
+    del facet_with_properties
+    gc.collect()
+    assert class_id not in _serializers
+
+
+@pytest.fixture
+def reset_json_backend():
+    yield
+    Serde._json_backend = None  # noqa: SLF001
+    Serde._encode = None  # noqa: SLF001
+    Serde._sort_keys = True  # noqa: SLF001
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "msgspec"])
+def test_serde_json_backends(backend: str, reset_json_backend) -> None:  # noqa: ARG001
+    if backend != "json":
+        pytest.importorskip(backend)
+    Serde.set_json_backend(backend)
+    obj = CollectionsObject(
+        values=("a", "ł"),
+        enums=[Color.RED],
+        mapping={"z": 1, "a": object(), "empty": None},
+    )
+
+    data = Serde.to_json_bytes(obj)
+    assert json.loads(data) == json.loads(Serde.to_json(obj))
+    assert json.loads(data)["mapping"] == {"a": "<<non-serializable: object>>", "z": 1}
+    assert data.index(b'"enums"') < data.index(b'"mapping"') < data.index(b'"values"')
+    unsorted = Serde.to_json_bytes(obj, sort_keys=False)
+    assert unsorted.index(b'"values"') < unsorted.index(b'"enums"')
+
+
+def test_serde_json_backend_from_env_variables(reset_json_backend) -> None:  # noqa: ARG001
+    pytest.importorskip("orjson")
+    with patch.dict(
+        os.environ, {"OPENLINEAGE_JSON_BACKEND": "orjson", "OPENLINEAGE_JSON_SORT_KEYS": "false"}
+    ):
+        assert Serde.get_json_backend() is JsonBackend.ORJSON
+        assert Serde.to_json_bytes(ListOfStrings(values=["a"])) == b'{"values":["a"]}'
+        assert not Serde._sort_keys  # noqa: SLF001
+
+
+def test_serde_json_backend_from_env_variable_falls_back_when_not_installed(
+    reset_json_backend,  # noqa: ARG001
+) -> None:
+    with (
+        patch.dict(os.environ, {"OPENLINEAGE_JSON_BACKEND": "msgspec"}),
+        patch.dict(sys.modules, {"msgspec": None}),
+        patch("openlineage.client.serde.log") as log,
+    ):
+        assert Serde.to_json_bytes(ListOfStrings(values=["a"])) == b'{"values": ["a"]}'
+        Serde.to_json_bytes(ListOfStrings(values=["b"]))
+        assert Serde.get_json_backend() is JsonBackend.JSON
+    log.warning.assert_called_once()
+
+
+def test_serde_explicit_json_backend_not_installed(reset_json_backend) -> None:  # noqa: ARG001
+    with patch.dict(sys.modules, {"orjson": None}), pytest.raises(ModuleNotFoundError):
+        Serde.set_json_backend("orjson")
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec"])
+def test_serde_json_backends_non_serializable_values(backend: str, reset_json_backend) -> None:  # noqa: ARG001
+    pytest.importorskip(backend)
+    obj = {
+        "time": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        "id": uuid.UUID("75782cf3-8be4-49dc-83e5-d2cf6239c168"),
+        "set": {1},
+        "color": Color.RED,
+        "tuple": (1, "a"),
+    }
+    expected = json.loads(Serde.to_json(obj))
+    Serde.set_json_backend(backend)
+    assert json.loads(Serde.to_json_bytes(obj)) == expected
+
+
+def test_serde_default_json_backend_output_matches_to_json(reset_json_backend) -> None:  # noqa: ARG001
+    assert Serde.get_json_backend() is JsonBackend.JSON
+    obj = NestingObject(nested=[NestedObject(41)], optional=3)
+    assert Serde.to_json_bytes(obj) == Serde.to_json(obj).encode("utf-8")
+
+
+def test_serde_wrong_json_backend(reset_json_backend) -> None:  # noqa: ARG001
+    with pytest.raises(ValueError, match="simplejson"):
+        Serde.set_json_backend("simplejson")
+
+
+def test_serde_resolves_lazy_facets() -> None:
+    event = event_v2.JobEvent(
+        eventTime="2024-01-01T00:00:00Z",
+        job=event_v2.Job(
+            namespace="default",
+            name="job",
+            facets={
+                "documentation": lambda: documentation_job.DocumentationJobFacet(description="lazy"),
+                "nothing": lambda: None,
+            },
+        ),
+    )
+    serialized = Serde.to_dict(event)
+    assert serialized["job"]["facets"]["documentation"]["description"] == "lazy"
+    assert "nothing" not in serialized["job"]["facets"]
+    assert json.loads(Serde.to_json_bytes(event)) == serialized
+
+
+def test_serde_does_not_call_callables_outside_facets() -> None:
+    called = []
+    event = event_v2.JobEvent(
+        eventTime="2024-01-01T00:00:00Z",
+        job=event_v2.Job(
+            namespace="default",
+            name="job",
+            facets={
+                "documentation": documentation_job.DocumentationJobFacet(
+                    description=lambda: called.append(True),  # type: ignore[arg-type]
+                )
+            },
+        ),
+    )
+    serialized = json.loads(Serde.to_json(event))
+    assert serialized["job"]["facets"]["documentation"]["description"] == "<<non-serializable: function>>"
+    assert not called
+
+
+def test_serde_resolves_lazy_facets_of_dict() -> None:
+    facet = {"description": "lazy"}
+    event = {
+        "eventTime": "2024-01-01T00:00:00Z",
+        "job": {"namespace": "default", "name": "job", "facets": {"documentation": lambda: facet}},
+        "inputs": [{"namespace": "ns", "name": "in", "inputFacets": {"nothing": lambda: None}}],
+    }
+    serialized = Serde.to_dict(event)
+    assert serialized["job"]["facets"]["documentation"] == facet
+    assert serialized["inputs"][0]["inputFacets"] == {}
+    assert json.loads(Serde.to_json_bytes(event)) == serialized
+    assert callable(event["job"]["facets"]["documentation"])
@@ -16,6 +16,7 @@ from openlineage.client.transport import (
 )
 from openlineage.client.transport.http import HttpTransport
 from openlineage.client.transport.noop import NoopTransport
+from openlineage.client.utils import import_from_string
 
 from tests.transport import AccumulatingTransport, FakeTransport
 
@@ -104,8 +105,9 @@ def test_factory_registers_from_dict(mocker: MockerFixture, root: Path) -> None:
 
 def test_automatically_registers_http_kafka() -> None:
     factory = get_default_factory()
-    assert HttpTransport in factory.transports.values()
-    assert KafkaTransport in factory.transports.values()
+    registered = [import_from_string(t) if isinstance(t, str) else t for t in factory.transports.values()]
+    assert HttpTransport in registered
+    assert KafkaTransport in registered
 
 
 def test_transport_decorator_registers(mocker: MockerFixture, root: Path) -> None:
@@ -1,6 +1,7 @@
 # Copyright 2018-2025 contributors to the OpenLineage project
 # SPDX-License-Identifier: Apache-2.0
 import datetime
+import gzip
 import json
 import os
 import tempfile
@@ -13,7 +14,7 @@ from unittest import mock
 import pytest
 from openlineage.client import OpenLineageClient
 from openlineage.client.run import Job, Run, RunEvent, RunState
-from openlineage.client.transport.file import FileConfig, FileTransport
+from openlineage.client.transport.file import FileCompression, FileConfig, FileTransport
 from openlineage.client.uuid import generate_new_uuid
 
 
@@ -218,3 +219,132 @@ def test_file_config_append_mode_does_not_modify_file_if_exists(append) -> None:
     assert file_content == "test content"
 
     os.remove(file_path)
+
+
+def keep_open_transport(log_file: str, **config: Any) -> FileTransport:
+    return FileTransport(FileConfig(log_file_path=log_file, keep_open=True, **config))
+
+
+def make_event(name: str = "test") -> RunEvent:
+    return RunEvent(
+        eventType=RunState.START,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId=str(generate_new_uuid())),
+        job=Job(namespace="file", name=name),
+        producer="prod",
+    )
+
+
+def read_events(path: str) -> list[str]:
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt") as f:
+        return [json.loads(line)["job"]["name"] for line in f]
+
+
+def test_file_config_from_dict_keep_open() -> None:
+    params = {
+        "log_file_path": "events.ndjson",
+        "keep_open": True,
+        "rotate_bytes": 1024,
+        "compression": "gzip",
+    }
+    config = FileConfig.from_dict(params)
+    assert config.keep_open
+    assert config.rotate_bytes == params["rotate_bytes"]
+    assert config.rotate_interval is None
+    assert config.compression is FileCompression.GZIP
+    assert config.flush_interval == 1.0
+
+
+def test_file_transport_keep_open_writes_ndjson_on_flush(tmp_path) -> None:
+    log_file = str(tmp_path / "events.ndjson")
+    transport = keep_open_transport(log_file, flush_interval=60)
+    for i in range(3):
+        transport.emit(make_event(str(i)))
+
+    assert not exists(log_file)
+    assert transport.wait_for_completion()
+    assert read_events(log_file) == ["0", "1", "2"]
+    transport.emit(make_event("3"))
+    assert transport.close()
+    assert read_events(log_file) == ["0", "1", "2", "3"]
+
+
+def test_file_transport_keep_open_writes_full_buffer(tmp_path) -> None:
+    log_file = str(tmp_path / "events.ndjson")
+    transport = keep_open_transport(log_file, flush_interval=60, buffer_size=1)
+    transport.emit(make_event())
+    assert read_events(log_file) == ["test"]
+    transport.close()
+
+
+def test_file_transport_keep_open_raises_error_when_not_writeable(tmp_path) -> None:
+    log_file = str(tmp_path / "events.ndjson")
+    transport = keep_open_transport(log_file, flush_interval=60)
+    transport.emit(make_event())
+
+    with (
+        mock.patch("os.write", side_effect=OSError("No space left on device")),
+        pytest.raises(RuntimeError, match=f"Log file `{log_file}` is not writeable"),
+    ):
+        transport.wait_for_completion()
+    assert transport.close()
+    assert read_events(log_file) == ["test"]
+
+
+def test_file_transport_keep_open_flushes_on_interval(tmp_path) -> None:
+    log_file = str(tmp_path / "events.ndjson")
+    transport = keep_open_transport(log_file, flush_interval=0.05)
+    transport.emit(make_event())
+
+    deadline = time.monotonic() + 5
+    while not exists(log_file) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert read_events(log_file) == ["test"]
+    transport.close()
+
+
+def test_file_transport_keep_open_rotates_by_size(tmp_path) -> None:
+    log_file = str(tmp_path / "events.ndjson")
+    transport = keep_open_transport(log_file, buffer_size=1, rotate_bytes=1)
+    for i in range(3):
+        transport.emit(make_event(str(i)))
+    transport.close()
+
+    assert [read_events(path) for path in transport.writer.rotated_files] == [["0"], ["1"]]
+    assert read_events(log_file) == ["2"]
+
+
+def test_file_transport_keep_open_rotates_by_time(tmp_path) -> None:
+    log_file = str(tmp_path / "events.ndjson")
+    transport = keep_open_transport(log_file, buffer_size=1, rotate_interval=0.01)
+    transport.emit(make_event("0"))
+    time.sleep(0.02)
+    transport.emit(make_event("1"))
+    transport.close()
+
+    assert [read_events(path) for path in transport.writer.rotated_files] == [["0"]]
+    assert read_events(log_file) == ["1"]
+
+
+def test_file_transport_zstd_compression_requires_zstandard(tmp_path) -> None:
+    with (
+        mock.patch.dict("sys.modules", {"zstandard": None}),
+        mock.patch("openlineage.client.transport.file.log") as log,
+        pytest.raises(ModuleNotFoundError),
+    ):
+        keep_open_transport(str(tmp_path / "events.ndjson"), compression=FileCompression.ZSTD)
+    log.exception.assert_called_once()
+
+
+def test_file_transport_keep_open_compresses_rotated_files(tmp_path) -> None:
+    log_file = str(tmp_path / "events.ndjson")
+    transport = keep_open_transport(log_file, buffer_size=1, rotate_bytes=1, compression=FileCompression.GZIP)
+    for i in range(3):
+        transport.emit(make_event(str(i)))
+    assert transport.close(timeout=5)
+
+    rotated = sorted(transport.writer.rotated_files)
+    assert all(path.endswith(".gz") for path in rotated)
+    assert [read_events(path) for path in rotated] == [["0"], ["1"]]
+    assert sorted(listdir(tmp_path)) == sorted([os.path.basename(p) for p in rotated] + ["events.ndjson"])
@@ -0,0 +1,151 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from openlineage.client import OpenLineageClient
+from openlineage.client.event_v2 import (
+    Dataset,
+    DatasetEvent,
+    InputDataset,
+    Job,
+    JobEvent,
+    OutputDataset,
+    Run,
+    RunEvent,
+    RunState,
+)
+from openlineage.client.facet_v2 import schema_dataset, sql_job
+from openlineage.client.filter import FilterConfig, FilterEngine
+from openlineage.client.uuid import generate_new_uuid
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def make_event(
+    name: str = "job", namespace: str = "default", event_type: RunState = RunState.START, **kwargs: Any
+) -> RunEvent:
+    return RunEvent(
+        eventType=event_type,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId=str(generate_new_uuid())),
+        job=Job(namespace=namespace, name=name),
+        **kwargs,
+    )
+
+
+def engine(*configs: dict[str, Any]) -> FilterEngine:
+    return FilterEngine([FilterConfig(**config) for config in configs])
+
+
+def test_filter_engine_exact_and_regex_job_name() -> None:
+    filters = engine(
+        *({"type": "exact", "match": f"job_{i}"} for i in range(500)),
+        *({"type": "regex", "regex": f"^tmp_{i}_.*"} for i in range(500)),
+    )
+    assert filters.matches(make_event("job_42"))
+    assert filters.matches(make_event("tmp_499_x"))
+    assert not filters.matches(make_event("job_500"))
+    assert not filters.matches(make_event("my_tmp_1_x"))
+
+
+def test_filter_engine_keeps_match_semantics_of_regexes() -> None:
+    filters = engine({"type": "regex", "regex": "a|b"}, {"type": "regex", "regex": "c$"})
+    assert filters.matches(make_event("bx"))
+    assert filters.matches(make_event("abc"))
+    assert not filters.matches(make_event("xa"))
+
+
+def test_filter_engine_falls_back_when_regexes_cannot_be_combined() -> None:
+    filters = engine({"type": "regex", "regex": "(?i)^secret"}, {"type": "regex", "regex": "(?P<x>tmp)"})
+    assert filters.matches(make_event("SECRET_job"))
+    assert filters.matches(make_event("tmp"))
+    assert not filters.matches(make_event("job"))
+
+
+def test_filter_engine_matches_regexes_with_group_references_separately() -> None:
+    filters = engine(
+        {"type": "regex", "regex": "(tmp)_.*"},
+        {"type": "regex", "regex": r"(a)\1$"},
+        {"type": "regex", "regex": r"(?P<word>b)(?P=word)$"},
+        {"type": "regex", "regex": "staging"},
+    )
+    assert filters.matches(make_event("tmp_job"))
+    assert filters.matches(make_event("aa"))
+    assert filters.matches(make_event("bb"))
+    assert filters.matches(make_event("staging_job"))
+    assert not filters.matches(make_event("ab"))
+
+
+def test_filter_engine_namespace_and_event_type() -> None:
+    filters = engine(
+        {"type": "exact", "match": "dev", "target": "job_namespace"},
+        {"type": "exact", "match": "RUNNING", "target": "event_type"},
+    )
+    assert filters.matches(make_event(namespace="dev"))
+    assert filters.matches(make_event(event_type=RunState.RUNNING))
+    assert not filters.matches(make_event())
+
+
+def test_filter_engine_dataset_targets() -> None:
+    filters = engine(
+        {"type": "regex", "regex": r"^tmp\.", "target": "dataset_name"},
+        {"type": "exact", "match": "s3://scratch", "target": "dataset_namespace"},
+    )
+    assert filters.matches(make_event(outputs=[OutputDataset(namespace="db", name="tmp.table")]))
+    assert filters.matches(make_event(inputs=[InputDataset(namespace="s3://scratch", name="file")]))
+    assert not filters.matches(make_event(inputs=[InputDataset(namespace="db", name="table")]))
+    assert filters.matches(
+        DatasetEvent(eventTime="2024-01-01T00:00:00Z", dataset=Dataset(namespace="db", name="tmp.t"))
+    )
+
+
+def test_filter_engine_facet_presence() -> None:
+    filters = engine({"type": "exact", "match": "schema", "target": "facet"})
+    schema = schema_dataset.SchemaDatasetFacet(fields=[])
+    assert filters.matches(
+        make_event(inputs=[InputDataset(namespace="db", name="t", facets={"schema": schema})])
+    )
+    assert not filters.matches(make_event(inputs=[InputDataset(namespace="db", name="t")]))
+
+
+def test_filter_engine_applies_job_filters_to_job_events() -> None:
+    filters = engine({"type": "exact", "match": "job"})
+    job_event = JobEvent(
+        eventTime="2024-01-01T00:00:00Z",
+        job=Job(namespace="default", name="job", facets={"sql": sql_job.SQLJobFacet(query="SELECT 1")}),
+    )
+    assert filters.filter_event(job_event) is None
+    dataset_event = DatasetEvent(
+        eventTime="2024-01-01T00:00:00Z", dataset=Dataset(namespace="db", name="job")
+    )
+    assert filters.filter_event(dataset_event) is dataset_event
+
+
+def test_filter_engine_skips_invalid_configs(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING, logger="openlineage.client.filter"):
+        filters = engine(
+            {"match": "job"}, {"type": "exact"}, {"type": "exact", "match": "job", "target": "owner"}
+        )
+    assert not filters
+    assert "Unsupported OpenLineage filter target: `owner`" in caplog.text
+
+
+def test_client_filters_with_engine() -> None:
+    client = OpenLineageClient(
+        config={
+            "transport": {"type": "tests.transport.AccumulatingTransport"},
+            "filters": [
+                {"type": "exact", "match": "filtered"},
+                {"type": "regex", "regex": "^tmp", "target": "dataset_name"},
+            ],
+        }
+    )
+    kept = make_event("kept", outputs=[OutputDataset(namespace="db", name="table")])
+    client.emit(make_event("filtered"))
+    client.emit(make_event("kept", outputs=[OutputDataset(namespace="db", name="tmp_table")]))
+    client.emit(kept)
+    assert client.transport.events == [kept]
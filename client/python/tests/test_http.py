@@ -4,16 +4,34 @@ from __future__ import annotations
 
 import datetime
 import gzip
+import json
+import logging
 import os
+import threading
+import time
+from http import HTTPStatus
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
+import pytest
 from openlineage.client import OpenLineageClient
+from openlineage.client.metrics import MetricType
 from openlineage.client.run import Job, Run, RunEvent, RunState
 from openlineage.client.serde import Serde
-from openlineage.client.transport.http import ApiKeyTokenProvider, HttpCompression, HttpConfig, HttpTransport
+from openlineage.client.transport.http import (
+    ApiKeyTokenProvider,
+    HttpBatchConfig,
+    HttpBatchFormat,
+    HttpCompression,
+    HttpConfig,
+    HttpDeferredRetryConfig,
+    HttpTransport,
+    _reset_session_locks,
+)
 from openlineage.client.uuid import generate_new_uuid
 from requests import Session
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import HTTPError
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -149,7 +167,7 @@ def test_client_with_http_transport_emits(mocker: MockerFixture) -> None:
     client.emit(event)
     transport.session.post.assert_called_once_with(
         url="http://backend:5000/api/v1/lineage",
-        data=Serde.to_json(event),
+        data=Serde.to_json_bytes(event),
         headers={"Content-Type": "application/json"},
         timeout=5.0,
         verify=True,
@@ -180,7 +198,7 @@ def test_client_with_http_transport_emits_custom_endpoint(mocker: MockerFixture)
     client.emit(event)
     transport.session.post.assert_called_once_with(
         url="http://backend:5000/custom/lineage",
-        data=Serde.to_json(event),
+        data=Serde.to_json_bytes(event),
         headers={"Content-Type": "application/json"},
         timeout=5.0,
         verify=True,
@@ -243,7 +261,7 @@ def test_http_transport_custom_headers_applied(mock_post):
     transport = HttpTransport(config)
     mock_event = MagicMock()
 
-    with patch("openlineage.client.serde.Serde.to_json", return_value='{"mock": "event"}'):
+    with patch("openlineage.client.serde.Serde.to_json_bytes", return_value=b'{"mock": "event"}'):
         transport.emit(mock_event)
 
     mock_post.assert_called_once()
@@ -269,7 +287,7 @@ def test_http_transport_auth_and_custom_headers_applied(mock_post):
     transport = HttpTransport(config)
     mock_event = MagicMock()
 
-    with patch("openlineage.client.serde.Serde.to_json", return_value='{"mock": "event"}'):
+    with patch("openlineage.client.serde.Serde.to_json_bytes", return_value=b'{"mock": "event"}'):
         transport.emit(mock_event)
 
     mock_post.assert_called_once()
@@ -286,7 +304,7 @@ def test_http_transport_no_custom_headers(mock_post):
     transport = HttpTransport(config)
     mock_event = MagicMock()
 
-    with patch("openlineage.client.serde.Serde.to_json", return_value='{"mock": "event"}'):
+    with patch("openlineage.client.serde.Serde.to_json_bytes", return_value=b'{"mock": "event"}'):
         transport.emit(mock_event)
 
     mock_post.assert_called_once()
@@ -308,8 +326,9 @@ def test_http_transport_compression_with_custom_headers(mock_post):
     transport = HttpTransport(config)
     mock_event = MagicMock()
 
-    with patch("openlineage.client.serde.Serde.to_json", return_value='{"mock": "event"}'), patch(
-        "gzip.compress", return_value=b"compressed_data"
+    with (
+        patch("openlineage.client.serde.Serde.to_json_bytes", return_value=b'{"mock": "event"}'),
+        patch("gzip.compress", return_value=b"compressed_data"),
     ):
         transport.emit(mock_event)
 
@@ -337,8 +356,9 @@ def test_http_transport_with_custom_headers_from_env_vars(mock_post):
     transport = OpenLineageClient().transport
     mock_event = MagicMock()
 
-    with patch("openlineage.client.serde.Serde.to_json", return_value='{"mock": "event"}'), patch(
-        "gzip.compress", return_value=b"compressed_data"
+    with (
+        patch("openlineage.client.serde.Serde.to_json_bytes", return_value=b'{"mock": "event"}'),
+        patch("gzip.compress", return_value=b"compressed_data"),
     ):
         transport.emit(mock_event)
 
@@ -348,3 +368,397 @@ def test_http_transport_with_custom_headers_from_env_vars(mock_post):
 
     assert headers["custom_header"] == "FIRST"
     assert headers["another_header"] == "second"
+
+
+def _batch_transport(session: MagicMock, **batch: object) -> HttpTransport:
+    return HttpTransport(
+        HttpConfig.from_dict(
+            {
+                "type": "http",
+                "url": "http://backend:5000",
+                "session": session,
+                "batch": {"max_linger": 60, **batch},
+            }
+        )
+    )
+
+
+def _event(name: str = "test") -> RunEvent:
+    return RunEvent(
+        eventType=RunState.START,
+        eventTime="2024-04-12T18:04:58.134314",
+        run=Run(runId="75782cf3-8be4-49dc-83e5-d2cf6239c168"),
+        job=Job(namespace="http", name=name),
+        producer="prod",
+        schemaURL="schema",
+    )
+
+
+def test_http_loads_batch_config() -> None:
+    config = HttpConfig.from_dict(
+        {
+            "type": "http",
+            "url": "http://backend:5000",
+            "batch": {"endpoint": "api/v1/batch", "max_events": 10, "max_bytes": 2048, "format": "ndjson"},
+        }
+    )
+    assert config.batch == HttpBatchConfig(
+        endpoint="api/v1/batch", max_events=10, max_bytes=2048, max_linger=1.0, format=HttpBatchFormat.NDJSON
+    )
+    assert HttpConfig.from_dict({"url": "http://backend:5000"}).batch is None
+
+
+def test_http_batch_sends_json_array_when_full() -> None:
+    session = MagicMock()
+    names = ["a", "b"]
+    transport = _batch_transport(session, max_events=len(names))
+
+    transport.emit(_event(names[0]))
+    session.post.assert_not_called()
+    transport.emit(_event(names[1]))
+
+    session.post.assert_called_once()
+    kwargs = session.post.call_args.kwargs
+    assert kwargs["url"] == "http://backend:5000/api/v1/lineage/batch"
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert [e["job"]["name"] for e in json.loads(kwargs["data"])] == names
+    assert transport.batcher.events_sent == len(names)
+
+
+def test_http_batch_sends_batches_in_order_they_were_cut() -> None:
+    session = MagicMock()
+    transport = _batch_transport(session, max_events=1)
+    # cut by another thread that did not start sending it yet
+    transport.batcher._pending.append([Serde.to_json_bytes(_event("first"))])  # noqa: SLF001
+
+    transport.emit(_event("second"))
+
+    sent = [json.loads(call.kwargs["data"])[0]["job"]["name"] for call in session.post.call_args_list]
+    assert sent == ["first", "second"]
+
+
+def test_http_batch_splits_by_bytes() -> None:
+    session = MagicMock()
+    size = len(Serde.to_json_bytes(_event("a")))
+    transport = _batch_transport(session, max_bytes=size + 1, format="ndjson")
+
+    transport.emit(_event("a"))
+    session.post.assert_not_called()
+    transport.emit(_event("b"))
+
+    session.post.assert_called_once()
+    kwargs = session.post.call_args.kwargs
+    assert kwargs["headers"]["Content-Type"] == "application/x-ndjson"
+    assert kwargs["data"] == Serde.to_json_bytes(_event("a")) + b"\n"
+    assert transport.wait_for_completion()
+    assert [json.loads(c.kwargs["data"])["job"]["name"] for c in session.post.call_args_list] == ["a", "b"]
+
+
+def test_http_batch_compresses_whole_body() -> None:
+    session = MagicMock()
+    transport = HttpTransport(
+        HttpConfig.from_dict(
+            {"url": "http://backend:5000", "session": session, "compression": "gzip", "batch": {}}
+        )
+    )
+    transport.emit(_event("a"))
+    transport.emit(_event("b"))
+    assert transport.close()
+
+    session.post.assert_called_once()
+    kwargs = session.post.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert [e["job"]["name"] for e in json.loads(gzip.decompress(kwargs["data"]))] == ["a", "b"]
+
+
+def test_http_batch_sent_after_linger() -> None:
+    session = MagicMock()
+    transport = _batch_transport(session, max_linger=0.01)
+    sent = threading.Event()
+    transport.batcher.on_batch_result = lambda _: sent.set()
+
+    transport.emit(_event())
+    assert sent.wait(5)
+    session.post.assert_called_once()
+    transport.close()
+
+
+def test_http_batch_reports_partial_failures() -> None:
+    session = MagicMock()
+    session.post.return_value.content = b"..."
+    session.post.return_value.json.return_value = {"failed": [{"index": 1, "error": "invalid event"}]}
+    transport = _batch_transport(session)
+    results = []
+    transport.batcher.on_batch_result = results.append
+
+    events = [_event("a"), _event("b")]
+    for event in events:
+        transport.emit(event)
+    assert not transport.wait_for_completion()
+
+    assert results[0].size == len(events)
+    assert results[0].failed == [(1, "invalid event")]
+    assert transport.batcher.events_sent == 1
+    assert transport.batcher.events_failed == 1
+
+
+def test_http_batch_reports_failed_request() -> None:
+    session = MagicMock()
+    session.post.side_effect = ConnectionError("backend down")
+    transport = _batch_transport(session)
+    results = []
+    transport.batcher.on_batch_result = results.append
+
+    transport.emit(_event())
+    assert not transport.close()
+    assert isinstance(results[0].error, ConnectionError)
+    assert transport.batcher.events_failed == 1
+
+
+def test_http_batch_result_callback_from_config() -> None:
+    config = HttpConfig.from_dict(
+        {"url": "http://backend:5000", "batch": {"on_batch_result": "logging.getLogger"}}
+    )
+    assert config.batch.on_batch_result is logging.getLogger
+    assert HttpTransport(config).batcher.on_batch_result is logging.getLogger
+
+
+def test_http_batch_flush_honours_timeout() -> None:
+    session = MagicMock()
+    transport = _batch_transport(session)
+    transport.emit(_event())
+
+    # batch in-flight on another thread
+    with transport.batcher._send_lock:  # noqa: SLF001
+        assert not transport.wait_for_completion(timeout=0.01)
+    session.post.assert_not_called()
+    assert transport.wait_for_completion(timeout=5)
+    session.post.assert_called_once()
+
+
+def test_http_batch_sends_events_added_after_close() -> None:
+    session = MagicMock()
+    transport = _batch_transport(session)
+    assert transport.close()
+
+    transport.emit(_event())
+    session.post.assert_called_once()
+    assert transport.batcher.buffered_bytes == 0
+
+
+def test_http_batch_does_not_send_parent_buffer_after_fork() -> None:
+    session = MagicMock()
+    transport = _batch_transport(session)
+    transport.emit(_event("parent"))
+
+    with patch("os.getpid", return_value=os.getpid() + 1):
+        transport.emit(_event("child"))
+        assert transport.wait_for_completion()
+    session.post.assert_called_once()
+    assert [e["job"]["name"] for e in json.loads(session.post.call_args.kwargs["data"])] == ["child"]
+
+
+@patch("requests.Session.post")
+def test_http_transport_reuses_owned_session(mock_post) -> None:
+    config = HttpConfig(url="http://backend:5000", pool_connections=2, pool_maxsize=20)
+    transport = HttpTransport(config)
+    transport.emit(_event("a"))
+    session = transport._owned_session  # noqa: SLF001
+    transport.emit(_event("b"))
+
+    assert [c.kwargs["data"] for c in mock_post.call_args_list] == [
+        Serde.to_json_bytes(_event("a")),
+        Serde.to_json_bytes(_event("b")),
+    ]
+    assert transport._owned_session is session  # noqa: SLF001
+    adapter = session.get_adapter("http://backend:5000")
+    assert adapter._pool_connections == config.pool_connections  # noqa: SLF001
+    assert adapter._pool_maxsize == config.pool_maxsize  # noqa: SLF001
+
+    transport.close()
+    assert transport._owned_session is None  # noqa: SLF001
+
+
+@patch("requests.Session.post")
+def test_http_transport_recreates_owned_session_after_fork(mock_post) -> None:
+    transport = HttpTransport(HttpConfig(url="http://backend:5000"))
+    events = [_event("parent"), _event("child")]
+    transport.emit(events[0])
+    session = transport._owned_session  # noqa: SLF001
+
+    with patch("os.getpid", return_value=os.getpid() + 1):
+        transport.emit(events[1])
+    assert transport._owned_session is not session  # noqa: SLF001
+    assert mock_post.call_count == len(events)
+
+
+def test_http_transport_creates_one_session_for_concurrent_first_emits() -> None:
+    transport = HttpTransport(HttpConfig(url="http://backend:5000"))
+    threads_count = 4
+    barrier = threading.Barrier(threads_count, timeout=5)
+    sessions = []
+
+    def get_session() -> None:
+        barrier.wait()
+        sessions.append(transport._get_session())  # noqa: SLF001
+
+    def slow_session() -> MagicMock:
+        time.sleep(0.05)
+        return MagicMock()
+
+    with patch("openlineage.client.transport.http.Session", side_effect=slow_session) as session_class:
+        threads = [threading.Thread(target=get_session) for _ in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+    session_class.assert_called_once()
+    assert len({id(session) for session in sessions}) == 1
+
+
+def test_http_transport_resets_session_lock_in_forked_child() -> None:
+    transport = HttpTransport(HttpConfig(url="http://backend:5000"))
+    # held by another thread when the process forked
+    transport._session_lock.acquire()  # noqa: SLF001
+    _reset_session_locks()
+    with patch("os.getpid", return_value=os.getpid() + 1):
+        assert transport._get_session() is not None  # noqa: SLF001
+    transport.close()
+
+
+def test_http_transport_does_not_close_passed_session() -> None:
+    session = MagicMock()
+    transport = HttpTransport(HttpConfig(url="http://backend:5000", session=session))
+    transport.emit(_event())
+    transport.close()
+    session.post.assert_called_once()
+    session.close.assert_not_called()
+
+
+def _response(status: int) -> MagicMock:
+    response = MagicMock(status_code=status)
+    if status >= HTTPStatus.BAD_REQUEST:
+        response.raise_for_status.side_effect = HTTPError(response=response)
+    return response
+
+
+def _deferred_retry_transport(session: MagicMock, **retry: object) -> HttpTransport:
+    return HttpTransport(
+        HttpConfig.from_dict(
+            {
+                "url": "http://backend:5000",
+                "session": session,
+                "deferred_retry": {"initial_backoff": 0.01, "jitter": 0, **retry},
+            }
+        )
+    )
+
+
+def test_http_loads_deferred_retry_config() -> None:
+    config = HttpConfig.from_dict(
+        {"url": "http://backend:5000", "deferred_retry": {"max_attempts": 3, "budget": 10}}
+    )
+    assert config.deferred_retry == HttpDeferredRetryConfig(max_attempts=3, budget=10)
+    assert HttpConfig.from_dict({"url": "http://backend:5000"}).deferred_retry is None
+
+
+def test_http_deferred_retry_does_not_block_emit() -> None:
+    session = MagicMock()
+    responses = [_response(503), _response(502), _response(200)]
+    session.post.side_effect = responses
+    transport = _deferred_retry_transport(session)
+
+    assert transport.emit(_event()) is None
+    assert transport.wait_for_completion(timeout=5)
+    assert session.post.call_count == len(responses)
+    scheduler = transport.retry_scheduler
+    assert (scheduler.retries, scheduler.succeeded, scheduler.given_up, scheduler.pending) == (2, 1, 0, 0)
+    assert scheduler.max_retry_latency > 0
+    assert session.post.call_args_list[0] == session.post.call_args_list[2]
+
+
+def test_http_deferred_retry_metrics() -> None:
+    session = MagicMock()
+    session.post.side_effect = [_response(503), _response(200)]
+    transport = _deferred_retry_transport(session)
+
+    transport.emit(_event())
+    assert transport.wait_for_completion(timeout=5)
+    metrics = {metric.name: metric for metric in transport.collect_metrics()}
+    scheduler = transport.retry_scheduler
+    assert metrics["http.retry.latency_seconds"].type is MetricType.COUNTER
+    assert metrics["http.retry.latency_seconds"].value == scheduler.total_retry_latency > 0
+    assert metrics["http.retry.max_latency_seconds"].value == scheduler.max_retry_latency
+    assert metrics["http.retry.average_latency_seconds"].value == scheduler.average_retry_latency
+
+
+def test_http_deferred_retry_retries_connection_errors() -> None:
+    session = MagicMock()
+    session.post.side_effect = [RequestsConnectionError(), _response(200)]
+    transport = _deferred_retry_transport(session)
+
+    transport.emit(_event())
+    assert transport.wait_for_completion(timeout=5)
+    assert transport.retry_scheduler.succeeded == 1
+
+
+def test_http_deferred_retry_raises_non_retryable_error() -> None:
+    session = MagicMock()
+    session.post.return_value = _response(400)
+    transport = _deferred_retry_transport(session)
+
+    with pytest.raises(HTTPError):
+        transport.emit(_event())
+    assert transport.retry_scheduler.pending == 0
+
+
+def test_http_deferred_retry_gives_up_after_max_attempts() -> None:
+    session = MagicMock()
+    session.post.return_value = _response(503)
+    max_attempts = 3
+    transport = _deferred_retry_transport(session, max_attempts=max_attempts)
+
+    transport.emit(_event())
+    assert transport.wait_for_completion(timeout=5)
+    assert session.post.call_count == max_attempts
+    assert transport.retry_scheduler.given_up == 1
+
+
+def test_http_deferred_retry_gives_up_over_budget() -> None:
+    session = MagicMock()
+    session.post.return_value = _response(503)
+    budget = 2
+    events = [_event() for _ in range(budget + 1)]
+    transport = _deferred_retry_transport(session, budget=budget, initial_backoff=60)
+
+    for event in events:
+        transport.emit(event)
+    assert transport.retry_scheduler.pending == budget
+    assert transport.retry_scheduler.given_up == 1
+
+    assert not transport.close(timeout=0.01)
+    assert transport.retry_scheduler.given_up == len(events)
+
+
+def test_http_deferred_retry_of_batch() -> None:
+    session = MagicMock()
+    session.post.side_effect = [_response(503), _response(200)]
+    transport = HttpTransport(
+        HttpConfig.from_dict(
+            {
+                "url": "http://backend:5000",
+                "session": session,
+                "batch": {"max_events": 2},
+                "deferred_retry": {"initial_backoff": 0.01},
+            }
+        )
+    )
+    results = []
+    transport.batcher.on_batch_result = results.append
+
+    transport.emit(_event())
+    transport.emit(_event())
+    assert transport.wait_for_completion(timeout=5)
+    assert results[0].deferred
+    assert transport.batcher.events_failed == 0
+    assert transport.retry_scheduler.succeeded == 1
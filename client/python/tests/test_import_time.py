@@ -0,0 +1,83 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Generous budgets in microseconds of cumulative import time, measured by `python -X importtime`
+# in a fresh interpreter - they catch heavy modules becoming eagerly imported again, not small regressions.
+PACKAGE_IMPORT_BUDGET_US = 100_000
+CLIENT_IMPORT_BUDGET_US = 1_000_000
+
+# Not needed to create client and emit events with console or file transport.
+LAZY_MODULES = (
+    "asyncio",
+    "numpy",
+    "requests",
+    "yaml",
+    "openlineage.client.async_client",
+    "openlineage.client.transport.http",
+    "openlineage.client.transport.kafka",
+    "openlineage.client.generated.schema_dataset",
+)
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Returns cumulative import time, in microseconds, of each module imported with the module."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def imported_modules(statement: str) -> set[str]:
+    # -X importtime doesn't report modules imported by importlib.import_module, used for lazy attributes
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", f"{statement}; import sys; print(*sys.modules, sep='\\n')"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    ("module", "budget"),
+    [
+        ("openlineage.client", PACKAGE_IMPORT_BUDGET_US),
+        ("openlineage.client.client", CLIENT_IMPORT_BUDGET_US),
+    ],
+)
+def test_import_time_budget(module: str, budget: int) -> None:
+    times = import_times(module)
+    assert times[module] < budget
+    assert not [name for name in LAZY_MODULES if name in times]
+
+
+def test_client_import_does_not_import_lazy_modules() -> None:
+    modules = imported_modules("from openlineage.client import OpenLineageClient")
+    assert "openlineage.client.client" in modules
+    assert not [name for name in LAZY_MODULES if name in modules]
+
+
+def test_transports_and_facets_are_imported_on_access() -> None:
+    modules = imported_modules(
+        "from openlineage.client.facet_v2 import schema_dataset; "
+        "from openlineage.client.transport import HttpTransport"
+    )
+    assert "openlineage.client.generated.schema_dataset" in modules
+    assert "openlineage.client.generated.sql_job" not in modules
+    assert "openlineage.client.transport.http" in modules
+    assert "openlineage.client.transport.kafka" not in modules
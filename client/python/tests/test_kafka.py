@@ -2,13 +2,17 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import gzip
+import json
+import os
 from typing import TYPE_CHECKING
-from unittest.mock import ANY, call
+from unittest.mock import ANY
 
+import attr
 import pytest
 from openlineage.client import OpenLineageClient, event_v2
 from openlineage.client.facet import ParentRunFacet
-from openlineage.client.facet_v2 import parent_run
+from openlineage.client.facet_v2 import parent_run, schema_dataset
 from openlineage.client.run import (
     Dataset,
     DatasetEvent,
@@ -19,7 +23,9 @@ from openlineage.client.run import (
     RunState,
 )
 from openlineage.client.serde import Serde
-from openlineage.client.transport.kafka import KafkaConfig, KafkaTransport
+from openlineage.client.transport import kafka
+from openlineage.client.transport.kafka import KafkaConfig, KafkaTransport, OversizePolicy
+from openlineage.client.uuid import generate_new_uuid
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -221,7 +227,7 @@ def test_client_with_kafka_transport_emits_run_event(
         transport.producer.produce.assert_called_once_with(
             topic="random-topic",
             key="run:test-namespace/test-job",
-            value=Serde.to_json(event).encode("utf-8"),
+            value=Serde.to_json_bytes(event),
             on_delivery=ANY,
         )
         transport.producer.flush.assert_called_once()
@@ -249,7 +255,7 @@ def test_client_with_kafka_transport_emits_run_event_with_parent(
         transport.producer.produce.assert_called_once_with(
             topic="random-topic",
             key="run:parent-namespace/parent-job",
-            value=Serde.to_json(event).encode("utf-8"),
+            value=Serde.to_json_bytes(event),
             on_delivery=ANY,
         )
         transport.producer.flush.assert_called_once()
@@ -274,7 +280,7 @@ def test_client_with_kafka_transport_emits_run_event_with_root_parent(
     transport.producer.produce.assert_called_once_with(
         topic="random-topic",
         key="run:root-namespace/root-job",
-        value=Serde.to_json(run_event_with_root_parent_v2).encode("utf-8"),
+        value=Serde.to_json_bytes(run_event_with_root_parent_v2),
         on_delivery=ANY,
     )
     transport.producer.flush.assert_called_once()
@@ -302,7 +308,7 @@ def test_client_with_kafka_transport_emits_run_event_with_explicit_message_key(
         transport.producer.produce.assert_called_once_with(
             topic="random-topic",
             key="explicit-key",
-            value=Serde.to_json(event).encode("utf-8"),
+            value=Serde.to_json_bytes(event),
             on_delivery=ANY,
         )
         transport.producer.flush.assert_called_once()
@@ -330,7 +336,7 @@ def test_client_with_kafka_transport_emits_job_event(
         transport.producer.produce.assert_called_once_with(
             topic="random-topic",
             key="job:test-namespace/test-job",
-            value=Serde.to_json(event).encode("utf-8"),
+            value=Serde.to_json_bytes(event),
             on_delivery=ANY,
         )
         transport.producer.flush.assert_called_once()
@@ -358,7 +364,7 @@ def test_client_with_kafka_transport_emits_job_event_with_explicit_message_key(
         transport.producer.produce.assert_called_once_with(
             topic="random-topic",
             key="explicit-key",
-            value=Serde.to_json(event).encode("utf-8"),
+            value=Serde.to_json_bytes(event),
             on_delivery=ANY,
         )
         transport.producer.flush.assert_called_once()
@@ -386,7 +392,7 @@ def test_client_with_kafka_transport_emits_dataset_event(
         transport.producer.produce.assert_called_once_with(
             topic="random-topic",
             key="dataset:test-namespace/test-dataset",
-            value=Serde.to_json(event).encode("utf-8"),
+            value=Serde.to_json_bytes(event),
             on_delivery=ANY,
         )
         transport.producer.flush.assert_called_once()
@@ -415,14 +421,14 @@ def test_client_with_kafka_transport_emits_dataset_event_explicit_message_key(
         transport.producer.produce.assert_called_once_with(
             topic="random-topic",
             key="explicit-key",
-            value=Serde.to_json(event).encode("utf-8"),
+            value=Serde.to_json_bytes(event),
             on_delivery=ANY,
         )
         transport.producer.flush.assert_called_once()
         transport.producer.reset_mock()
 
 
-def test_airflow_sqlalchemy_constructs_producer_each_call(
+def test_airflow_sqlalchemy_constructs_producer_once_per_process(
     run_event: RunEvent,
     run_event_v2: event_v2.RunEvent,
     mocker: MockerFixture,
@@ -432,21 +438,26 @@ def test_airflow_sqlalchemy_constructs_producer_each_call(
         return_value=True,
     )
     mock = mocker.patch("confluent_kafka.Producer")
+    config = KafkaConfig(
+        config={"bootstrap.servers": "localhost:9092"},
+        topic="random-topic",
+        flush=True,
+    )
+    transport = KafkaTransport(config)
+    mock.assert_not_called()
 
-    for event in [run_event, run_event_v2]:
-        config = KafkaConfig(
-            config={"bootstrap.servers": "localhost:9092"},
-            topic="random-topic",
-            flush=True,
-        )
-        transport = KafkaTransport(config)
-
-        client = OpenLineageClient(transport=transport)
+    client = OpenLineageClient(transport=transport)
+    client.emit(run_event)
+    client.emit(run_event_v2)
+    mock.assert_called_once_with(config.config)
+    parent_producer = transport.producer
 
-        client.emit(event)
-        client.emit(event)
-        mock.assert_has_calls([call(config.config), call(config.config)], any_order=True)
-        mock.reset_mock()
+    # forked worker process
+    mocker.patch("os.getpid", return_value=os.getpid() + 1)
+    client.emit(run_event)
+    client.emit(run_event_v2)
+    assert mock.call_args_list == [mocker.call(config.config), mocker.call(config.config)]
+    assert transport._inherited_producers == [parent_producer]  # noqa: SLF001
 
 
 def test_airflow_direct_constructs_producer_once(
@@ -475,3 +486,278 @@ def test_airflow_direct_constructs_producer_once(
 
         mock.assert_called_once_with(config.config)
         mock.reset_mock()
+
+
+@pytest.mark.parametrize(
+    "event_fixture",
+    [
+        "run_event",
+        "run_event_v2",
+        "run_event_with_parent",
+        "run_event_with_parent_v2",
+        "run_event_with_root_parent_v2",
+        "dataset_event",
+        "dataset_event_v2",
+        "job_event",
+        "job_event_v2",
+    ],
+)
+def test_kafka_message_key_of_deserialized_event(
+    event_fixture: str, request: pytest.FixtureRequest, mocker: MockerFixture
+) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    transport = KafkaTransport(
+        KafkaConfig(config={"bootstrap.servers": "localhost:9092"}, topic="random-topic")
+    )
+    event = request.getfixturevalue(event_fixture)
+
+    assert transport._get_message_key(json.loads(Serde.to_json(event))) == transport._get_message_key(event)  # noqa: SLF001
+
+
+def test_kafka_message_key_uses_overridden_parent_facet_args(
+    run_event_with_parent_v2: event_v2.RunEvent, mocker: MockerFixture
+) -> None:
+    mocker.patch("confluent_kafka.Producer")
+
+    class ParentJobTransport(KafkaTransport):
+        def _get_run_message_key_args_from_parent_run_facet_v2(
+            self, parent_run_facet: parent_run.ParentRunFacet
+        ) -> tuple[str, str]:
+            return "custom-namespace", parent_run_facet.job.name
+
+    transport = ParentJobTransport(
+        KafkaConfig(config={"bootstrap.servers": "localhost:9092"}, topic="random-topic")
+    )
+    parent_job_name = run_event_with_parent_v2.run.facets["parent"].job.name
+
+    assert transport._get_message_key(run_event_with_parent_v2) == f"run:custom-namespace/{parent_job_name}"  # noqa: SLF001
+
+
+def test_kafka_loads_flush_policy() -> None:
+    params = {
+        "type": "kafka",
+        "config": {"bootstrap.servers": "localhost:9092"},
+        "topic": "random-topic",
+        "flush": False,
+        "flush_every": 100,
+        "flush_interval_ms": 500,
+    }
+    config = KafkaConfig.from_dict(params)
+
+    assert config.flush is False
+    assert config.flush_every == params["flush_every"]
+    assert config.flush_interval_ms == params["flush_interval_ms"]
+    assert config.flush_timeout == attr.fields(KafkaConfig).flush_timeout.default
+
+
+def test_kafka_transport_flushes_every_n_messages(run_event: RunEvent, mocker: MockerFixture) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    transport = KafkaTransport(
+        KafkaConfig(
+            config={"bootstrap.servers": "localhost:9092"}, topic="random-topic", flush=False, flush_every=2
+        )
+    )
+    transport.producer.flush.return_value = 0
+
+    for _ in range(5):
+        transport.emit(run_event)
+
+    # flushed after every 2nd message, polled after the others
+    calls = [name for name, _, _ in transport.producer.method_calls if name in ("flush", "poll")]
+    assert calls == ["poll", "flush", "poll", "flush", "poll"]
+
+
+def test_kafka_transport_does_not_wait_for_broker_before_fork(
+    run_event: RunEvent, mocker: MockerFixture
+) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    transport = KafkaTransport(
+        KafkaConfig(config={"bootstrap.servers": "localhost:9092"}, topic="random-topic", flush=False)
+    )
+    transport.emit(run_event)
+    transport.producer.flush.return_value = 1
+
+    kafka._serve_delivery_reports_before_fork()  # noqa: SLF001
+    transport.producer.flush.assert_called_once_with(timeout=0)
+
+
+def test_kafka_transport_flushes_on_interval(run_event: RunEvent, mocker: MockerFixture) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    transport = KafkaTransport(
+        KafkaConfig(
+            config={"bootstrap.servers": "localhost:9092"},
+            topic="random-topic",
+            flush=False,
+            flush_interval_ms=0,
+        )
+    )
+    transport.producer.flush.return_value = 0
+
+    transport.emit(run_event)
+    transport.producer.flush.assert_called_once()
+
+
+def test_kafka_transport_without_flush_policy_flushes_on_close(
+    run_event: RunEvent, mocker: MockerFixture
+) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    transport = KafkaTransport(
+        KafkaConfig(config={"bootstrap.servers": "localhost:9092"}, topic="random-topic", flush=False)
+    )
+    transport.producer.flush.return_value = 0
+    client = OpenLineageClient(transport=transport)
+
+    for _ in range(3):
+        client.emit(run_event)
+    transport.producer.flush.assert_not_called()
+
+    assert client.close(timeout=1)
+    transport.producer.flush.assert_called_once_with(timeout=ANY)
+
+
+def test_kafka_transport_wait_for_completion_reports_undelivered(mocker: MockerFixture) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    transport = KafkaTransport(
+        KafkaConfig(config={"bootstrap.servers": "localhost:9092"}, topic="random-topic")
+    )
+    transport.producer.flush.return_value = 3
+
+    assert not transport.wait_for_completion(timeout=0.1)
+
+
+def test_kafka_transport_counts_delivery_reports(run_event: RunEvent, mocker: MockerFixture) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    transport = KafkaTransport(
+        KafkaConfig(config={"bootstrap.servers": "localhost:9092"}, topic="random-topic", flush=False)
+    )
+    transport.emit(run_event)
+    on_delivery = transport.producer.produce.call_args.kwargs["on_delivery"]
+
+    on_delivery(None, mocker.Mock())
+    on_delivery(None, mocker.Mock())
+    on_delivery(mocker.Mock(), mocker.Mock())
+
+    assert (transport.delivered, transport.delivery_failed) == (2, 1)
+
+
+@pytest.fixture()
+def wide_schema_event() -> event_v2.RunEvent:
+    fields = [schema_dataset.SchemaDatasetFacetFields(name=str(generate_new_uuid())) for _ in range(200)]
+    return event_v2.RunEvent(
+        eventType=event_v2.RunState.COMPLETE,
+        eventTime="2024-04-10T15:08:01.333999",
+        run=event_v2.Run(runId="ea445b5c-22eb-457a-8007-01c7c52b6e54"),
+        job=event_v2.Job(namespace="test-namespace", name="test-job"),
+        outputs=[
+            event_v2.OutputDataset(
+                namespace="test-namespace",
+                name="wide-table",
+                facets={"schema": schema_dataset.SchemaDatasetFacet(fields=fields)},
+            )
+        ],
+        producer="prod",
+    )
+
+
+def oversize_transport(max_message_bytes: int, **config) -> KafkaTransport:
+    return KafkaTransport(
+        KafkaConfig(
+            config={"bootstrap.servers": "localhost:9092"},
+            topic="random-topic",
+            max_message_bytes=max_message_bytes,
+            **config,
+        )
+    )
+
+
+def test_kafka_loads_oversize_config() -> None:
+    config = KafkaConfig.from_dict(
+        {
+            "type": "kafka",
+            "config": {"bootstrap.servers": "localhost:9092", "message.max.bytes": 2000000},
+            "topic": "random-topic",
+            "oversize_policy": "drop_facets",
+            "heavy_facets": ["schema"],
+        },
+    )
+    assert config.oversize_policy == [OversizePolicy.DROP_FACETS]
+    assert config.heavy_facets == ["schema"]
+    assert config.max_message_bytes is None
+
+
+def test_kafka_max_message_bytes_defaults_to_producer_config(mocker: MockerFixture) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    max_message_bytes = 2000
+    transport = KafkaTransport(
+        KafkaConfig(
+            config={"bootstrap.servers": "localhost:9092", "message.max.bytes": str(max_message_bytes)},
+            topic="t",
+        )
+    )
+    assert transport.max_message_bytes == max_message_bytes
+
+
+def test_kafka_compresses_oversize_event(wide_schema_event: event_v2.RunEvent, mocker: MockerFixture) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    payload = Serde.to_json_bytes(wide_schema_event)
+    transport = oversize_transport(len(payload) - 1, oversize_policy=["compress"])
+
+    transport.emit(wide_schema_event)
+
+    kwargs = transport.producer.produce.call_args.kwargs
+    assert kwargs["headers"] == [("content-encoding", b"gzip")]
+    assert gzip.decompress(kwargs["value"]) == payload
+    assert transport.oversize_compressed == 1
+
+
+def test_kafka_drops_heavy_facets_of_oversize_event(
+    wide_schema_event: event_v2.RunEvent, mocker: MockerFixture
+) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    transport = oversize_transport(1000, oversize_policy=["compress", "drop_facets"])
+
+    transport.emit(wide_schema_event)
+
+    kwargs = transport.producer.produce.call_args.kwargs
+    sent = json.loads(kwargs["value"])
+    assert sent["outputs"][0]["name"] == "wide-table"
+    assert "schema" not in sent["outputs"][0].get("facets", {})
+    assert kwargs["headers"] is None
+    assert transport.oversize_degraded == 1
+
+
+def test_kafka_routes_oversize_event(wide_schema_event: event_v2.RunEvent, mocker: MockerFixture) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    transport = oversize_transport(
+        100, oversize_policy=["route"], oversize_transport={"type": "tests.transport.AccumulatingTransport"}
+    )
+
+    events = [wide_schema_event, wide_schema_event]
+    for event in events:
+        transport.emit(event)
+
+    transport.producer.produce.assert_not_called()
+    assert transport.oversize_transport.events == events
+    assert transport.oversize_routed == len(events)
+
+
+def test_kafka_produces_oversize_event_when_policies_fail(
+    wide_schema_event: event_v2.RunEvent, mocker: MockerFixture
+) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    transport = oversize_transport(100, oversize_policy=["compress", "drop_facets"])
+
+    transport.emit(wide_schema_event)
+
+    assert transport.producer.produce.call_args.kwargs["value"] == Serde.to_json_bytes(wide_schema_event)
+    assert transport.oversize_rejected == 1
+
+
+def test_kafka_does_not_touch_event_within_limit(run_event: RunEvent, mocker: MockerFixture) -> None:
+    mocker.patch("confluent_kafka.Producer")
+    transport = oversize_transport(1000000, oversize_policy=["compress"])
+
+    transport.emit(run_event)
+
+    assert "headers" not in transport.producer.produce.call_args.kwargs
+    assert transport.oversize_compressed == 0
@@ -0,0 +1,189 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import logging
+import socket
+from typing import TYPE_CHECKING
+
+import pytest
+from openlineage.client import OpenLineageClient
+from openlineage.client.event_v2 import Job, Run, RunEvent, RunState
+from openlineage.client.metrics import (
+    CallbackExporter,
+    LoggingExporter,
+    Metric,
+    MetricsConfig,
+    MetricsRegistry,
+    MetricType,
+    PrometheusFileExporter,
+    StatsdExporter,
+    counter,
+    create_exporter,
+    gauge,
+    get_metrics_registry,
+)
+from openlineage.client.uuid import generate_new_uuid
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def make_event(name: str = "job") -> RunEvent:
+    return RunEvent(
+        eventType=RunState.START,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId=str(generate_new_uuid())),
+        job=Job(namespace="default", name=name),
+    )
+
+
+def by_name(metrics: list[Metric]) -> dict[tuple[str, tuple[tuple[str, str], ...]], Metric]:
+    return {(metric.name, metric.tags): metric for metric in metrics}
+
+
+class QueueSource:
+    def __init__(self, depth: int) -> None:
+        self.depth = depth
+
+    def collect_metrics(self) -> list[Metric]:
+        return [gauge("queue_depth", self.depth), counter("dropped", 1)]
+
+
+def test_registry_records_counters_gauges_and_histograms() -> None:
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    tags = (("transport", "http"),)
+    increments = (1, 2)
+    for increment in increments:
+        registry.increment("emit.failed", increment, tags=tags)
+    registry.set_gauge("depth", 5)
+    for value in (0.05, 0.5, 0.7, 3):
+        registry.observe("emit.duration", value, tags)
+
+    metrics = by_name(registry.collect())
+    assert metrics[("emit.failed", tags)].value == sum(increments)
+    assert metrics[("depth", ())].type == MetricType.GAUGE
+    histogram = metrics[("emit.duration", tags)]
+    assert (histogram.count, histogram.value) == (4, 4.25)
+    assert histogram.buckets == ((0.1, 1), (1.0, 3), (float("inf"), 4))
+
+
+def test_registry_timer_observes_failed_blocks() -> None:
+    registry = MetricsRegistry()
+    with pytest.raises(ValueError, match="boom"), registry.timer("duration"):
+        raise ValueError("boom")  # noqa: EM101
+    assert by_name(registry.collect())[("duration", ())].count == 1
+
+
+def test_registry_sums_sources_and_forgets_collected_ones() -> None:
+    registry = MetricsRegistry()
+    first, second = QueueSource(2), QueueSource(3)
+    registry.register(first)
+    registry.register(second)
+    metrics = by_name(registry.collect())
+    assert metrics[("queue_depth", ())].value == first.depth + second.depth
+    assert metrics[("dropped", ())].value == len([first, second])
+
+    del second
+    assert by_name(registry.collect())[("queue_depth", ())].value == first.depth
+
+
+def test_callback_exporter_from_config() -> None:
+    exported: list[list[Metric]] = []
+    registry = MetricsRegistry()
+    registry.configure(
+        MetricsConfig(exporters=[{"type": "callback", "callback": exported.append}], interval=60)
+    )
+    registry.increment("events.filtered")
+    registry.export()
+    assert [metric.name for metric in exported[0]] == ["events.filtered"]
+    registry.close()
+
+
+def test_create_exporter_rejects_unknown_type() -> None:
+    with pytest.raises(ValueError, match="Unsupported OpenLineage metrics exporter type: `graphite`"):
+        create_exporter({"type": "graphite"})
+
+
+def test_logging_exporter(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.INFO, logger="openlineage.client.metrics"):
+        LoggingExporter().export([counter("emit.failed", 2, (("transport", "http"),))])
+    assert "emit.failed{transport=http} 2" in caplog.text
+
+
+def test_statsd_exporter_sends_counter_increments() -> None:
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(5)
+    exporter = StatsdExporter(port=receiver.getsockname()[1])
+    tags = (("transport", "http"),)
+
+    exporter.export([counter("emit.failed", 2, tags), gauge("emitter.queue_depth", 7)])
+    assert receiver.recv(65536).decode().splitlines() == [
+        "openlineage.emit.failed.http:2|c",
+        "openlineage.emitter.queue_depth:7|g",
+    ]
+    exporter.dogstatsd = True
+    exporter.export([counter("emit.failed", 5, tags)])
+    assert receiver.recv(65536).decode() == "openlineage.emit.failed:3|c|#transport:http"
+    exporter.close()
+    receiver.close()
+
+
+def test_prometheus_file_exporter(tmp_path: Path) -> None:
+    registry = MetricsRegistry(buckets=(0.1,))
+    registry.increment("emit.failed", tags=(("transport", "http"),))
+    registry.observe("emit.duration", 0.05)
+    path = tmp_path / "openlineage.prom"
+    PrometheusFileExporter(str(path)).export(registry.collect())
+    assert path.read_text().splitlines() == [
+        'openlineage_emit_duration_bucket{le="0.1"} 1',
+        'openlineage_emit_duration_bucket{le="+Inf"} 1',
+        "openlineage_emit_duration_sum 0.05",
+        "openlineage_emit_duration_count 1",
+        'openlineage_emit_failed_total{transport="http"} 1',
+    ]
+
+
+def test_prometheus_file_exporter_escapes_label_values(tmp_path: Path) -> None:
+    registry = MetricsRegistry()
+    registry.increment("emit.failed", tags=(("transport", 'C:\\"http"\nbackend'),))
+    path = tmp_path / "openlineage.prom"
+    PrometheusFileExporter(str(path)).export(registry.collect())
+    assert path.read_text().splitlines() == [
+        'openlineage_emit_failed_total{transport="C:\\\\\\"http\\"\\nbackend"} 1',
+    ]
+
+
+def test_client_records_emit_metrics() -> None:
+    client = OpenLineageClient(
+        config={
+            "transport": {"type": "tests.transport.AccumulatingTransport"},
+            "filters": [{"type": "exact", "match": "filtered"}],
+        }
+    )
+    tags = (("transport", "accumulating"),)
+    before = by_name(get_metrics_registry().collect())
+    client.emit(make_event())
+    client.emit(make_event("filtered"))
+    after = by_name(get_metrics_registry().collect())
+
+    duration_before = before.get(("emit.duration", tags))
+    assert after[("emit.duration", tags)].count == (duration_before.count if duration_before else 0) + 1
+    filtered_before = before.get(("events.filtered", ()))
+    assert after[("events.filtered", ())].value == (filtered_before.value if filtered_before else 0) + 1
+
+
+def test_client_collects_async_emitter_metrics() -> None:
+    exported: list[list[Metric]] = []
+    client = OpenLineageClient(
+        config={
+            "transport": {"type": "tests.transport.AccumulatingTransport"},
+            "emitter": {"type": "async"},
+        }
+    )
+    client.emit(make_event())
+    assert client.flush(timeout=5)
+    CallbackExporter(exported.append).export(get_metrics_registry().collect())
+    assert by_name(exported[0])[("emitter.emitted", ())].value >= 1
+    client.close(timeout=5)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import datetime
 import os
+import threading
+import time
 from typing import TYPE_CHECKING
 from unittest import mock
 
@@ -14,6 +16,8 @@ from openlineage.client.transport.msk_iam import (
     MSKIAMTransport,
     _detect_running_region,
     _oauth_cb,
+    _token_cache,
+    _TokenCache,
 )
 from openlineage.client.uuid import generate_new_uuid
 
@@ -21,6 +25,12 @@ if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    yield
+    _token_cache.clear()
+
+
 @pytest.fixture()
 def event() -> RunEvent:
     return RunEvent(
@@ -199,3 +209,125 @@ def test_setup_producer_configuration(
     del actual_kafka_config["oauth_cb"]
     assert actual_kafka_config == expected_kafka_config
     assert actual_oauth_cb(msk_token_mocker) == ("token", 1000)
+
+
+class StubTokenGenerator:
+    def __init__(self, lifetime: float, fail: bool = False) -> None:
+        self.lifetime = lifetime
+        self.fail = fail
+        self.calls = 0
+        self.called = threading.Event()
+
+    def __call__(self, config: MSKIAMConfig) -> tuple[str, float]:
+        self.calls += 1
+        self.called.set()
+        if self.fail:
+            msg = "STS unavailable"
+            raise RuntimeError(msg)
+        return f"token-{config.region}-{self.calls}", time.time() + self.lifetime
+
+
+def msk_config(**kwargs) -> MSKIAMConfig:
+    return MSKIAMConfig(config={"bootstrap.servers": "localhost:9092"}, topic="random-topic", **kwargs)
+
+
+def test_msk_token_cache_reuses_token_per_credentials() -> None:
+    generate = StubTokenGenerator(lifetime=900)
+    cache = _TokenCache(generate=generate)
+
+    assert cache.get(msk_config(region="us-east-1"))[0] == "token-us-east-1-1"
+    assert cache.get(msk_config(region="us-east-1"))[0] == "token-us-east-1-1"
+    assert cache.get(msk_config(region="us-east-1", aws_profile="other"))[0] == "token-us-east-1-2"
+    assert cache.get(msk_config(region="eu-west-1"))[0] == "token-eu-west-1-3"
+    credentials_count = 3
+    assert generate.calls == credentials_count
+
+
+def test_msk_token_cache_regenerates_expired_token() -> None:
+    generate = StubTokenGenerator(lifetime=-1)
+    cache = _TokenCache(generate=generate)
+    config = msk_config(region="us-east-1")
+
+    cache.get(config)
+    cache.get(config)
+    assert generate.calls == len(["first lookup", "second lookup"])
+
+
+def test_msk_token_cache_refreshes_ahead_of_expiry() -> None:
+    generate = StubTokenGenerator(lifetime=30)
+    cache = _TokenCache(generate=generate, refresh_ahead=60)
+    config = msk_config(region="us-east-1")
+
+    assert cache.get(config)[0] == "token-us-east-1-1"
+    generate.lifetime = 900
+    generate.called.clear()
+    # token expires within refresh window: cached one is returned and refreshed in background
+    assert cache.get(config)[0] == "token-us-east-1-1"
+    assert generate.called.wait(5)
+    deadline = time.monotonic() + 5
+    while cache.get(config)[0] == "token-us-east-1-1" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.get(config)[0] == "token-us-east-1-2"
+    assert generate.calls == len(["initial", "refresh"])
+
+
+def test_msk_token_cache_does_not_schedule_refresh_while_one_is_running() -> None:
+    generate = StubTokenGenerator(lifetime=30)
+    cache = _TokenCache(generate=generate, refresh_ahead=60)
+    config = msk_config(region="us-east-1")
+    cache.get(config)
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_generate(config: MSKIAMConfig) -> tuple[str, float]:
+        started.set()
+        release.wait(5)
+        return generate(config)
+
+    generate.lifetime = 900
+    cache.generate = slow_generate
+    cache.get(config)
+    assert started.wait(5)
+    # refresh thread is still generating new token, lookups return cached one without scheduling another
+    for _ in range(3):
+        assert cache.get(config)[0] == "token-us-east-1-1"
+    release.set()
+    deadline = time.monotonic() + 5
+    while cache.get(config)[0] == "token-us-east-1-1" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.get(config)[0] == "token-us-east-1-2"
+    assert generate.calls == len(["initial", "refresh"])
+
+
+def test_msk_token_cache_recreates_key_locks_after_fork(mocker: MockerFixture) -> None:
+    generate = StubTokenGenerator(lifetime=-1)
+    cache = _TokenCache(generate=generate)
+    config = msk_config(region="us-east-1")
+    cache.get(config)
+
+    # lock held by parent process thread generating token at fork
+    cache._key_locks[cache._key(config)].acquire()  # noqa: SLF001
+    mocker.patch("os.getpid", return_value=os.getpid() + 1)
+    assert cache.get(config)[0] == "token-us-east-1-2"
+
+
+def test_msk_token_cache_keeps_token_when_refresh_fails() -> None:
+    generate = StubTokenGenerator(lifetime=30)
+    cache = _TokenCache(generate=generate, refresh_ahead=60)
+    config = msk_config(region="us-east-1")
+    cache.get(config)
+
+    generate.fail = True
+    generate.called.clear()
+    assert cache.get(config)[0] == "token-us-east-1-1"
+    assert generate.called.wait(5)
+    assert cache.get(config)[0] == "token-us-east-1-1"
+
+
+def test_msk_oauth_cb_uses_shared_cache(mocker: MockerFixture) -> None:
+    generate = StubTokenGenerator(lifetime=900)
+    mocker.patch.object(_token_cache, "generate", generate)
+
+    assert _oauth_cb(msk_config(region="us-east-1"), None) == _oauth_cb(msk_config(region="us-east-1"), None)
+    assert generate.calls == 1
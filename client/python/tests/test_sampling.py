@@ -0,0 +1,80 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from openlineage.client import OpenLineageClient
+from openlineage.client.event_v2 import Job, Run, RunEvent, RunState
+from openlineage.client.sampling import SamplingConfig, SamplingPolicy
+from openlineage.client.uuid import generate_new_uuid
+
+
+def make_event(event_type: RunState = RunState.RUNNING, name: str = "job") -> RunEvent:
+    return RunEvent(
+        eventType=event_type,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId=str(generate_new_uuid())),
+        job=Job(namespace="default", name=name),
+    )
+
+
+def test_sampling_config_from_dict_with_job_overrides() -> None:
+    params = {"running_sample_rate": 0.5, "rate_limit": 2, "jobs": {"sensor": {"rate_limit": 0.1}}}
+    config = SamplingConfig.from_dict(params)
+    assert config.rate_limit == params["rate_limit"]
+    assert config.jobs["sensor"].rate_limit == params["jobs"]["sensor"]["rate_limit"]
+    # job overrides inherit options they don't set
+    assert config.jobs["sensor"].running_sample_rate == params["running_sample_rate"]
+
+
+def test_sampling_policy_disabled_by_default() -> None:
+    policy = SamplingPolicy()
+    assert not policy
+    assert policy.keep(make_event())
+
+
+def test_sampling_policy_samples_only_running_events() -> None:
+    policy = SamplingPolicy(SamplingConfig(running_sample_rate=0.0))
+    for event_type in (RunState.START, RunState.COMPLETE, RunState.FAIL, RunState.ABORT):
+        assert policy.keep(make_event(event_type))
+    assert not policy.keep(make_event())
+    assert (policy.sampled_out, policy.dropped) == (1, 1)
+
+
+def test_sampling_policy_samples_with_probability() -> None:
+    policy = SamplingPolicy(SamplingConfig(running_sample_rate=0.3))
+    with patch("random.random", side_effect=[0.1, 0.5, 0.29, 0.3]):
+        assert [policy.keep(make_event()) for _ in range(4)] == [True, False, True, False]
+
+
+def test_sampling_policy_rate_limits_per_job() -> None:
+    policy = SamplingPolicy(SamplingConfig(rate_limit=1, burst=2))
+    with patch("time.monotonic", return_value=100.0) as monotonic:
+        assert [policy.keep(make_event()) for _ in range(3)] == [True, True, False]
+        assert policy.keep(make_event(name="other"))
+        assert policy.keep(make_event(RunState.COMPLETE))
+        monotonic.return_value = 101.0
+        assert [policy.keep(make_event()) for _ in range(2)] == [True, False]
+    assert policy.rate_limited == len(["third in burst", "second after refill"])
+
+
+def test_sampling_policy_job_overrides() -> None:
+    policy = SamplingPolicy(SamplingConfig.from_dict({"jobs": {"sensor": {"running_sample_rate": 0}}}))
+    assert policy
+    assert not policy.keep(make_event(name="sensor"))
+    assert policy.keep(make_event(name="job"))
+
+
+def test_client_applies_sampling() -> None:
+    client = OpenLineageClient(
+        config={
+            "transport": {"type": "tests.transport.AccumulatingTransport"},
+            "sampling": {"running_sample_rate": 0},
+        }
+    )
+    events = [make_event(RunState.START), make_event(), make_event(RunState.COMPLETE)]
+    for event in events:
+        client.emit(event)
+    assert client.transport.events == [events[0], events[2]]
+    assert client.sampling.sampled_out == 1
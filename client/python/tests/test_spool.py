@@ -0,0 +1,285 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from openlineage.client import OpenLineageClient
+from openlineage.client.event_v2 import Job, JobEvent, Run, RunEvent, RunState
+from openlineage.client.facet_v2 import parent_run
+from openlineage.client.serde import Serde
+from openlineage.client.transport import Config, Transport, get_default_factory
+from openlineage.client.transport.kafka import get_message_key
+from openlineage.client.transport.spool import FsyncPolicy, SpoolConfig, SpoolTransport
+from openlineage.client.uuid import generate_new_uuid
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def make_event(name: str = "job") -> RunEvent:
+    return RunEvent(
+        eventType=RunState.START,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId=str(generate_new_uuid())),
+        job=Job(namespace="default", name=name),
+    )
+
+
+class FlakyTransport(Transport):
+    """Fails `failures` times, then records serialized payloads."""
+
+    kind = "flaky"
+    failures = 0
+
+    def __init__(self, config: Config) -> None:  # noqa: ARG002
+        self.payloads: list[bytes] = []
+        self.events: list[Any] = []
+
+    def emit(self, event: Any) -> None:
+        self.emit_serialized(Serde.to_json_bytes(event), event)
+
+    def emit_serialized(self, payload: bytes, event: Any) -> None:
+        if FlakyTransport.failures:
+            FlakyTransport.failures -= 1
+            msg = "backend unavailable"
+            raise RuntimeError(msg)
+        self.payloads.append(payload)
+        self.events.append(event)
+
+
+@pytest.fixture(autouse=True)
+def reset_failures():
+    yield
+    FlakyTransport.failures = 0
+
+
+def spool_transport(directory: Path, **config: Any) -> SpoolTransport:
+    return SpoolTransport(
+        SpoolConfig(
+            directory=str(directory),
+            **{
+                "transport": {"type": "tests.test_spool.FlakyTransport"},
+                "backoff": 0.01,
+                "poll_interval": 0.05,
+                **config,
+            },
+        )
+    )
+
+
+def segment_files(directory: Path) -> list[str]:
+    return sorted(name for name in os.listdir(directory) if name.endswith((".open", ".log")))
+
+
+def test_spool_config_from_dict() -> None:
+    params = {"directory": "spool", "transport": {"type": "console"}, "fsync": "always", "max_attempts": 3}
+    config = SpoolConfig.from_dict(params)
+    assert config.fsync is FsyncPolicy.ALWAYS
+    assert config.max_attempts == params["max_attempts"]
+    assert config.segment_max_bytes == 16 * 1024 * 1024
+
+
+def test_spool_config_requires_directory_and_transport() -> None:
+    with pytest.raises(RuntimeError, match="directory"):
+        SpoolConfig.from_dict({"transport": {"type": "console"}})
+    with pytest.raises(RuntimeError, match="transport"):
+        SpoolConfig.from_dict({"directory": "spool"})
+
+
+def test_spool_transport_from_client_config(tmp_path: Path) -> None:
+    transport = get_default_factory().create(
+        {"type": "spool", "directory": str(tmp_path), "transport": {"type": "console"}}
+    )
+    assert isinstance(transport, SpoolTransport)
+    assert transport.transport.kind == "console"
+    assert transport.close(timeout=5)
+
+
+def test_spool_forwards_serialized_events(tmp_path: Path) -> None:
+    transport = spool_transport(tmp_path)
+    client = OpenLineageClient(transport=transport)
+    events = [make_event(str(i)) for i in range(10)]
+    for event in events:
+        client.emit(event)
+
+    assert transport.wait_for_completion(timeout=5)
+    assert transport.transport.payloads == [Serde.to_json_bytes(event) for event in events]
+    assert [event.job.name for event in transport.transport.events] == [str(i) for i in range(10)]
+    assert (transport.spooled, transport.forwarded) == (10, 10)
+    assert transport.close(timeout=5)
+    assert segment_files(tmp_path) == []
+
+
+def test_spool_retries_with_backoff(tmp_path: Path) -> None:
+    failures = FlakyTransport.failures = 2
+    transport = spool_transport(tmp_path)
+    transport.emit(make_event())
+
+    assert transport.wait_for_completion(timeout=5)
+    assert transport.failed_attempts == failures
+    assert transport.forwarded == 1
+    transport.close(timeout=5)
+
+
+def test_spool_drops_event_after_max_attempts(tmp_path: Path) -> None:
+    FlakyTransport.failures = 2
+    transport = spool_transport(tmp_path, max_attempts=2)
+    transport.emit(make_event("dropped"))
+    transport.emit(make_event("forwarded"))
+
+    assert transport.wait_for_completion(timeout=5)
+    assert [event.job.name for event in transport.transport.events] == ["forwarded"]
+    assert transport.dropped == 1
+    transport.close(timeout=5)
+
+
+def test_spool_forwards_events_left_by_previous_run(tmp_path: Path) -> None:
+    FlakyTransport.failures = 1000
+    transport = spool_transport(tmp_path, backoff=10)
+    for i in range(3):
+        transport.emit(make_event(str(i)))
+    assert not transport.close(timeout=0.1)
+    assert segment_files(tmp_path) != []
+
+    FlakyTransport.failures = 0
+    restarted = spool_transport(tmp_path)
+    assert restarted.wait_for_completion(timeout=5)
+    assert [event.job.name for event in restarted.transport.events] == ["0", "1", "2"]
+    restarted.close(timeout=5)
+    assert segment_files(tmp_path) == []
+
+
+def test_spool_resumes_from_checkpoint(tmp_path: Path) -> None:
+    transport = spool_transport(tmp_path)
+    transport.emit(make_event("forwarded"))
+    assert transport.wait_for_completion(timeout=5)
+    # simulate crash: stop drainer and release its lock without sealing the segment
+    transport._stop.set()  # noqa: SLF001
+    transport._drainer.join(5)  # noqa: SLF001
+    os.close(transport._lock_fd)  # noqa: SLF001
+    transport.emit(make_event("spooled"))
+    os.close(transport._segment_fd)  # noqa: SLF001
+    # segment of this process would otherwise be treated as still open
+    segment = tmp_path / transport._segment_name  # noqa: SLF001
+    os.rename(f"{segment}.open", f"{segment}.log")
+
+    restarted = spool_transport(tmp_path)
+    assert restarted.wait_for_completion(timeout=5)
+    assert [event.job.name for event in restarted.transport.events] == ["spooled"]
+    restarted.close(timeout=5)
+
+
+def test_spool_rotates_segments(tmp_path: Path) -> None:
+    FlakyTransport.failures = 1000
+    size = len(Serde.to_json_bytes(make_event())) + 1
+    transport = spool_transport(tmp_path, segment_max_bytes=2 * size, backoff=10)
+    for _ in range(5):
+        transport.emit(make_event())
+
+    files = segment_files(tmp_path)
+    assert [name.endswith(".log") for name in files] == [True, True, False]
+    transport.close(timeout=0.1)
+
+
+def test_spool_drops_events_when_full(tmp_path: Path) -> None:
+    FlakyTransport.failures = 1000
+    size = len(Serde.to_json_bytes(make_event())) + 1
+    transport = spool_transport(tmp_path, max_bytes=2 * size, backoff=10)
+    for _ in range(3):
+        transport.emit(make_event())
+
+    assert (transport.spooled, transport.dropped) == (2, 1)
+    transport.close(timeout=0.1)
+
+
+class RecordingTransport(Transport):
+    """Implements only `emit`, as most custom transports do."""
+
+    kind = "recording"
+
+    def __init__(self, config: Config) -> None:  # noqa: ARG002
+        self.events: list[Any] = []
+
+    def emit(self, event: Any) -> None:
+        self.events.append(event)
+
+
+def test_spool_forwards_typed_events_to_transport_without_emit_serialized(tmp_path: Path) -> None:
+    transport = spool_transport(tmp_path, transport={"type": "tests.test_spool.RecordingTransport"})
+    event = make_event()
+    event.run.facets = {
+        "parent": parent_run.ParentRunFacet(
+            run=parent_run.Run(runId=str(generate_new_uuid())),
+            job=parent_run.Job(namespace="default", name="parent"),
+        )
+    }
+    transport.emit(event)
+    transport.emit(JobEvent(eventTime="2024-01-01T00:00:00Z", job=Job(namespace="default", name="job")))
+
+    assert transport.wait_for_completion(timeout=5)
+    run_event, job_event = transport.transport.events
+    assert isinstance(run_event, RunEvent)
+    assert run_event.eventType is RunState.START
+    assert Serde.to_json_bytes(run_event) == Serde.to_json_bytes(event)
+    # transports read parent facet, e.g. for Kafka message key
+    assert isinstance(run_event.run.facets["parent"], parent_run.ParentRunFacet)
+    assert get_message_key(run_event) == "run:default/parent"
+    assert isinstance(job_event, JobEvent)
+    assert transport.close(timeout=5)
+
+
+def test_spool_drops_invalid_events(tmp_path: Path) -> None:
+    transport = spool_transport(tmp_path)
+    transport.emit_serialized(b'{"eventTime": "2024-01-01T00:00:00Z"}', make_event())
+    transport.emit(make_event("valid"))
+
+    assert transport.wait_for_completion(timeout=5)
+    assert [event.job.name for event in transport.transport.events] == ["valid"]
+    assert transport.dropped == 1
+    assert transport.close(timeout=5)
+
+
+class PoisonedTransport(RecordingTransport):
+    kind = "poisoned"
+
+    def emit(self, event: Any) -> None:
+        if event.job.name == "poison":
+            event.job.facets.get("missing").name  # noqa: B018
+        super().emit(event)
+
+
+def test_spool_drops_events_wrapped_transport_cannot_emit(tmp_path: Path) -> None:
+    transport = spool_transport(tmp_path, transport={"type": "tests.test_spool.PoisonedTransport"})
+    transport.emit(make_event("poison"))
+    transport.emit(make_event("valid"))
+
+    assert transport.wait_for_completion(timeout=5)
+    assert [event.job.name for event in transport.transport.events] == ["valid"]
+    assert (transport.dropped, transport.failed_attempts) == (1, 1)
+    assert transport.close(timeout=5)
+
+
+def test_spool_close_without_timeout_is_bounded(tmp_path: Path) -> None:
+    FlakyTransport.failures = 1000
+    transport = spool_transport(tmp_path, backoff=10, close_timeout=0.1)
+    transport.emit(make_event())
+
+    start = time.monotonic()
+    assert not transport.close()
+    assert time.monotonic() - start < transport.config.backoff
+    assert [name.endswith(".log") for name in segment_files(tmp_path)] == [True]
+
+
+def test_spool_checkpoint_fsync_follows_interval_policy(tmp_path: Path) -> None:
+    transport = spool_transport(tmp_path, fsync_interval=60)
+    with patch("os.fsync") as fsync:
+        for i in range(5):
+            transport.emit(make_event(str(i)))
+        assert transport.wait_for_completion(timeout=5)
+    fsync.assert_not_called()
+    transport.close(timeout=5)
@@ -0,0 +1,193 @@
+# Copyright 2018-2025 contributors to the OpenLineage project
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+from openlineage.client import OpenLineageClient
+from openlineage.client.event_v2 import Job, Run, RunEvent, RunState
+from openlineage.client.serde import Serde
+from openlineage.client.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    Span,
+    SpanProcessor,
+    Tracer,
+    TracingConfig,
+    current_span,
+    get_tracer,
+)
+from openlineage.client.transport.composite import CompositeConfig, CompositeTransport
+from openlineage.client.uuid import generate_new_uuid
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def make_event(name: str = "job") -> RunEvent:
+    return RunEvent(
+        eventType=RunState.START,
+        eventTime="2024-01-01T00:00:00Z",
+        run=Run(runId=str(generate_new_uuid())),
+        job=Job(namespace="default", name=name),
+    )
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    get_tracer().add_processor(exporter)
+    yield exporter
+    get_tracer().configure(TracingConfig())
+
+
+def test_tracer_without_processors_yields_no_span() -> None:
+    with Tracer().span("stage") as span:
+        assert span is None
+        assert current_span() is None
+
+
+def test_nested_spans_share_trace() -> None:
+    tracer = Tracer()
+    exporter = InMemorySpanExporter()
+    tracer.add_processor(exporter)
+    with tracer.span("outer", job="job") as outer:
+        with tracer.span("inner") as inner:
+            assert current_span() is inner
+        assert current_span() is outer
+    assert current_span() is None
+
+    inner_span, outer_span = exporter.spans
+    assert (inner_span.name, outer_span.name) == ("inner", "outer")
+    assert inner_span.trace_id == outer_span.trace_id
+    assert inner_span.parent_id == outer_span.span_id
+    assert outer_span.parent_id is None
+    assert outer_span.attributes == {"job": "job"}
+    assert outer_span.duration >= inner_span.duration
+
+
+def test_span_records_error_and_parent_on_other_thread() -> None:
+    tracer = Tracer()
+    exporter = InMemorySpanExporter()
+    tracer.add_processor(exporter)
+
+    with tracer.span("outer") as outer:
+
+        def work() -> None:
+            with pytest.raises(ValueError, match="boom"), tracer.span("worker", parent=outer):
+                raise ValueError("boom")  # noqa: EM101
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    worker = exporter.spans[0]
+    assert worker.parent_id == outer.span_id
+    assert worker.error == "ValueError('boom')"
+
+
+def test_processor_hooks_and_failures_are_isolated() -> None:
+    calls = []
+
+    class FailingProcessor(SpanProcessor):
+        def on_start(self, span: Span) -> None:
+            calls.append(("start", span.name))
+            msg = "processor failed"
+            raise RuntimeError(msg)
+
+        def on_end(self, span: Span) -> None:
+            calls.append(("end", span.name))
+
+    tracer = Tracer()
+    tracer.add_processor(FailingProcessor())
+    with tracer.span("stage"):
+        pass
+    assert calls == [("start", "stage"), ("end", "stage")]
+
+
+def test_file_span_exporter(tmp_path: Path) -> None:
+    path = tmp_path / "spans.jsonl"
+    tracer = Tracer()
+    tracer.configure(TracingConfig(exporters=[{"type": "file", "path": str(path)}]))
+    assert isinstance(tracer.processors[0], FileSpanExporter)
+    with tracer.span("stage", transport="http"):
+        pass
+    tracer.close()
+
+    span = json.loads(path.read_text())
+    assert span["name"] == "stage"
+    assert span["attributes"] == {"transport": "http"}
+
+
+def test_unsupported_exporter_type() -> None:
+    with pytest.raises(ValueError, match="Unsupported OpenLineage tracing exporter type: `jaeger`"):
+        Tracer().configure(TracingConfig(exporters=[{"type": "jaeger"}]))
+
+
+def test_serde_is_traced(exporter: InMemorySpanExporter) -> None:
+    Serde.to_json_bytes(make_event())
+    assert [span.name for span in exporter.spans] == ["serde.to_json"]
+
+
+def test_client_emit_is_traced(exporter: InMemorySpanExporter) -> None:
+    client = OpenLineageClient(config={"transport": {"type": "tests.transport.AccumulatingTransport"}})
+    client.emit(make_event())
+
+    spans = {span.name: span for span in exporter.spans}
+    assert set(spans) == {"openlineage.emit", "openlineage.prepare_event", "transport.emit"}
+    root = spans["openlineage.emit"]
+    assert spans["openlineage.prepare_event"].parent_id == root.span_id
+    assert spans["transport.emit"].parent_id == root.span_id
+    assert spans["transport.emit"].attributes == {"transport": "accumulating"}
+
+
+def test_async_emitter_continues_trace_of_emitting_thread(exporter: InMemorySpanExporter) -> None:
+    client = OpenLineageClient(
+        config={
+            "transport": {"type": "tests.transport.AccumulatingTransport"},
+            "emitter": {"type": "async"},
+        }
+    )
+    client.emit(make_event())
+    assert client.flush(timeout=5)
+
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["openlineage.emit"]
+    assert spans["emitter.emit"].trace_id == root.trace_id
+    assert spans["emitter.emit"].parent_id == root.span_id
+    assert spans["transport.emit"].parent_id == spans["emitter.emit"].span_id
+    client.close(timeout=5)
+
+
+def test_parallel_composite_continues_trace_of_emitting_thread(exporter: InMemorySpanExporter) -> None:
+    transport = CompositeTransport(
+        CompositeConfig.from_dict(
+            {
+                "transports": [
+                    {"type": "tests.transport.AccumulatingTransport"},
+                    {"type": "tests.transport.AccumulatingTransport"},
+                ],
+                "parallel": True,
+            }
+        )
+    )
+    with get_tracer().span("outer") as outer:
+        transport.emit(make_event())
+
+    composite_spans = [span for span in exporter.spans if span.name == "composite.emit"]
+    assert [span.parent_id for span in composite_spans] == [outer.span_id, outer.span_id]
+    assert {span.trace_id for span in composite_spans} == {outer.trace_id}
+    transport.close(timeout=5)
+
+
+def test_client_configures_tracing() -> None:
+    OpenLineageClient(
+        config={"transport": {"type": "console"}, "tracing": {"exporters": [{"type": "memory"}]}}
+    )
+    try:
+        assert isinstance(get_tracer().processors[0], InMemorySpanExporter)
+    finally:
+        get_tracer().configure(TracingConfig())
@@ -2,8 +2,17 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+from unittest import mock
+
 import pytest
-from openlineage.client.utils import deep_merge_dicts, import_from_string, try_import_from_string
+from openlineage.client import utils
+from openlineage.client.utils import (
+    ExitStage,
+    deep_merge_dicts,
+    import_from_string,
+    register_exit_hook,
+    try_import_from_string,
+)
 
 
 def test_import_from_string():
@@ -63,3 +72,27 @@ def test_deep_merge_dicts_empty_dicts():
     dict2 = {"a": 1}
     expected = {"a": 1}
     assert deep_merge_dicts(dict1, dict2) == expected
+
+
+def test_exit_hooks_run_by_stage_then_registration_order():
+    calls = []
+
+    def hook(name: str):
+        def call() -> None:
+            calls.append(name)
+            if name == "failing":
+                raise RuntimeError(name)
+
+        return call
+
+    with mock.patch.object(utils, "_exit_hooks", []), mock.patch("atexit.register") as atexit_register:
+        # transport modules are imported lazily, after the emitter
+        register_exit_hook(hook("metrics"), ExitStage.METRICS)
+        register_exit_hook(hook("emitter"), ExitStage.EMITTERS)
+        register_exit_hook(hook("retry"), ExitStage.TRANSPORTS)
+        register_exit_hook(hook("failing"), ExitStage.TRANSPORTS)
+        register_exit_hook(hook("batcher"), ExitStage.TRANSPORTS)
+        atexit_register.assert_called_once()
+        utils._run_exit_hooks()  # noqa: SLF001
+
+    assert calls == ["emitter", "retry", "failing", "batcher", "metrics"]
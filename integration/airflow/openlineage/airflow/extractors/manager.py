@@ -6,6 +6,7 @@ from typing import List, Optional, Type
 
 from openlineage.airflow.extractors import BaseExtractor, Extractors, TaskMetadata
 from openlineage.airflow.utils import get_job_name, get_operator_class, get_unknown_source_attribute_run_facet
+from openlineage.client.tracing import span
 
 
 class ExtractorManager:
@@ -37,10 +38,16 @@ class ExtractorManager:
                 extractor.set_context("task_uuid", task_uuid)
             try:
                 self.log.debug(f"Using extractor {extractor.__class__.__name__} {task_info}")
-                if complete:
-                    task_metadata = extractor.extract_on_complete(task_instance)
-                else:
-                    task_metadata = extractor.extract()
+                with span(
+                    "extractor.extract",
+                    extractor=extractor.__class__.__name__,
+                    task_id=task.task_id,
+                    complete=complete,
+                ):
+                    if complete:
+                        task_metadata = extractor.extract_on_complete(task_instance)
+                    else:
+                        task_metadata = extractor.extract()
 
                 self.log.debug(f"Found task metadata for operation {task.task_id}: {task_metadata}")
                 if task_metadata: